@@ -0,0 +1,231 @@
+import hashlib
+import json
+from typing import Any, Callable, Dict, Hashable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from core_logic.extensive_logic import game_from_dict, _postorder
+from core_logic.minmax_logic import dict_to_tree, tree_to_dict
+
+
+Vertex = Hashable
+
+
+def _digest(form: Any) -> str:
+    return hashlib.sha1(json.dumps(form, sort_keys=True, separators=(",", ":")).encode("utf-8")).hexdigest()
+
+
+def _rank(keys: Dict[Vertex, Any]) -> Dict[Vertex, int]:
+    """Replace comparable keys by their rank (equal keys share a rank)."""
+    order = {key: i for i, key in enumerate(sorted(set(keys.values())))}
+    return {v: order[key] for v, key in keys.items()}
+
+
+def _refine(colors: Dict[Vertex, int], signature: Callable[[Vertex, Dict[Vertex, int]], Any]) -> Dict[Vertex, int]:
+    """
+    Colour refinement: split colour classes by each vertex's signature (what
+    it sees of the current colouring) until the partition is stable. Colours
+    are ranks of (old colour, signature), so they do not depend on vertex names.
+    """
+    while True:
+        refined = _rank({v: (colors[v], signature(v, colors)) for v in colors})
+        if len(set(refined.values())) == len(set(colors.values())):
+            return refined
+        colors = refined
+
+
+def _orbit(v: Vertex, generators: List[Dict[Vertex, Vertex]]) -> set:
+    """Orbit of v under the group generated by the given permutations."""
+    orbit, stack = {v}, [v]
+    while stack:
+        u = stack.pop()
+        for g in generators:
+            w = g[u]
+            if w not in orbit:
+                orbit.add(w)
+                stack.append(w)
+    return orbit
+
+
+def _canonical_order(colors: Dict[Vertex, int], signature: Callable[[Vertex, Dict[Vertex, int]], Any],
+                     certificate: Callable[[List[Vertex]], Any],
+                     twin_keys: Callable[[Vertex], Sequence[Any]]) -> Any:
+    """
+    Smallest certificate over the individualization-refinement search tree.
+
+    After refinement, the first non-singleton colour class is split by
+    individualizing each of its vertices in turn. Two kinds of symmetry keep
+    the search small:
+
+    - twins (vertices sharing a twin key) can be swapped by an automorphism,
+      so only one of them is tried (interchangeable rows, isolated variables);
+    - two leaves with the same certificate give an automorphism (leaf order to
+      leaf order). The search then backtracks to their common ancestor, whose
+      remaining branches are skipped if an automorphism fixing the path so far
+      maps them onto a branch already tried (e.g. the n! orderings of a
+      permutation-matrix game collapse to a few leaves).
+    """
+    automorphisms: List[Dict[Vertex, Vertex]] = []
+    leaves: Dict[str, Tuple[Any, List[Vertex], List[Vertex]]] = {}
+
+    def search(colors: Dict[Vertex, int], path: List[Vertex]) -> Optional[int]:
+        """Explore a node; returns the depth to backtrack to, if above this node."""
+        colors = _refine(colors, signature)
+        cells: Dict[int, List[Vertex]] = {}
+        for v, c in colors.items():
+            cells.setdefault(c, []).append(v)
+        if len(cells) == len(colors):
+            order = sorted(colors, key=colors.get)
+            cert = certificate(order)
+            if not leaves:
+                leaves['first'] = leaves['best'] = (cert, order, path)
+                return None
+            for known_cert, known_order, known_path in (leaves['first'], leaves['best']):
+                if cert == known_cert:
+                    automorphisms.append(dict(zip(known_order, order)))
+                    common = 0
+                    while path[common] == known_path[common]:
+                        common += 1
+                    return common
+            if cert < leaves['best'][0]:
+                leaves['best'] = (cert, order, path)
+            return None
+
+        depth = len(path)
+        _, cell = min((c, vs) for c, vs in cells.items() if len(vs) > 1)
+        tried: List[Vertex] = []
+        seen = set()
+        for v in cell:
+            keys = [(i, key) for i, key in enumerate(twin_keys(v))]
+            if any(key in seen for key in keys):
+                continue
+            stabilizer = [g for g in automorphisms if all(g[u] == u for u in path)]
+            if stabilizer and not _orbit(v, stabilizer).isdisjoint(tried):
+                continue
+            seen.update(keys)
+            tried.append(v)
+            individualized = {u: (c, 0 if u == v else 1) for u, c in colors.items()}
+            backtrack = search(_rank(individualized), path + [v])
+            if backtrack is not None and backtrack < depth:
+                return backtrack
+        return None
+
+    search(colors, [])
+    return leaves['best'][0]
+
+
+def canonical_nash(matrix: Any) -> Any:
+    """
+    Canonical form of a normal-form game under renumbering of each player's
+    strategies (row/column permutations for two players; the n-player tensor
+    shape raw_data[s1][s2]...[sn] = payoff vector for more).
+
+    The equilibria of the game are the same up to that renumbering.
+    """
+    payoffs = np.asarray(matrix)
+    shape = payoffs.shape[:-1]
+    cells = [(index, tuple(payoffs[index].tolist())) for index in np.ndindex(*shape)]
+    vertices = [(axis, i) for axis, size in enumerate(shape) for i in range(size)]
+    slices: Dict[Vertex, List[Tuple[Tuple[int, ...], Tuple]]] = {v: [] for v in vertices}
+    for index, payoff in cells:
+        for axis, i in enumerate(index):
+            slices[(axis, i)].append((index, payoff))
+
+    def signature(v: Vertex, colors: Dict[Vertex, int]) -> Any:
+        axis = v[0]
+        return tuple(sorted(
+            (payoff, tuple(colors[(a, j)] for a, j in enumerate(index) if a != axis))
+            for index, payoff in slices[v]))
+
+    def certificate(order: List[Vertex]) -> Any:
+        position = {v: k for k, v in enumerate(order)}
+        permuted = sorted((tuple(position[(a, j)] for a, j in enumerate(index)), payoff) for index, payoff in cells)
+        return [list(shape), [list(payoff) for _, payoff in permuted]]
+
+    def twin_keys(v: Vertex) -> Sequence[Any]:
+        # Identical slices (same payoffs against the same opponent strategies)
+        axis = v[0]
+        return [(axis, tuple(sorted((tuple(j for a, j in enumerate(index) if a != axis), payoff)
+                                    for index, payoff in slices[v])))]
+
+    return _canonical_order({v: v[0] for v in vertices}, signature, certificate, twin_keys)
+
+
+def canonical_csp(raw_data: Dict[str, Any]) -> Any:
+    """
+    Canonical form of a binary "different values" CSP under renaming of its
+    variables: the constraint graph, labelled with each variable's domain and
+    given value, in a canonical vertex order.
+    """
+    variables = list(raw_data['variables'])
+    partial = raw_data.get('partial_assignment') or {}
+    labels = {v: (tuple(sorted(raw_data['domains'][v])), (partial[v],) if v in partial else ())
+              for v in variables}
+    neighbors: Dict[Vertex, set] = {v: set() for v in variables}
+    for v1, v2 in raw_data['constraints']:
+        if v1 != v2:
+            neighbors[v1].add(v2)
+            neighbors[v2].add(v1)
+
+    def signature(v: Vertex, colors: Dict[Vertex, int]) -> Any:
+        return tuple(sorted(colors[u] for u in neighbors[v]))
+
+    def certificate(order: List[Vertex]) -> Any:
+        position = {v: k for k, v in enumerate(order)}
+        edges = sorted({tuple(sorted((position[v], position[u]))) for v in variables for u in neighbors[v]})
+        return [[[list(labels[v][0]), list(labels[v][1])] for v in order], [list(e) for e in edges]]
+
+    def twin_keys(v: Vertex) -> Sequence[Any]:
+        # Non-adjacent twins share their neighbourhood, adjacent ones their closed neighbourhood
+        return [(labels[v], tuple(sorted(neighbors[v]))), (labels[v], tuple(sorted(neighbors[v] | {v})))]
+
+    return _canonical_order(_rank(labels), signature, certificate, twin_keys)
+
+
+def canonical_minmax(raw_data: Dict[str, Any]) -> Any:
+    """
+    Canonical form of a MinMax tree. Child order is kept: alpha-beta's visited
+    leaves depend on it. The nested and compact encodings of the same tree get
+    the same form; procedural trees are identified by their descriptor.
+    """
+    if raw_data.get('format') == 'procedural':
+        return {k: raw_data[k] for k in ('seed', 'depth', 'branching', 'max_leaf_value')}
+    return tree_to_dict(dict_to_tree(raw_data))
+
+
+def canonical_extensive(raw_data: Dict[str, Any]) -> Any:
+    """
+    Canonical form of a perfect-information extensive-form game under
+    reordering of the moves at each node (backward induction does not depend
+    on it). Subgames are hashed bottom-up, so shared subgames cost nothing extra
+    and the form of the root is a single digest.
+    """
+    game = game_from_dict(raw_data)
+    digests: Dict[int, str] = {}
+    for node in _postorder(game):
+        if game.is_terminal(node):
+            digests[node] = _digest(list(game.payoffs[node]))
+        else:
+            digests[node] = _digest([game.players[node], sorted(digests[c] for c in game.children[node])])
+    return [game.num_players, digests[0]]
+
+
+CANONICAL_FORMS: Dict[str, Callable[[Any], Any]] = {
+    'nash': canonical_nash,
+    'csp': canonical_csp,
+    'minmax': canonical_minmax,
+    'extensive': canonical_extensive,
+}
+
+
+def canonical_hash(q_type: str, raw_data: Any) -> Optional[str]:
+    """
+    Hex digest identifying a problem instance up to the renamings its type
+    allows; None for questions without data. Types without a canonical form
+    (e.g. strategy) hash their raw_data as is.
+    """
+    if raw_data is None:
+        return None
+    canonical = CANONICAL_FORMS.get(q_type)
+    form = canonical(raw_data) if canonical else raw_data
+    return _digest([q_type, form])
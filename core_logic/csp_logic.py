@@ -1,4 +1,4 @@
-from typing import Dict, List, Tuple, Optional, Set
+from typing import Dict, List, Tuple, Optional, Set, Any
 from collections import deque
 
 Variable = str
@@ -161,7 +161,63 @@ def backtrack(variables: List[Variable], domains: Dict[Variable, Domain], constr
     return None
 
 
-def ac3(variables: List[Variable], domains: Dict[Variable, Domain], constraints: List[Constraint]) -> Optional[Dict[Variable, Domain]]:
+def search_stats(variables: List[Variable], domains: Dict[Variable, Domain], constraints: List[Constraint],
+                 assignment: Assignment, use_mrv: bool = True, use_fc: bool = True,
+                 max_solutions: Optional[int] = 1, record: bool = False) -> Dict[str, Any]:
+    """
+    Backtracking Search with Effort Counters
+    
+    Explores the search tree exactly like `backtrack` (same variable and value
+    order) but keeps going until `max_solutions` solutions are found (None = all),
+    counting the work a student would trace by hand.
+    
+    Args:
+        variables, domains, constraints, assignment: As for `backtrack`
+        use_mrv, use_fc: Solver configuration, as for `backtrack`
+        max_solutions: Stop after this many solutions (None: enumerate them all)
+        record: Also return every solution found
+    
+    Returns:
+        Dict with 'nodes' (assignments made), 'backtracks' (assignments undone because
+        no solution was found below them), 'solutions' (number found), 'first_solution'
+        (None if unsatisfiable) and, with record=True, 'assignments'.
+    """
+    stats: Dict[str, Any] = {'nodes': 0, 'backtracks': 0, 'solutions': 0, 'first_solution': None}
+    found: List[Assignment] = []
+
+    def search(current_domains: Dict[Variable, Domain], current: Assignment) -> bool:
+        """True once enough solutions were found (stop the whole search)."""
+        if len(current) == len(variables):
+            stats['solutions'] += 1
+            if stats['first_solution'] is None:
+                stats['first_solution'] = dict(current)
+            if record:
+                found.append(dict(current))
+            return max_solutions is not None and stats['solutions'] >= max_solutions
+
+        var = select_unassigned_variable(variables, current, current_domains, use_mrv)
+        for value in current_domains[var]:
+            if not is_consistent(var, value, current, constraints):
+                continue
+            stats['nodes'] += 1
+            new_assignment = current.copy()
+            new_assignment[var] = value
+            new_domains = forward_check(current_domains, var, value, constraints) if use_fc else current_domains
+            solutions_before = stats['solutions']
+            if search(new_domains, new_assignment):
+                return True
+            if stats['solutions'] == solutions_before:
+                stats['backtracks'] += 1
+        return False
+
+    search(domains, dict(assignment))
+    if record:
+        stats['assignments'] = found
+    return stats
+
+
+def ac3(variables: List[Variable], domains: Dict[Variable, Domain], constraints: List[Constraint],
+        arcs: Optional[List[Tuple[Variable, Variable]]] = None) -> Optional[Dict[Variable, Domain]]:
     """
     AC-3 (Arc Consistency Algorithm #3)
     
@@ -172,6 +228,10 @@ def ac3(variables: List[Variable], domains: Dict[Variable, Domain], constraints:
         variables: List of variable names
         domains: Dictionary mapping variables to their domains (list of possible values)
         constraints: List of binary constraints as tuples (v1, v2) representing v1 != v2
+        arcs: Arcs (xi, xj) to start from (default: every constraint, both directions).
+              When `domains` are already arc consistent and only a few constraints or
+              domains changed, passing just the affected arcs restores consistency
+              incrementally instead of re-checking the whole network.
     
     Returns:
         Updated domains dictionary with reduced domains, or None if inconsistency detected
@@ -179,11 +239,12 @@ def ac3(variables: List[Variable], domains: Dict[Variable, Domain], constraints:
     # Create a working copy of domains
     reduced_domains = {v: list(domains[v]) for v in domains}
     
-    # Initialize queue with all arcs (bidirectional)
-    queue: deque[Tuple[Variable, Variable]] = deque()
-    for (v1, v2) in constraints:
-        queue.append((v1, v2))
-        queue.append((v2, v1))
+    # Initialize queue with all arcs (bidirectional), or only the given ones
+    queue: deque[Tuple[Variable, Variable]] = deque(arcs or [])
+    if arcs is None:
+        for (v1, v2) in constraints:
+            queue.append((v1, v2))
+            queue.append((v2, v1))
     
     def revise(xi: Variable, xj: Variable) -> bool:
         """
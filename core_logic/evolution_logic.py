@@ -0,0 +1,199 @@
+from typing import List, Optional, Dict, Any, Tuple, Union
+
+import numpy as np
+
+from core_logic.nash_logic import Matrix, payoff_arrays, is_mixed_nash
+
+
+DYNAMICS = ('replicator', 'best_response')
+
+# Final states are grouped after rounding to this many decimals
+OUTCOME_DECIMALS = 3
+
+# Tolerance (relative to the payoff range) for the Nash / ESS checks of rounded end states
+_CHECK_TOLERANCE = 5e-3
+
+
+def is_symmetric_game(payoff_matrix: Matrix) -> bool:
+    """Square bimatrix with p2 = p1^T: both players are drawn from the same population."""
+    p1, p2 = payoff_arrays(payoff_matrix)
+    return p1.shape[0] == p1.shape[1] and np.array_equal(p2, p1.T)
+
+
+def is_ess(payoffs: np.ndarray, x: np.ndarray, tolerance: float = 1e-6) -> bool:
+    """
+    Whether the mixed strategy x is evolutionarily stable in the symmetric game
+    with row payoffs `payoffs` (a[i, j] = payoff of i against j).
+
+    x must be a symmetric Nash equilibrium; pure strategies then use Maynard
+    Smith's second-order condition against every alternative best reply. For
+    mixed x we use Haigh's criterion: when the best replies to x are exactly
+    its support, x is an ESS iff z.A.z < 0 for every nonzero z on that support
+    with sum(z) = 0. Mixed candidates with extra best replies are reported as
+    not stable.
+    """
+    a = np.asarray(payoffs, dtype=float)
+    x = np.asarray(x, dtype=float)
+    fitness = a @ x
+    best = fitness.max()
+    if best - x @ fitness > tolerance:
+        return False
+    best_replies = np.flatnonzero(fitness >= best - tolerance)
+    support = np.flatnonzero(x > tolerance)
+
+    if support.size == 1:
+        i = support[0]
+        # Every other best reply j must do worse against itself than i does against j
+        return bool(all(a[i, j] > a[j, j] + tolerance for j in best_replies if j != i))
+
+    if not np.array_equal(best_replies, support):
+        return False
+    # Orthonormal basis of {z on the support : sum(z) = 0}
+    k = support.size
+    basis = np.linalg.qr(np.vstack([np.ones(k), np.eye(k)[:-1]]).T)[0][:, 1:]
+    restricted = a[np.ix_(support, support)]
+    form = basis.T @ (restricted + restricted.T) @ basis / 2
+    return bool(np.linalg.eigvalsh(form).max() < -tolerance)
+
+
+def _random_populations(rng: np.random.Generator, count: int, size: int) -> np.ndarray:
+    """`count` points drawn uniformly from the simplex over `size` strategies."""
+    return rng.dirichlet(np.ones(size), count)
+
+
+def _step(populations: np.ndarray, fitness: np.ndarray, dynamics: str,
+          rate: float) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    One update of every population, plus how far each one still is from rest:
+    the largest coordinate change and, for the replicator, the largest
+    per-capita growth rate of a surviving strategy. The growth rate keeps an
+    unstable rest point (e.g. a vertex the trajectory only passes near, where
+    the absolute changes are tiny) from being reported as converged.
+    """
+    if dynamics == 'replicator':
+        average = np.einsum('bi,bi->b', populations, fitness)
+        growth = rate * (fitness - average[:, None])
+        updated = populations + populations * growth
+        drift = np.where(populations > 0, growth, 0.0).max(axis=1)
+    else:
+        best = np.zeros_like(populations)
+        best[np.arange(len(populations)), fitness.argmax(axis=1)] = 1.0
+        updated = populations + rate * (best - populations)
+        drift = np.zeros(len(populations))
+    updated = np.clip(updated, 0.0, None)
+    updated /= updated.sum(axis=1, keepdims=True)
+    return updated, np.maximum(np.abs(updated - populations).max(axis=1), drift)
+
+
+def simulate_dynamics(payoff_matrix: Matrix, populations: int = 256, dynamics: str = 'replicator',
+                      step: float = 0.1, tolerance: float = 1e-8, max_steps: int = 5000,
+                      symmetric: Optional[bool] = None,
+                      initial: Optional[Union[np.ndarray, Tuple[np.ndarray, np.ndarray]]] = None,
+                      seed: Optional[int] = None) -> Dict[str, Any]:
+    """
+    Evolutionary dynamics for a whole batch of initial populations at once.
+
+    Each population is a mixed strategy (a point of the simplex). One NumPy
+    step advances every still-moving population:
+      - 'replicator': x_i += rate * x_i * (f_i - x.f), where rate = step / payoff
+        range keeps the update inside the simplex;
+      - 'best_response': x += step * (BR(x) - x) (fixed-step best-response dynamics).
+    A population is frozen once its largest coordinate change (and, for the
+    replicator, the per-capita growth of every surviving strategy) falls below
+    `tolerance`; the loop stops early once all of them are. Populations that
+    cycle (e.g. rock-paper-scissors) or, under best-response dynamics, hover
+    around a mixed equilibrium are reported as not converged.
+
+    Symmetric games (p2 = p1^T, detected unless `symmetric` is given) use a
+    single population playing against itself; otherwise rows and columns
+    evolve as two populations.
+
+    Args:
+        payoff_matrix: Bimatrix (r x c x 2), as produced by NashGenerator / QuestionParser
+        populations: Number of random initial populations (ignored if `initial` is given)
+        initial: Starting points, (B x n) for symmetric games or a pair ((B x r), (B x c))
+        seed: Seed for the random initial populations
+
+    Returns:
+        Dict with 'symmetric', 'final' (B x n, or 'final_p1'/'final_p2'), 'converged',
+        'steps' (per population) and 'outcomes': the converged end states rounded
+        to OUTCOME_DECIMALS, each with its 'count', 'share' of all populations,
+        'is_nash' and (symmetric games) 'ess', most frequent first.
+    """
+    if dynamics not in DYNAMICS:
+        raise ValueError(f"Unknown dynamics: {dynamics} (expected one of {', '.join(DYNAMICS)})")
+    p1, p2 = payoff_arrays(payoff_matrix)
+    p1, p2 = p1.astype(float), p2.astype(float)
+    if symmetric is None:
+        symmetric = p1.shape[0] == p1.shape[1] and np.array_equal(p2, p1.T)
+    elif symmetric and not (p1.shape[0] == p1.shape[1] and np.array_equal(p2, p1.T)):
+        raise ValueError("Single-population dynamics need a symmetric game (p2 = p1^T)")
+    num_rows, num_cols = p1.shape
+    spread = max(np.ptp(p1), np.ptp(p2)) or 1.0
+    rate = step / spread if dynamics == 'replicator' else step
+
+    rng = np.random.default_rng(seed)
+    if symmetric:
+        x = np.array(initial, dtype=float) if initial is not None else _random_populations(rng, populations, num_rows)
+        y = None
+    elif initial is not None:
+        x, y = (np.array(part, dtype=float) for part in initial)
+    else:
+        x = _random_populations(rng, populations, num_rows)
+        y = _random_populations(rng, populations, num_cols)
+    batch = len(x)
+    steps = np.full(batch, max_steps)
+    converged = np.zeros(batch, dtype=bool)
+    active = np.arange(batch)
+
+    for t in range(1, max_steps + 1):
+        xa = x[active]
+        if symmetric:
+            new_x, change = _step(xa, xa @ p1.T, dynamics, rate)
+        else:
+            ya = y[active]
+            new_x, change = _step(xa, ya @ p1.T, dynamics, rate)
+            new_y, change_y = _step(ya, xa @ p2, dynamics, rate)
+            y[active] = new_y
+            change = np.maximum(change, change_y)
+        x[active] = new_x
+        done = change < tolerance
+        steps[active[done]] = t
+        converged[active[done]] = True
+        active = active[~done]
+        if active.size == 0:
+            break
+
+    # Group the converged end states
+    groups: Dict[Tuple, int] = {}
+    for b in np.flatnonzero(converged):
+        key = tuple(np.round(x[b], OUTCOME_DECIMALS)) if symmetric else \
+            (tuple(np.round(x[b], OUTCOME_DECIMALS)), tuple(np.round(y[b], OUTCOME_DECIMALS)))
+        groups[key] = groups.get(key, 0) + 1
+    outcomes = []
+    for key, count in sorted(groups.items(), key=lambda item: -item[1]):
+        # Rounded states are only accurate up to a small multiple of the payoff range
+        if symmetric:
+            state = np.array(key)
+            outcome = {'state': [float(v) for v in key],
+                       'is_nash': is_mixed_nash(payoff_matrix, state, state, _CHECK_TOLERANCE * spread),
+                       'ess': is_ess(p1 / spread, state, _CHECK_TOLERANCE)}
+        else:
+            outcome = {'p1': [float(v) for v in key[0]], 'p2': [float(v) for v in key[1]],
+                       'is_nash': is_mixed_nash(payoff_matrix, key[0], key[1], _CHECK_TOLERANCE * spread)}
+        outcome.update(count=count, share=round(count / batch, 4))
+        outcomes.append(outcome)
+
+    result = {
+        'symmetric': symmetric,
+        'dynamics': dynamics,
+        'converged': converged.tolist(),
+        'steps': steps.tolist(),
+        'outcomes': outcomes,
+    }
+    if symmetric:
+        result['final'] = x.tolist()
+    else:
+        result['final_p1'] = x.tolist()
+        result['final_p2'] = y.tolist()
+    return result
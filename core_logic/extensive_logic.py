@@ -0,0 +1,258 @@
+import itertools
+import math
+import random
+from typing import List, Optional, Dict, Any, Tuple
+
+import numpy as np
+
+
+# Action labels used by generated games: player 1 moves with A, B, ..., player 2 with a, b, ...
+ACTION_LABELS = {1: "ABCDEFGH", 2: "abcdefgh", 3: "xyzuvw"}
+
+# Largest normal form (number of pure strategy profiles) built by `normal_form`
+MAX_NORMAL_FORM_PROFILES = 4096
+
+
+class ExtensiveGame:
+    """
+    Perfect-information game stored as flat per-node arrays; node 0 is the root.
+
+    players[i]  - player (1-based) who moves at node i, 0 for a terminal node
+    children[i] - child node ids; a node may have several parents, so identical
+                  subgames can be stored once (the game is a DAG, not only a tree)
+    actions[i]  - action labels, parallel to children[i]
+    payoffs[i]  - payoff vector (one entry per player) at terminal nodes, None elsewhere
+    """
+
+    def __init__(self, num_players: int, players: List[int], children: List[List[int]],
+                 actions: List[List[str]], payoffs: List[Optional[Tuple[int, ...]]]):
+        self.num_players = num_players
+        self.players = players
+        self.children = children
+        self.actions = actions
+        self.payoffs = payoffs
+
+    def __len__(self) -> int:
+        return len(self.players)
+
+    def is_terminal(self, node: int) -> bool:
+        return not self.children[node]
+
+
+def game_to_dict(game: ExtensiveGame) -> Dict[str, Any]:
+    """JSON-serializable raw_data for an extensive-form game."""
+    return {
+        "format": "extensive",
+        "num_players": game.num_players,
+        "players": list(game.players),
+        "children": [list(c) for c in game.children],
+        "actions": [list(a) for a in game.actions],
+        "payoffs": [list(p) if p is not None else None for p in game.payoffs],
+    }
+
+
+def game_from_dict(data: Dict[str, Any]) -> ExtensiveGame:
+    """
+    Rebuild (and validate) a game from `game_to_dict` output.
+
+    Raises:
+        ValueError: on dangling child ids, missing/short payoff vectors,
+                    action lists that do not match the children, or cycles
+    """
+    num_players = int(data["num_players"])
+    players = [int(p) for p in data["players"]]
+    children = [[int(c) for c in cs] for cs in data["children"]]
+    size = len(players)
+    actions = data.get("actions") or [[str(k) for k in range(len(cs))] for cs in children]
+    actions = [[str(a) for a in acts] for acts in actions]
+    payoffs = [tuple(int(v) for v in p) if p is not None else None for p in data["payoffs"]]
+    if not (len(children) == len(actions) == len(payoffs) == size) or size == 0:
+        raise ValueError("Node arrays of an extensive-form game must have the same length")
+    for node in range(size):
+        if any(not 0 <= c < size for c in children[node]):
+            raise ValueError(f"Node {node} has a child outside the game")
+        if len(actions[node]) != len(children[node]):
+            raise ValueError(f"Node {node} has {len(children[node])} children but {len(actions[node])} actions")
+        if children[node]:
+            if not 1 <= players[node] <= num_players:
+                raise ValueError(f"Node {node} is moved by unknown player {players[node]}")
+        elif payoffs[node] is None or len(payoffs[node]) != num_players:
+            raise ValueError(f"Terminal node {node} needs {num_players} payoffs")
+    game = ExtensiveGame(num_players, players, children, actions, payoffs)
+    _postorder(game)  # rejects cycles
+    return game
+
+
+def _postorder(game: ExtensiveGame) -> List[int]:
+    """
+    Nodes reachable from the root, children before parents, each node once
+    (shared subgames are listed a single time). Iterative, so deep games do not
+    hit the recursion limit.
+    """
+    # 0 = unseen, 1 = on the current path, 2 = done
+    state = [0] * len(game)
+    order: List[int] = []
+    stack = [(0, 0)]
+    state[0] = 1
+    while stack:
+        node, k = stack[-1]
+        if k < len(game.children[node]):
+            stack[-1] = (node, k + 1)
+            child = game.children[node][k]
+            if state[child] == 1:
+                raise ValueError(f"The game graph has a cycle through node {child}")
+            if state[child] == 0:
+                state[child] = 1
+                stack.append((child, 0))
+        else:
+            stack.pop()
+            state[node] = 2
+            order.append(node)
+    return order
+
+
+def backward_induction(game: ExtensiveGame) -> Dict[str, Any]:
+    """
+    Subgame-perfect equilibrium by backward induction.
+
+    Every reachable node is solved exactly once, children first, so a subgame
+    shared by several parents is memoized rather than re-solved. At each
+    decision node the mover picks the action maximizing their own payoff; ties
+    go to the first such action.
+
+    Returns:
+        Dict with 'payoffs' (equilibrium payoff vector), 'choices' (chosen child
+        index per node, None at terminal/unreachable nodes), 'strategy'
+        ({node: action label} for every reachable decision node), 'path'
+        (action labels along the equilibrium path) and 'nodes_solved'.
+    """
+    order = _postorder(game)
+    values: List[Optional[Tuple[int, ...]]] = [None] * len(game)
+    choices: List[Optional[int]] = [None] * len(game)
+    for node in order:
+        if game.is_terminal(node):
+            values[node] = game.payoffs[node]
+            continue
+        mover = game.players[node] - 1
+        options = [values[c][mover] for c in game.children[node]]
+        best = options.index(max(options))
+        choices[node] = best
+        values[node] = values[game.children[node][best]]
+
+    path = []
+    node = 0
+    while not game.is_terminal(node):
+        path.append(game.actions[node][choices[node]])
+        node = game.children[node][choices[node]]
+    return {
+        'payoffs': values[0],
+        'choices': choices,
+        'strategy': {n: game.actions[n][choices[n]] for n in sorted(order) if choices[n] is not None},
+        'path': path,
+        'nodes_solved': len(order),
+    }
+
+
+def _decision_nodes(game: ExtensiveGame) -> List[List[int]]:
+    """Reachable decision nodes of each player, in increasing id order."""
+    nodes: List[List[int]] = [[] for _ in range(game.num_players)]
+    for node in sorted(_postorder(game)):
+        if not game.is_terminal(node):
+            nodes[game.players[node] - 1].append(node)
+    return nodes
+
+
+def _outcome(game: ExtensiveGame, move: Dict[int, int]) -> Tuple[int, ...]:
+    node = 0
+    while not game.is_terminal(node):
+        node = game.children[node][move[node]]
+    return game.payoffs[node]
+
+
+def normal_form(game: ExtensiveGame, max_profiles: int = MAX_NORMAL_FORM_PROFILES) -> Dict[str, Any]:
+    """
+    Normal (strategic) form of a small extensive-form game.
+
+    A pure strategy of a player fixes one action at each of their decision
+    nodes, so the form grows exponentially with the game; larger games are
+    rejected instead of enumerated.
+
+    Returns:
+        Dict with 'nodes' (each player's decision nodes), 'strategies' (per player,
+        tuples of child indices in the order of 'nodes'), 'labels' ("A/b"-style
+        names) and 'payoffs': raw[s1][s2]...[sN] = payoff tuple, the layout used
+        by `nash_logic` (a bimatrix for 2 players).
+
+    Raises:
+        ValueError: if the number of strategy profiles exceeds max_profiles
+    """
+    nodes = _decision_nodes(game)
+    counts = [math.prod(len(game.children[n]) for n in own) for own in nodes]
+    total = math.prod(counts)
+    if total > max_profiles:
+        raise ValueError(f"Normal form would have {total} strategy profiles (limit {max_profiles})")
+
+    strategies = [list(itertools.product(*[range(len(game.children[n])) for n in own])) for own in nodes]
+    labels = [["/".join(game.actions[n][k] for n, k in zip(own, s)) or "-" for s in player_strategies]
+              for own, player_strategies in zip(nodes, strategies)]
+    table = np.empty(counts + [game.num_players], dtype=np.int64)
+    for profile in itertools.product(*[range(c) for c in counts]):
+        move = {}
+        for player, index in enumerate(profile):
+            move.update(zip(nodes[player], strategies[player][index]))
+        table[profile] = _outcome(game, move)
+
+    def nest(block: np.ndarray):
+        if block.ndim == 1:
+            return tuple(int(v) for v in block)
+        return [nest(sub) for sub in block]
+
+    return {'nodes': nodes, 'strategies': strategies, 'labels': labels, 'payoffs': nest(table)}
+
+
+def spe_profile(game: ExtensiveGame, spe: Dict[str, Any], form: Dict[str, Any]) -> Tuple[int, ...]:
+    """Index of the backward-induction strategy profile in `normal_form` output."""
+    return tuple(
+        player_strategies.index(tuple(spe['choices'][n] for n in own))
+        for own, player_strategies in zip(form['nodes'], form['strategies'])
+    )
+
+
+def generate_random_extensive(depth: int, branching: int = 2, num_players: int = 2,
+                              max_payoff: int = 9, rng=random) -> ExtensiveGame:
+    """
+    Random game tree where the movers take turns by depth (player 1 at the root)
+    and every terminal node gets a random payoff vector.
+
+    Decision nodes are numbered first, in preorder (the root is node 0), and the
+    terminal nodes after them, so "N0".."Nk" labels in a question text are the
+    node ids themselves.
+    """
+    players: List[int] = []
+    children: List[List[int]] = []
+    payoffs: List[Optional[Tuple[int, ...]]] = []
+    # Preorder construction; ids are remapped below
+    stack: List[Tuple[Optional[int], int]] = [(None, 0)]
+    while stack:
+        parent, level = stack.pop()
+        node = len(players)
+        if parent is not None:
+            children[parent].append(node)
+        children.append([])
+        if level == depth:
+            players.append(0)
+            payoffs.append(tuple(rng.randint(0, max_payoff) for _ in range(num_players)))
+        else:
+            players.append(level % num_players + 1)
+            payoffs.append(None)
+            stack.extend((node, level + 1) for _ in range(branching))
+
+    order = [n for n in range(len(players)) if players[n]] + [n for n in range(len(players)) if not players[n]]
+    new_id = {old: new for new, old in enumerate(order)}
+    return ExtensiveGame(
+        num_players,
+        [players[n] for n in order],
+        [[new_id[c] for c in children[n]] for n in order],
+        [list(ACTION_LABELS[players[n]][:branching]) if players[n] else [] for n in order],
+        [payoffs[n] for n in order],
+    )
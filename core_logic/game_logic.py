@@ -0,0 +1,204 @@
+from abc import ABC, abstractmethod
+from typing import List, Tuple
+import random
+
+from core_logic.minmax_logic import Node
+
+# A position is (stones of the player to move, all stones, moves played).
+# Keeping the side to move relative lets both players share the same code path.
+GameState = Tuple[int, int, int]
+
+
+class BitboardGame(ABC):
+    """
+    Base class for two-player board games stored as bitboards.
+
+    Subclasses fill `self.lines` (one bitmask per winning line) and implement
+    `legal_moves` / `play` / `cell_bit`. Leaf scores are kept non-negative so the trees can be
+    rendered and parsed like the random MinMax trees.
+    """
+
+    name = "game"
+
+    def __init__(self, width: int, height: int, connect: int):
+        self.width = width
+        self.height = height
+        self.connect = connect
+        self.num_cells = width * height
+        self.lines: List[int] = []
+
+    def initial_state(self) -> GameState:
+        return (0, 0, 0)
+
+    @abstractmethod
+    def legal_moves(self, state: GameState) -> List[int]:
+        ...
+
+    @abstractmethod
+    def play(self, state: GameState, move: int) -> GameState:
+        ...
+
+    @abstractmethod
+    def cell_bit(self, row: int, col: int) -> int:
+        """Bit of the cell at (row, col); row 0 is the top row."""
+
+    def has_won(self, stones: int) -> bool:
+        return any(stones & line == line for line in self.lines)
+
+    def last_mover_won(self, state: GameState) -> bool:
+        position, mask, _ = state
+        return self.has_won(position ^ mask)
+
+    def is_terminal(self, state: GameState) -> bool:
+        return self.last_mover_won(state) or state[2] == self.num_cells
+
+    def evaluate(self, state: GameState, max_to_move: bool, win_score: int = 10) -> int:
+        """
+        Score a position from MAX's point of view, in [0, win_score].
+
+        Terminal positions score win_score (MAX won), 0 (MIN won) or the midpoint
+        for a draw. Other positions use open lines: lines still winnable by MAX
+        minus lines still winnable by MIN, clamped strictly inside the range.
+        """
+        position, mask, _ = state
+        mid = win_score // 2
+        if self.last_mover_won(state):
+            # The player who just moved is the one NOT to move now
+            return 0 if max_to_move else win_score
+
+        opponent = position ^ mask
+        max_stones, min_stones = (position, opponent) if max_to_move else (opponent, position)
+        open_max = sum(1 for line in self.lines if not line & min_stones)
+        open_min = sum(1 for line in self.lines if not line & max_stones)
+        return max(1, min(win_score - 1, mid + open_max - open_min))
+
+    def random_position(self, num_moves: int, rng=random) -> GameState:
+        """Play up to num_moves random moves, stopping before the game ends."""
+        state = self.initial_state()
+        for _ in range(num_moves):
+            moves = [m for m in self.legal_moves(state) if not self.is_terminal(self.play(state, m))]
+            if not moves:
+                break
+            state = self.play(state, rng.choice(moves))
+        return state
+
+    def render(self, state: GameState) -> str:
+        """Draw the board with X for the player to move first in the game."""
+        position, mask, moves = state
+        # position belongs to the player to move; X moved first
+        x_stones = position if moves % 2 == 0 else position ^ mask
+        rows = []
+        for r in range(self.height):
+            cells = []
+            for c in range(self.width):
+                bit = self.cell_bit(r, c)
+                if not mask & bit:
+                    cells.append(".")
+                else:
+                    cells.append("X" if x_stones & bit else "O")
+            rows.append(" ".join(cells))
+        return "\n".join(rows)
+
+
+class TicTacToe(BitboardGame):
+    """Tic-tac-toe on a 3x3 board; cell (r, c) is bit r*3 + c."""
+
+    name = "tictactoe"
+
+    def __init__(self):
+        super().__init__(3, 3, 3)
+        self.full_mask = (1 << 9) - 1
+        self.lines = [
+            0b000000111, 0b000111000, 0b111000000,  # rows
+            0b001001001, 0b010010010, 0b100100100,  # columns
+            0b100010001, 0b001010100,               # diagonals
+        ]
+
+    def cell_bit(self, row: int, col: int) -> int:
+        return 1 << (row * 3 + col)
+
+    def legal_moves(self, state: GameState) -> List[int]:
+        free = ~state[1] & self.full_mask
+        moves = []
+        while free:
+            low = free & -free
+            moves.append(low.bit_length() - 1)
+            free ^= low
+        return moves
+
+    def play(self, state: GameState, move: int) -> GameState:
+        position, mask, moves = state
+        # The opponent's stones become the stones of the new player to move
+        return (position ^ mask, mask | (1 << move), moves + 1)
+
+
+class ConnectFour(BitboardGame):
+    """
+    Connect-Four style game on a small board.
+
+    Uses the classic column-major layout with one sentinel bit on top of each
+    column, so a move is a single addition and a win check is a few shifts.
+    """
+
+    name = "connect4"
+
+    def __init__(self, width: int = 4, height: int = 4, connect: int = 3):
+        super().__init__(width, height, connect)
+        self.col_height = height + 1
+        self.lines = self._build_lines()
+
+    def _bit(self, col: int, level: int) -> int:
+        return 1 << (col * self.col_height + level)
+
+    def cell_bit(self, row: int, col: int) -> int:
+        return self._bit(col, self.height - 1 - row)
+
+    def _build_lines(self) -> List[int]:
+        lines = []
+        k = self.connect
+        for col in range(self.width):
+            for level in range(self.height):
+                for dc, dl in ((1, 0), (0, 1), (1, 1), (1, -1)):
+                    end_c, end_l = col + dc * (k - 1), level + dl * (k - 1)
+                    if 0 <= end_c < self.width and 0 <= end_l < self.height:
+                        lines.append(sum(self._bit(col + dc * i, level + dl * i) for i in range(k)))
+        return lines
+
+    def has_won(self, stones: int) -> bool:
+        for shift in (1, self.col_height, self.col_height - 1, self.col_height + 1):
+            m = stones
+            for i in range(1, self.connect):
+                m &= stones >> (shift * i)
+            if m:
+                return True
+        return False
+
+    def legal_moves(self, state: GameState) -> List[int]:
+        mask = state[1]
+        return [c for c in range(self.width) if not mask & self._bit(c, self.height - 1)]
+
+    def play(self, state: GameState, move: int) -> GameState:
+        position, mask, moves = state
+        new_mask = mask | (mask + self._bit(move, 0))
+        return (position ^ mask, new_mask, moves + 1)
+
+
+GAMES = {
+    TicTacToe.name: TicTacToe,
+    ConnectFour.name: ConnectFour,
+}
+
+
+def build_game_tree(game: BitboardGame, state: GameState, depth: int, max_to_move: bool = True, win_score: int = 10) -> Node:
+    """
+    Expand a game position into a `Node` tree of the given depth.
+
+    Terminal positions become leaves immediately; leaves at the depth limit get
+    the heuristic score from `game.evaluate`. The root is a MAX node.
+    """
+    if depth == 0 or game.is_terminal(state):
+        return Node(value=game.evaluate(state, max_to_move, win_score))
+    return Node(children=[
+        build_game_tree(game, game.play(state, move), depth - 1, not max_to_move, win_score)
+        for move in game.legal_moves(state)
+    ])
@@ -0,0 +1,197 @@
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+
+# Pivot / feasibility tolerance for the dense tableau
+EPS = 1e-9
+
+
+def _pivot(tableau: np.ndarray, basis: List[int], row: int, col: int) -> None:
+    pivot_row = tableau[row] / tableau[row, col]
+    tableau -= np.outer(tableau[:, col], pivot_row)
+    tableau[row] = pivot_row
+    basis[row] = col
+
+
+def _iterate(tableau: np.ndarray, basis: List[int], num_cols: int, max_iter: int) -> Tuple[str, int]:
+    """
+    Primal simplex on a tableau whose last row is the reduced-cost row of a
+    maximization (entries > 0 improve) and whose last column is the RHS.
+
+    Uses Dantzig's rule and switches to Bland's rule after a degenerate pivot,
+    so it cannot cycle. Only the first `num_cols` columns may enter.
+    Returns the status and the number of pivots made.
+    """
+    bland = False
+    for pivots in range(max_iter):
+        costs = tableau[-1, :num_cols]
+        if bland:
+            improving = np.flatnonzero(costs > EPS)
+            if improving.size == 0:
+                return 'optimal', pivots
+            col = int(improving[0])
+        else:
+            col = int(np.argmax(costs))
+            if costs[col] <= EPS:
+                return 'optimal', pivots
+        column = tableau[:-1, col]
+        rows = np.flatnonzero(column > EPS)
+        if rows.size == 0:
+            return 'unbounded', pivots
+        ratios = tableau[rows, -1] / column[rows]
+        best = ratios.min()
+        ties = rows[ratios <= best + EPS]
+        # Bland: among ties leave the smallest basic index
+        row = int(min(ties, key=lambda r: basis[r])) if bland else int(ties[0])
+        bland = best <= EPS
+        _pivot(tableau, basis, row, col)
+    return 'iteration_limit', max_iter
+
+
+def simplex(c: List[float], a_ub: Optional[List[List[float]]] = None, b_ub: Optional[List[float]] = None,
+            a_eq: Optional[List[List[float]]] = None, b_eq: Optional[List[float]] = None,
+            max_iter: int = 10000) -> Dict[str, Any]:
+    """
+    Dense two-phase simplex: maximize c @ x subject to
+    a_ub @ x <= b_ub, a_eq @ x == b_eq, x >= 0.
+
+    Args:
+        c: Objective coefficients (n)
+        a_ub, b_ub: Inequality rows and right-hand sides
+        a_eq, b_eq: Equality rows and right-hand sides
+        max_iter: Pivot limit per phase
+
+    Returns:
+        Dict with status ('optimal', 'infeasible', 'unbounded', 'iteration_limit'),
+        x, value, duals of the inequality rows, the final basis (columns are the
+        n variables followed by one slack per inequality) and the pivot count.
+    """
+    c = np.asarray(c, dtype=float)
+    n = c.size
+    a_ub = np.asarray(a_ub, dtype=float).reshape(-1, n) if a_ub is not None else np.zeros((0, n))
+    b_ub = np.asarray(b_ub, dtype=float).reshape(-1) if b_ub is not None else np.zeros(0)
+    a_eq = np.asarray(a_eq, dtype=float).reshape(-1, n) if a_eq is not None else np.zeros((0, n))
+    b_eq = np.asarray(b_eq, dtype=float).reshape(-1) if b_eq is not None else np.zeros(0)
+    m_ub, m_eq = a_ub.shape[0], a_eq.shape[0]
+    m = m_ub + m_eq
+
+    # Equality form over [x, slacks]
+    a = np.vstack([np.hstack([a_ub, np.eye(m_ub)]),
+                   np.hstack([a_eq, np.zeros((m_eq, m_ub))])])
+    b = np.concatenate([b_ub, b_eq])
+    cost = np.concatenate([c, np.zeros(m_ub)])
+    num_cols = n + m_ub
+    pivots = 0
+
+    # Phase 1: slacks are basic where b_ub >= 0, other rows get an artificial
+    flip = b < 0
+    a[flip] *= -1
+    b = np.abs(b)
+    needs_artificial = [i for i in range(m) if i >= m_ub or flip[i]]
+    artificial = np.zeros((m, len(needs_artificial)))
+    basis = list(range(n, n + m_ub)) + [0] * m_eq
+    for k, i in enumerate(needs_artificial):
+        artificial[i, k] = 1.0
+        basis[i] = num_cols + k
+    tableau = np.vstack([np.hstack([a, artificial, b[:, None]]),
+                         np.zeros(num_cols + len(needs_artificial) + 1)])
+    if needs_artificial:
+        # Maximize -sum(artificials): reduced costs are the column sums of their rows
+        tableau[-1, :num_cols] = tableau[needs_artificial, :num_cols].sum(axis=0)
+        tableau[-1, -1] = tableau[needs_artificial, -1].sum()
+        status, pivots = _iterate(tableau, basis, num_cols, max_iter)
+        if status == 'iteration_limit':
+            return {'status': status, 'x': None, 'value': None, 'basis': basis, 'pivots': pivots}
+        if tableau[-1, -1] > 1e-7:
+            return {'status': 'infeasible', 'x': None, 'value': None, 'basis': basis, 'pivots': pivots}
+        # Drive artificials that stayed basic (at zero) out of the basis
+        for row in range(m):
+            if basis[row] >= num_cols:
+                candidates = np.flatnonzero(np.abs(tableau[row, :num_cols]) > EPS)
+                if candidates.size:
+                    _pivot(tableau, basis, row, int(candidates[0]))
+    # Phase 2 tableau: drop artificial columns, price out the real objective
+    keep = [row for row in range(m) if basis[row] < num_cols]
+    body = np.hstack([tableau[keep, :num_cols], tableau[keep, -1:]])
+    basis = [basis[row] for row in keep]
+    costs = np.append(cost, 0.0) - cost[basis] @ body
+    tableau = np.vstack([body, costs])
+
+    status, phase2_pivots = _iterate(tableau, basis, num_cols, max_iter)
+    pivots += phase2_pivots
+    x = np.zeros(num_cols)
+    for row, col in enumerate(basis):
+        x[col] = tableau[row, -1]
+    # Shadow prices of the inequality rows (negated reduced costs of their slacks)
+    duals = -tableau[-1, n:num_cols]
+    return {'status': status, 'x': x[:n], 'value': float(c @ x[:n]), 'duals': duals,
+            'basis': basis, 'pivots': pivots}
+
+
+def interior_point(c: List[float], a_ub: List[List[float]], b_ub: List[float],
+                   max_iter: int = 100, tol: float = 1e-9) -> Dict[str, Any]:
+    """
+    Mehrotra predictor-corrector interior point method: maximize c @ x subject to
+    a_ub @ x <= b_ub, x >= 0.
+
+    Unlike `simplex` it does not walk along vertices, so heavily degenerate
+    problems (many constraints tight at the same point) cost no extra work.
+    Each iteration solves one dense system whose size is the number of rows,
+    and the answer is accurate to `tol` rather than exactly on a vertex.
+
+    Returns:
+        Dict with status ('optimal' or 'iteration_limit'), x, value and the
+        number of iterations.
+    """
+    c = np.asarray(c, dtype=float)
+    n = c.size
+    a = np.asarray(a_ub, dtype=float).reshape(-1, n)
+    b = np.asarray(b_ub, dtype=float).reshape(-1)
+    m = a.shape[0]
+    # Standard form over z = [x, slacks]: minimize cost @ z, a @ x + s = b, z >= 0
+    cost = np.concatenate([-c, np.zeros(m)])
+    z = np.ones(n + m)
+    w = np.ones(n + m)
+    y = np.zeros(m)
+    scale = 1 + max(np.abs(b).max(initial=0), np.abs(c).max(initial=0))
+
+    def product(v):
+        return a @ v[:n] + v[n:]
+
+    def transpose_product(u):
+        return np.concatenate([a.T @ u, u])
+
+    def step(normal, r_p, r_d, r_c, d):
+        # Normal equations (A D A^T) dy = r_p + A (D r_d - r_c / w), with A = [a I]
+        dy = np.linalg.solve(normal, r_p + product(d * r_d - r_c / w))
+        dz = d * (transpose_product(dy) - r_d) + r_c / w
+        dw = (r_c - w * dz) / z
+        return dz, dy, dw
+
+    def max_step(v, dv):
+        shrinking = dv < 0
+        return min(1.0, float((-v[shrinking] / dv[shrinking]).min(initial=np.inf)))
+
+    for iteration in range(max_iter):
+        r_p = b - product(z)
+        r_d = cost - transpose_product(y) - w
+        mu = z @ w / z.size
+        if max(np.abs(r_p).max(initial=0), np.abs(r_d).max(), mu) <= tol * scale:
+            return {'status': 'optimal', 'x': z[:n], 'value': float(c @ z[:n]),
+                    'iterations': iteration}
+        d = z / w
+        normal = (a * d[:n]) @ a.T
+        normal[np.diag_indices(m)] += d[n:] + 1e-14
+        # Predictor (affine scaling) step, then a centred corrector with the same matrix
+        dz, dy, dw = step(normal, r_p, r_d, -z * w, d)
+        alpha_p, alpha_d = max_step(z, dz), max_step(w, dw)
+        mu_aff = (z + alpha_p * dz) @ (w + alpha_d * dw) / z.size
+        sigma = (mu_aff / mu) ** 3
+        dz, dy, dw = step(normal, r_p, r_d, sigma * mu - z * w - dz * dw, d)
+        alpha_p = 0.99 * max_step(z, dz)
+        alpha_d = 0.99 * max_step(w, dw)
+        z = z + alpha_p * dz
+        y = y + alpha_d * dy
+        w = w + alpha_d * dw
+    return {'status': 'iteration_limit', 'x': z[:n], 'value': float(c @ z[:n]),
+            'iterations': max_iter}
@@ -0,0 +1,220 @@
+from typing import Any, Dict, List, Optional, Tuple
+from concurrent.futures import ProcessPoolExecutor
+import math
+import random
+
+from core_logic.minmax_logic import Node, CHANCE, is_procedural, leaf_bounds
+from core_logic.game_logic import BitboardGame, GameState
+
+# Lazy (procedural) trees with more leaves than this are estimated with MCTS
+# instead of exact alpha-beta. Explicit trees are always solved exactly: they
+# are already in memory and alpha-beta is linear in their size.
+LARGE_TREE_LEAVES = 2 ** 20
+
+
+class TreeProblem:
+    """MCTS view of an explicit (or procedural) `Node` tree. The root is MAX."""
+
+    def __init__(self, root: Node):
+        self.root = root
+        if is_procedural(root):
+            # Don't expand a lazy tree just to find its bounds
+            self.bounds = (0, root.max_leaf_value)
+        else:
+            self.bounds = leaf_bounds(root)
+
+    def initial_state(self) -> Node:
+        return self.root
+
+    def children(self, state: Node) -> List[Node]:
+        return state.children
+
+    def is_chance(self, state: Node) -> bool:
+        return state.kind == CHANCE
+
+    def probs(self, state: Node) -> List[float]:
+        return state.probs or [1.0 / len(state.children)] * len(state.children)
+
+    def leaf_value(self, state: Node) -> float:
+        return state.value
+
+
+class GameProblem:
+    """
+    MCTS view of an implicit game: states are expanded from the rules on demand.
+
+    Mirrors `build_game_tree`: search stops at terminal positions or after
+    max_depth plies, where the position is scored with `game.evaluate`.
+    """
+
+    def __init__(self, game: BitboardGame, state: Optional[GameState] = None,
+                 max_depth: Optional[int] = None, win_score: int = 10):
+        self.game = game
+        self.start = state if state is not None else game.initial_state()
+        self.max_depth = max_depth if max_depth is not None else game.num_cells
+        self.win_score = win_score
+        self.bounds = (0, win_score)
+
+    def initial_state(self) -> Tuple[GameState, bool, int]:
+        return (self.start, True, self.max_depth)
+
+    def children(self, state: Tuple[GameState, bool, int]) -> List[Tuple[GameState, bool, int]]:
+        game_state, max_to_move, depth_left = state
+        if depth_left == 0 or self.game.is_terminal(game_state):
+            return []
+        return [(self.game.play(game_state, m), not max_to_move, depth_left - 1)
+                for m in self.game.legal_moves(game_state)]
+
+    def is_chance(self, state) -> bool:
+        return False
+
+    def probs(self, state) -> List[float]:
+        return []
+
+    def leaf_value(self, state: Tuple[GameState, bool, int]) -> float:
+        game_state, max_to_move, _ = state
+        return self.game.evaluate(game_state, max_to_move, self.win_score)
+
+
+class _SearchNode:
+    __slots__ = ('state', 'maximizing', 'chance', 'child_states', 'children', 'untried', 'visits', 'total')
+
+    def __init__(self, state: Any, maximizing: bool, chance: bool):
+        self.state = state
+        self.maximizing = maximizing
+        self.chance = chance
+        self.child_states: Optional[List[Any]] = None
+        self.children: Dict[int, '_SearchNode'] = {}
+        self.untried: List[int] = []
+        self.visits = 0
+        self.total = 0.0
+
+
+def _expand_info(node: _SearchNode, problem, rng: random.Random) -> None:
+    node.child_states = problem.children(node.state)
+    node.untried = list(range(len(node.child_states)))
+    rng.shuffle(node.untried)
+
+
+def _child(node: _SearchNode, index: int, problem) -> _SearchNode:
+    if index not in node.children:
+        state = node.child_states[index]
+        # A chance node passes the turn through unchanged
+        maximizing = node.maximizing if node.chance else not node.maximizing
+        node.children[index] = _SearchNode(state, maximizing, problem.is_chance(state))
+    return node.children[index]
+
+
+def _uct_pick(node: _SearchNode, c: float, lower: float, span: float) -> int:
+    log_n = math.log(node.visits)
+    best_index, best_score = -1, float('-inf')
+    for index, child in node.children.items():
+        mean = (child.total / child.visits - lower) / span
+        exploit = mean if node.maximizing else 1.0 - mean
+        score = exploit + c * math.sqrt(log_n / child.visits)
+        if score > best_score:
+            best_index, best_score = index, score
+    return best_index
+
+
+def _playout(problem, state: Any, rng: random.Random) -> float:
+    while True:
+        children = problem.children(state)
+        if not children:
+            return problem.leaf_value(state)
+        if problem.is_chance(state):
+            state = rng.choices(children, weights=problem.probs(state))[0]
+        else:
+            state = rng.choice(children)
+
+
+def _run_mcts(problem, playouts: int, c: float, seed: Optional[int]) -> Dict[int, Tuple[int, float]]:
+    """One UCT search; returns {root child index: (visits, total value)}."""
+    rng = random.Random(seed)
+    lower, upper = problem.bounds
+    span = (upper - lower) or 1.0
+    root_state = problem.initial_state()
+    root = _SearchNode(root_state, True, problem.is_chance(root_state))
+
+    for _ in range(playouts):
+        node = root
+        path = [root]
+        # Selection / expansion
+        while True:
+            if node.child_states is None:
+                _expand_info(node, problem, rng)
+            if not node.child_states:
+                break
+            if node.chance:
+                index = rng.choices(range(len(node.child_states)), weights=problem.probs(node.state))[0]
+                node.untried = [i for i in node.untried if i != index]
+                node = _child(node, index, problem)
+                path.append(node)
+                continue
+            if node.untried:
+                node = _child(node, node.untried.pop(), problem)
+                path.append(node)
+                break
+            node = _child(node, _uct_pick(node, c, lower, span), problem)
+            path.append(node)
+        # Simulation and backpropagation
+        value = _playout(problem, node.state, rng)
+        for n in path:
+            n.visits += 1
+            n.total += value
+
+    return {index: (child.visits, child.total) for index, child in root.children.items()}
+
+
+def mcts_solve(problem, playouts: int = 2000, workers: int = 1, c: float = 1.4,
+               seed: Optional[int] = None) -> Dict[str, Any]:
+    """
+    Monte Carlo Tree Search (UCT) for MAX/MIN trees and games.
+
+    Args:
+        problem: `TreeProblem` or `GameProblem` (or a `Node`, wrapped automatically)
+        playouts: Total playout budget
+        workers: >1 runs independent searches in that many processes (root
+                 parallelization) and merges the root statistics
+        c: UCT exploration constant (values are normalized to [0, 1])
+        seed: Seed for reproducible searches
+
+    Returns:
+        Dict with root_value (mean playout value of the chosen move), best_move
+        (root child index), confidence (share of root visits on best_move),
+        playouts and per-move visit counts.
+    """
+    if isinstance(problem, Node):
+        problem = TreeProblem(problem)
+
+    root_state = problem.initial_state()
+    if not problem.children(root_state):
+        return {'root_value': problem.leaf_value(root_state), 'best_move': None,
+                'confidence': 1.0, 'playouts': 0, 'visits': []}
+
+    if workers > 1:
+        base_seed = seed if seed is not None else random.getrandbits(32)
+        share = max(1, playouts // workers)
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = [pool.submit(_run_mcts, problem, share, c, base_seed + i) for i in range(workers)]
+            partials = [f.result() for f in futures]
+    else:
+        partials = [_run_mcts(problem, playouts, c, seed)]
+
+    stats: Dict[int, List[float]] = {}
+    for partial in partials:
+        for index, (visits, total) in partial.items():
+            entry = stats.setdefault(index, [0, 0.0])
+            entry[0] += visits
+            entry[1] += total
+
+    best_move = max(stats, key=lambda i: stats[i][0])
+    total_visits = sum(v for v, _ in stats.values())
+    best_visits, best_total = stats[best_move]
+    return {
+        'root_value': round(best_total / best_visits, 2),
+        'best_move': best_move,
+        'confidence': round(best_visits / total_visits, 3),
+        'playouts': int(total_visits),
+        'visits': [int(stats.get(i, (0, 0))[0]) for i in range(max(stats) + 1)],
+    }
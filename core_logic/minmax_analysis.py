@@ -0,0 +1,228 @@
+import random
+from functools import lru_cache
+from typing import Dict, Any, List, Tuple, FrozenSet, Set
+
+from core_logic.minmax_logic import Node, minmax, has_chance_nodes, count_leaves
+
+
+def _subtree_values(node: Node, maximizing: bool, values: Dict[int, int]) -> int:
+    """Plain minimax (no pruning) storing the value of every node, keyed by id(node)."""
+    if not node.children:
+        value = node.value
+    elif maximizing:
+        value = max(_subtree_values(c, False, values) for c in node.children)
+    else:
+        value = min(_subtree_values(c, True, values) for c in node.children)
+    values[id(node)] = value
+    return value
+
+
+def _reorder(node: Node, maximizing: bool, values: Dict[int, int], best_first: bool) -> Node:
+    """
+    Copy of the tree where each node's children are sorted by their minimax value.
+
+    best_first puts the child the player would choose first (largest for MAX,
+    smallest for MIN), which yields the minimal alpha-beta tree; otherwise the
+    worst child comes first and alpha-beta cuts as little as possible.
+    """
+    if not node.children:
+        return Node(value=node.value)
+    descending = maximizing == best_first
+    ordered = sorted(node.children, key=lambda c: values[id(c)], reverse=descending)
+    return Node(children=[_reorder(c, not maximizing, values, best_first) for c in ordered])
+
+
+def _visited_count(root: Node) -> int:
+    visited: List[int] = []
+    minmax(root, 0, float('-inf'), float('inf'), True, visited)
+    return len(visited)
+
+
+def pruning_analysis(root: Node) -> Dict[str, Any]:
+    """
+    Alpha-beta visited-leaf counts for the stored child order and for the best
+    and worst possible orders.
+
+    Subtree values are computed once; the best/worst trees are built by sorting
+    children on those values, so no permutation is ever tried. The counts are
+    exact when leaf values are distinct; with ties (cut on beta <= alpha) some
+    other worst order may visit a few more leaves.
+
+    Returns:
+        Dict with root_value, total_leaves, visited (stored order),
+        best_case_visited, worst_case_visited and pruning_ratio
+        (fraction of leaves skipped under the stored order).
+    """
+    if has_chance_nodes(root):
+        raise ValueError("Pruning analysis is defined only for MAX/MIN trees without chance nodes")
+
+    values: Dict[int, int] = {}
+    root_value = _subtree_values(root, True, values)
+    total_leaves = count_leaves(root)
+    visited = _visited_count(root)
+
+    return {
+        'root_value': root_value,
+        'total_leaves': total_leaves,
+        'visited': visited,
+        'best_case_visited': _visited_count(_reorder(root, True, values, True)),
+        'worst_case_visited': _visited_count(_reorder(root, True, values, False)),
+        'pruning_ratio': round(1 - visited / total_leaves, 3),
+    }
+
+
+# Outcome of an alpha-beta search of a subtree relative to its window (alpha, beta)
+LOW, EXACT, HIGH = 'low', 'exact', 'high'
+
+
+def _leaf_outcomes(alpha_finite: bool, beta_finite: bool) -> List[str]:
+    """A leaf can fail low/high only against a finite bound."""
+    return [t for t, ok in ((LOW, alpha_finite), (EXACT, True), (HIGH, beta_finite)) if ok]
+
+
+def _second_window(maximizing: bool, first: str, alpha_finite: bool, beta_finite: bool) -> Tuple[bool, bool]:
+    """Window kind for the second child: an exact first child becomes the new alpha (MAX) or beta (MIN)."""
+    if first != EXACT:
+        return alpha_finite, beta_finite
+    return (True, beta_finite) if maximizing else (alpha_finite, True)
+
+
+def _combine(maximizing: bool, first: str, second: str) -> str:
+    """Outcome of a node from the outcomes of its two children (second one searched)."""
+    cut = HIGH if maximizing else LOW
+    if first == EXACT:
+        return second if second == cut else EXACT
+    return second
+
+
+@lru_cache(maxsize=None)
+def _visit_counts(depth: int, maximizing: bool, alpha_finite: bool, beta_finite: bool) -> Dict[str, FrozenSet[int]]:
+    """
+    Visited-leaf counts reachable by a binary subtree of this depth, per
+    outcome, when alpha-beta enters it with a window of the given kind.
+
+    Only the kind of window matters (which bounds are finite): the leaf values
+    are free reals, so any outcome allowed by the window can be placed in it.
+    """
+    if depth == 0:
+        return {t: frozenset({1}) for t in _leaf_outcomes(alpha_finite, beta_finite)}
+    cut = HIGH if maximizing else LOW
+    counts: Dict[str, Set[int]] = {}
+    for first, first_counts in _visit_counts(depth - 1, not maximizing, alpha_finite, beta_finite).items():
+        if first == cut:
+            counts.setdefault(first, set()).update(first_counts)
+            continue
+        window = _second_window(maximizing, first, alpha_finite, beta_finite)
+        for second, second_counts in _visit_counts(depth - 1, not maximizing, *window).items():
+            counts.setdefault(_combine(maximizing, first, second), set()).update(
+                a + b for a in first_counts for b in second_counts)
+    return {t: frozenset(ks) for t, ks in counts.items()}
+
+
+def achievable_visits(depth: int) -> List[int]:
+    """
+    Alpha-beta visited-leaf counts that some binary MinMax tree of this depth
+    (MAX at the root) reaches, from the minimal tree to no pruning at all.
+    """
+    return sorted(_visit_counts(depth, True, False, False)[EXACT])
+
+
+def _leaf_value(outcome: str, alpha: float, beta: float, rng, ties: bool) -> float:
+    if outcome == HIGH:
+        return beta if ties else beta + 1 + rng.random()
+    if outcome == LOW:
+        return alpha if ties else alpha - 1 - rng.random()
+    if alpha == float('-inf') and beta == float('inf'):
+        return rng.random()
+    if alpha == float('-inf'):
+        return beta - 1 - rng.random()
+    if beta == float('inf'):
+        return alpha + 1 + rng.random()
+    return alpha + (beta - alpha) * rng.uniform(0.25, 0.75)
+
+
+def _pruned_subtree(depth: int) -> Node:
+    """Subtree alpha-beta never enters; its leaves (value None) are filled in afterwards."""
+    if depth == 0:
+        return Node(value=None)
+    return Node(children=[_pruned_subtree(depth - 1), _pruned_subtree(depth - 1)])
+
+
+def _build(depth: int, maximizing: bool, alpha: float, beta: float, outcome: str, visits: int,
+           rng, ties: bool) -> Tuple[Node, float]:
+    """Subtree whose search with window (alpha, beta) ends in `outcome` after exactly `visits` leaves."""
+    if depth == 0:
+        value = _leaf_value(outcome, alpha, beta, rng, ties)
+        return Node(value=value), value
+
+    alpha_finite, beta_finite = alpha != float('-inf'), beta != float('inf')
+    cut = HIGH if maximizing else LOW
+    splits = []
+    for first, first_counts in _visit_counts(depth - 1, not maximizing, alpha_finite, beta_finite).items():
+        if first == cut:
+            if first == outcome and visits in first_counts:
+                splits.append((first, visits, None, 0))
+            continue
+        window = _second_window(maximizing, first, alpha_finite, beta_finite)
+        for second, second_counts in _visit_counts(depth - 1, not maximizing, *window).items():
+            if _combine(maximizing, first, second) != outcome:
+                continue
+            splits.extend((first, k, second, visits - k) for k in first_counts if visits - k in second_counts)
+    first, first_visits, second, second_visits = rng.choice(splits)
+
+    left, v1 = _build(depth - 1, not maximizing, alpha, beta, first, first_visits, rng, ties)
+    if second is None:
+        return Node(children=[left, _pruned_subtree(depth - 1)]), v1
+    if maximizing:
+        right, v2 = _build(depth - 1, False, max(alpha, v1), beta, second, second_visits, rng, ties)
+        return Node(children=[left, right]), max(v1, v2)
+    right, v2 = _build(depth - 1, True, alpha, min(beta, v1), second, second_visits, rng, ties)
+    return Node(children=[left, right]), min(v1, v2)
+
+
+def _leaves(node: Node) -> List[Node]:
+    stack, leaves = [node], []
+    while stack:
+        n = stack.pop()
+        if n.children:
+            stack.extend(reversed(n.children))
+        else:
+            leaves.append(n)
+    return leaves
+
+
+def generate_pruning_tree(depth: int, visited: int, max_leaf_value: int = 10, rng=random) -> Node:
+    """
+    Binary MinMax tree (MAX at the root) on which alpha-beta, with the stored
+    child order, visits exactly `visited` leaves.
+
+    The tree is built top-down: each node picks how its visits split between
+    its children and how each child ends relative to the window it will be
+    searched with (fail low, exact, fail high), using the reachable counts from
+    `_visit_counts`. Leaf values are placed as reals inside/outside the window
+    they are searched with, then mapped order-preservingly onto distinct
+    integers in [0, max_leaf_value]; alpha-beta only compares values, so the
+    mapping keeps every cut. Leaves of pruned subtrees get random values.
+
+    Raises:
+        ValueError: if no tree of this depth visits that many leaves, or the
+                    value range is too small for the required distinct values
+    """
+    if visited not in _visit_counts(depth, True, False, False)[EXACT]:
+        counts = achievable_visits(depth)
+        raise ValueError(f"A depth-{depth} tree visits between {counts[0]} and {counts[-1]} leaves "
+                         f"(achievable: {counts}), not {visited}")
+    for ties in (False, True):
+        # Strict values first; ties on the window bounds (v = alpha / v = beta) need fewer distinct values
+        root, _ = _build(depth, True, float('-inf'), float('inf'), EXACT, visited, rng, ties)
+        leaves = _leaves(root)
+        distinct = sorted({leaf.value for leaf in leaves if leaf.value is not None})
+        if len(distinct) <= max_leaf_value + 1:
+            break
+    else:
+        raise ValueError(f"max_leaf_value {max_leaf_value} is too small for {visited} visited leaves")
+
+    mapping = dict(zip(distinct, sorted(rng.sample(range(max_leaf_value + 1), len(distinct)))))
+    for leaf in leaves:
+        leaf.value = mapping[leaf.value] if leaf.value is not None else rng.randint(0, max_leaf_value)
+    return root
@@ -1,22 +1,140 @@
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Tuple
+import base64
 import random
+import struct
+
+
+# Node kind for chance (expectation) nodes; decision nodes keep kind=None and
+# alternate MAX/MIN by depth as before.
+CHANCE = "chance"
+
+# Probability splits used for randomly generated chance nodes
+CHANCE_PROBS = [(0.5, 0.5), (0.25, 0.75), (0.75, 0.25), (0.2, 0.8), (0.8, 0.2)]
+
+# Size limits for client-chosen trees: materialized trees are built in full,
+# procedural ones may be searched in full by alpha-beta
+MAX_TREE_DEPTH = 10
+MAX_PROCEDURAL_DEPTH = 16
+MAX_BRANCHING = 8
+MAX_PROCEDURAL_LEAVES = 2 ** 16
+
+
+def check_tree_size(depth: int, branching: int = 2, procedural: bool = False) -> None:
+    """
+    Raises:
+        ValueError: if a tree of this shape is over the size limits above
+    """
+    max_depth = MAX_PROCEDURAL_DEPTH if procedural else MAX_TREE_DEPTH
+    if not isinstance(depth, int) or not isinstance(branching, int):
+        raise ValueError("Tree depth and branching must be integers")
+    if not 1 <= depth <= max_depth:
+        raise ValueError(f"Tree depth must be between 1 and {max_depth}, got {depth}")
+    if not 2 <= branching <= MAX_BRANCHING:
+        raise ValueError(f"Branching must be between 2 and {MAX_BRANCHING}, got {branching}")
+    if procedural and branching ** depth > MAX_PROCEDURAL_LEAVES:
+        raise ValueError(f"A procedural tree may have at most {MAX_PROCEDURAL_LEAVES} leaves "
+                         f"(branching {branching}, depth {depth} gives {branching ** depth})")
 
 
 class Node:
-    def __init__(self, value: Optional[int] = None, children: Optional[List['Node']] = None):
+    def __init__(self, value: Optional[int] = None, children: Optional[List['Node']] = None,
+                 kind: Optional[str] = None, probs: Optional[List[float]] = None):
         self.value = value
         self.children = children or []
+        self.kind = kind
+        self.probs = probs
+
+
+_MASK64 = (1 << 64) - 1
+
+
+def _mix64(x: int) -> int:
+    """SplitMix64 finalizer: cheap, well-distributed 64-bit hash."""
+    x = (x + 0x9E3779B97F4A7C15) & _MASK64
+    x = ((x ^ (x >> 30)) * 0xBF58476D1CE4E5B9) & _MASK64
+    x = ((x ^ (x >> 27)) * 0x94D049BB133111EB) & _MASK64
+    return x ^ (x >> 31)
+
+
+class ProceduralNode(Node):
+    """
+    Lazily expanded game tree defined only by (seed, depth, branching, max_leaf_value).
+
+    Each node carries a 64-bit key hashed from its parent's key and its child
+    index, so a leaf value depends only on (seed, path). Children are created on
+    first access to `children`, which lets alpha-beta materialize just the nodes
+    it visits.
+    """
+
+    def __init__(self, seed: int, depth: int, branching: int = 2, max_leaf_value: int = 10,
+                 key: Optional[int] = None):
+        self.seed = seed
+        self.depth = depth
+        self.branching = branching
+        self.max_leaf_value = max_leaf_value
+        self.key = _mix64(seed) if key is None else key
+        self.kind = None
+        self.probs = None
+        self._children: Optional[List[Node]] = None
+
+    @property
+    def value(self) -> Optional[int]:
+        if self.depth > 0:
+            return None
+        return self.key % (self.max_leaf_value + 1)
+
+    @property
+    def children(self) -> List[Node]:
+        if self.depth == 0:
+            return []
+        if self._children is None:
+            self._children = [
+                ProceduralNode(self.seed, self.depth - 1, self.branching, self.max_leaf_value,
+                               _mix64((self.key + i + 1) & _MASK64))
+                for i in range(self.branching)
+            ]
+        return self._children
+
+    def descriptor(self) -> Dict[str, Any]:
+        """Compact raw_data for the whole tree (only meaningful on the root)."""
+        return {
+            "format": "procedural",
+            "seed": self.seed,
+            "depth": self.depth,
+            "branching": self.branching,
+            "max_leaf_value": self.max_leaf_value,
+        }
+
 
+def is_procedural(node: Node) -> bool:
+    return isinstance(node, ProceduralNode)
 
-def generate_random_tree(depth: int, max_leaf_value: int = 10) -> Node:
+
+def generate_random_tree(depth: int, max_leaf_value: int = 10, rng=random) -> Node:
     if depth == 0:
-        return Node(value=random.randint(0, max_leaf_value))
+        return Node(value=rng.randint(0, max_leaf_value))
     return Node(children=[
-        generate_random_tree(depth - 1, max_leaf_value),
-        generate_random_tree(depth - 1, max_leaf_value)
+        generate_random_tree(depth - 1, max_leaf_value, rng),
+        generate_random_tree(depth - 1, max_leaf_value, rng)
     ])
 
 
+def generate_random_chance_tree(depth: int, max_leaf_value: int = 10, level: int = 0, rng=random) -> Node:
+    """
+    Random binary tree for expectiminimax: decision levels (MAX, MIN, ...) are
+    interleaved with chance levels, i.e. MAX -> chance -> MIN -> chance -> ...
+    """
+    if level == depth:
+        return Node(value=rng.randint(0, max_leaf_value))
+    children = [
+        generate_random_chance_tree(depth, max_leaf_value, level + 1, rng),
+        generate_random_chance_tree(depth, max_leaf_value, level + 1, rng)
+    ]
+    if level % 2 == 1:
+        return Node(children=children, kind=CHANCE, probs=list(rng.choice(CHANCE_PROBS)))
+    return Node(children=children)
+
+
 def minmax(node: Node, depth: int, alpha: float, beta: float, maximizing: bool, visited: List[int]) -> int:
     if not node.children:
         visited.append(node.value)
@@ -42,18 +160,310 @@ def minmax(node: Node, depth: int, alpha: float, beta: float, maximizing: bool,
         return int(min_eval)
 
 
+def has_chance_nodes(node: Node) -> bool:
+    if is_procedural(node):
+        # Procedural trees are plain MAX/MIN trees; don't expand them here
+        return False
+    stack = [node]
+    while stack:
+        n = stack.pop()
+        if n.kind == CHANCE:
+            return True
+        stack.extend(n.children)
+    return False
+
+
+def count_leaves(node: Node) -> int:
+    count = 0
+    stack = [node]
+    while stack:
+        n = stack.pop()
+        if n.children:
+            stack.extend(n.children)
+        else:
+            count += 1
+    return count
+
+
+def leaf_bounds(node: Node) -> Tuple[int, int]:
+    """Smallest and largest leaf value in the tree."""
+    values = []
+    stack = [node]
+    while stack:
+        n = stack.pop()
+        if n.children:
+            stack.extend(n.children)
+        else:
+            values.append(n.value)
+    return min(values), max(values)
+
+
+def expectiminimax(node: Node, maximizing: bool, visited: List[int], alpha: float = float('-inf'),
+                   beta: float = float('inf'), bounds: Optional[Tuple[float, float]] = None) -> float:
+    """
+    Expectiminimax with alpha-beta at decision nodes and Star1 pruning at chance nodes.
+
+    A chance node does not switch the player: its children are evaluated for
+    the same side that would have moved at the chance node. Star1 needs known
+    leaf bounds (lower, upper); without them chance nodes are fully expanded.
+    Values outside (alpha, beta) are bounds (fail-soft), the root value is exact.
+    """
+    if not node.children:
+        visited.append(node.value)
+        return node.value
+
+    if node.kind == CHANCE:
+        probs = node.probs or [1.0 / len(node.children)] * len(node.children)
+        if bounds is None:
+            return sum(p * expectiminimax(c, maximizing, visited) for p, c in zip(probs, node.children))
+
+        lower, upper = bounds
+        total = 0.0
+        remaining = sum(probs)
+        for p, child in zip(probs, node.children):
+            remaining -= p
+            if p <= 0:
+                continue
+            # Window for this child such that the chance value stays inside (alpha, beta),
+            # assuming the unexplored children take the extreme leaf values
+            child_alpha = (alpha - total - remaining * upper) / p
+            child_beta = (beta - total - remaining * lower) / p
+            v = expectiminimax(child, maximizing, visited, max(child_alpha, lower), min(child_beta, upper), bounds)
+            total += p * v
+            if v <= child_alpha:
+                return total + remaining * upper
+            if v >= child_beta:
+                return total + remaining * lower
+        return total
+
+    if maximizing:
+        best = float('-inf')
+        for child in node.children:
+            best = max(best, expectiminimax(child, False, visited, alpha, beta, bounds))
+            alpha = max(alpha, best)
+            if beta <= alpha:
+                break
+        return best
+    best = float('inf')
+    for child in node.children:
+        best = min(best, expectiminimax(child, True, visited, alpha, beta, bounds))
+        beta = min(beta, best)
+        if beta <= alpha:
+            break
+    return best
+
+
+def solve_expectiminimax(root: Node) -> Tuple[float, List[int]]:
+    """Root value (rounded to 2 decimals) and visited leaves, using the tree's leaf bounds for Star1."""
+    visited: List[int] = []
+    value = expectiminimax(root, True, visited, bounds=leaf_bounds(root))
+    return round(value, 2), visited
+
+
+# Column layout of each row returned by `alphabeta_trace`
+TRACE_FIELDS = ("value", "alpha", "beta", "pruned")
+
+
+def _bound(x: float) -> Optional[int]:
+    """Infinite alpha/beta bounds are not JSON-serializable; report them as None."""
+    return None if x in (float('inf'), float('-inf')) else int(x)
+
+
+def alphabeta_trace(root: Node) -> Tuple[int, List[int], List[List[Any]]]:
+    """
+    Alpha-beta search that annotates every node in a single traversal.
+
+    Nodes are numbered in preorder (the same order as `tree_to_dict`). Row i of
+    the trace is [value, alpha, beta, pruned] for node i, where alpha/beta is the
+    window on entry (None for an infinite bound). Pruned nodes are never
+    evaluated, so their value and window are None.
+
+    Returns:
+        (root_value, visited_leaf_values, trace)
+    """
+    trace: List[List[Any]] = []
+    visited: List[int] = []
+
+    def mark_pruned(node: Node) -> None:
+        stack = [node]
+        while stack:
+            n = stack.pop()
+            trace.append([None, None, None, True])
+            stack.extend(reversed(n.children))
+
+    def visit(node: Node, alpha: float, beta: float, maximizing: bool) -> int:
+        row = [None, _bound(alpha), _bound(beta), False]
+        trace.append(row)
+        if not node.children:
+            visited.append(node.value)
+            row[0] = node.value
+            return node.value
+
+        best = float('-inf') if maximizing else float('inf')
+        for i, child in enumerate(node.children):
+            eval_v = visit(child, alpha, beta, not maximizing)
+            if maximizing:
+                best = max(best, eval_v)
+                alpha = max(alpha, eval_v)
+            else:
+                best = min(best, eval_v)
+                beta = min(beta, eval_v)
+            if beta <= alpha:
+                for rest in node.children[i + 1:]:
+                    mark_pruned(rest)
+                break
+        row[0] = int(best)
+        return int(best)
+
+    root_value = visit(root, float('-inf'), float('inf'), True)
+    return root_value, visited, trace
+
+
 def tree_to_dict(node: Node) -> Dict[str, Any]:
     """Convert Node tree to a JSON-serializable dict."""
-    return {
+    data = {
         "value": node.value,
         "children": [tree_to_dict(c) for c in node.children] if node.children else []
     }
+    if node.kind is not None:
+        data["kind"] = node.kind
+    if node.probs is not None:
+        data["probs"] = list(node.probs)
+    return data
+
+
+# Signed struct codes by byte width for base64-packed leaves
+_LEAF_CODES = {1: "b", 2: "h", 4: "i"}
+
+
+def _encode_leaves(leaves: List[int], use_base64: bool) -> Dict[str, Any]:
+    if not use_base64:
+        return {"leaves": leaves}
+    lo, hi = min(leaves), max(leaves)
+    width = 1 if -128 <= lo and hi < 128 else 2 if -32768 <= lo and hi < 32768 else 4
+    packed = struct.pack(f"<{len(leaves)}{_LEAF_CODES[width]}", *leaves)
+    return {"leaves_b64": base64.b64encode(packed).decode("ascii"), "leaf_bytes": width}
+
+
+def _decode_leaves(data: Dict[str, Any]) -> List[int]:
+    if "leaves_b64" in data:
+        width = int(data.get("leaf_bytes", 4))
+        packed = base64.b64decode(data["leaves_b64"])
+        return list(struct.unpack(f"<{len(packed) // width}{_LEAF_CODES[width]}", packed))
+    return [int(v) for v in data["leaves"]]
+
+
+def encode_tree(root: Node, use_base64: bool = False) -> Dict[str, Any]:
+    """
+    Compact raw_data for a MAX/MIN tree.
+
+    - {"format": "uniform", "branching": [b0, b1, ...], "leaves": [...]} when
+      every level has a constant branching factor (all generated random trees);
+    - {"format": "compact", "arity": [...], "leaves": [...]} otherwise, with the
+      child count of every node in preorder.
+
+    Leaves are listed left to right; with use_base64 they are packed as
+    little-endian signed ints of "leaf_bytes" bytes (1, 2 or 4) in "leaves_b64". Trees with chance nodes carry
+    probabilities per node, so they keep the nested `tree_to_dict` form.
+    """
+    if has_chance_nodes(root):
+        return tree_to_dict(root)
+
+    # Try the uniform layout level by level: every node of a level is internal
+    # with the same arity, down to a level made only of leaves
+    branching: List[int] = []
+    level = [root]
+    while True:
+        arities = {len(n.children) for n in level}
+        if len(arities) > 1:
+            break
+        b = arities.pop()
+        if b == 0:
+            break
+        branching.append(b)
+        level = [c for n in level for c in n.children]
+    if b == 0:
+        data = {"format": "uniform", "branching": branching}
+        data.update(_encode_leaves([n.value for n in level], use_base64))
+        return data
+
+    arity: List[int] = []
+    leaves: List[int] = []
+    stack = [root]
+    while stack:
+        n = stack.pop()
+        arity.append(len(n.children))
+        if n.children:
+            stack.extend(reversed(n.children))
+        else:
+            leaves.append(n.value)
+    data = {"format": "compact", "arity": arity}
+    data.update(_encode_leaves(leaves, use_base64))
+    return data
+
+
+def _decode_uniform(branching: List[int], leaves: List[int]) -> Node:
+    nodes = [Node(value=v) for v in leaves]
+    for b in reversed(branching):
+        if len(nodes) % b:
+            raise ValueError("Leaf count does not match the branching factors")
+        nodes = [Node(children=nodes[i:i + b]) for i in range(0, len(nodes), b)]
+    if len(nodes) != 1:
+        raise ValueError("Leaf count does not match the branching factors")
+    return nodes[0]
+
+
+def _decode_compact(arity: List[int], leaves: List[int]) -> Node:
+    leaf_values = iter(leaves)
+    root: Optional[Node] = None
+    # Stack of [node, children still expected]
+    stack: List[List[Any]] = []
+    for a in arity:
+        if root is not None and not stack:
+            raise ValueError("Arity list describes more than one tree")
+        if a < 0:
+            raise ValueError("Arity must not be negative")
+        try:
+            node = Node(value=next(leaf_values)) if a == 0 else Node()
+        except StopIteration:
+            raise ValueError("Fewer leaves than leaf nodes in the arity list") from None
+        if stack:
+            parent = stack[-1]
+            parent[0].children.append(node)
+            parent[1] -= 1
+            if parent[1] == 0:
+                stack.pop()
+        else:
+            root = node
+        if a:
+            stack.append([node, a])
+    if root is None or stack:
+        raise ValueError("Arity list does not describe a complete tree")
+    if next(leaf_values, None) is not None:
+        raise ValueError("More leaves than leaf nodes in the arity list")
+    return root
 
 
 def dict_to_tree(data: Dict[str, Any]) -> Node:
-    """Reconstruct Node tree from dict created by `tree_to_dict`."""
+    """
+    Reconstruct Node tree from dict created by `tree_to_dict`, from the compact
+    "uniform"/"compact" layouts of `encode_tree`, or a lazy `ProceduralNode`
+    from a {"format": "procedural", ...} descriptor.
+    """
     if data is None:
         return Node()
+    fmt = data.get("format")
+    if fmt == "procedural":
+        depth, branching = int(data["depth"]), int(data.get("branching", 2))
+        max_leaf_value = int(data.get("max_leaf_value", 10))
+        check_tree_size(depth, branching, procedural=True)
+        if max_leaf_value < 0:
+            raise ValueError("max_leaf_value must not be negative")
+        return ProceduralNode(int(data["seed"]), depth, branching, max_leaf_value)
+    if fmt == "uniform":
+        return _decode_uniform([int(b) for b in data["branching"]], _decode_leaves(data))
+    if fmt == "compact":
+        return _decode_compact([int(a) for a in data["arity"]], _decode_leaves(data))
     value = data.get("value")
     children = [dict_to_tree(c) for c in data.get("children", [])]
-    return Node(value=value, children=children)
+    return Node(value=value, children=children, kind=data.get("kind"), probs=data.get("probs"))
@@ -1,8 +1,75 @@
-from typing import List, Tuple, Dict
+from typing import Any, List, Optional, Tuple, Dict
+from fractions import Fraction
+from itertools import combinations
+
+import numpy as np
+
+from core_logic.lp_logic import simplex, interior_point
 
 # Definim tipurile de date pentru claritate
 Matrix = List[List[Tuple[int, int]]]
 Coordinates = List[Tuple[int, int]]
+# Joc cu N jucători: câte un tablou s1 x ... x sN pentru fiecare jucător
+TensorGame = List[np.ndarray]
+
+# Sub acest număr de comparații (n * n * m) verificăm dominanța dintr-o singură difuzare
+_BROADCAST_LIMIT = 4_000_000
+
+
+def payoff_arrays(payoff_matrix: Matrix) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Convertește matricea de plăți în două tablouri NumPy (r x c):
+    plățile jucătorului 1 și plățile jucătorului 2.
+    Un tablou (r x c x 2) deja construit este folosit fără copiere.
+    """
+    arr = np.asarray(payoff_matrix)
+    return arr[..., 0], arr[..., 1]
+
+
+def tensor_payoffs(payoff_data: Any) -> TensorGame:
+    """
+    Convertește datele imbricate ale unui joc cu N jucători (tablou
+    s1 x ... x sN x N, ultima axă fiind plățile jucătorilor) în câte un
+    tablou NumPy per jucător. Matricea bimatricială (r x c x 2) este cazul N = 2.
+    """
+    arr = np.asarray(payoff_data)
+    if arr.ndim < 2 or arr.shape[-1] != arr.ndim - 1:
+        raise ValueError(f"Payoff data of shape {arr.shape} is not an N-player game")
+    return [arr[..., k] for k in range(arr.shape[-1])]
+
+
+def num_players(payoff_data: Any) -> int:
+    """Numărul de jucători din datele imbricate (lungimea unei celule)."""
+    return int(np.asarray(payoff_data).shape[-1])
+
+
+def _strictly_dominated_rows(payoffs: np.ndarray) -> np.ndarray:
+    """
+    Mască booleană: rândul i este strict dominat de alt rând al lui `payoffs`.
+    
+    Pentru matrici mici comparăm toate perechile de rânduri dintr-o difuzare;
+    pentru cele mari filtrăm candidații pe blocuri de coloane tot mai mari,
+    astfel încât rândurile care nu pot domina sunt eliminate devreme.
+    """
+    n, m = payoffs.shape
+    if n * n * m <= _BROADCAST_LIMIT:
+        # dominates[j, i] = rândul j domină strict rândul i
+        dominates = (payoffs[:, None, :] > payoffs[None, :, :]).all(axis=2)
+        return dominates.any(axis=0)
+
+    # Primul bloc de coloane se verifică pentru toate perechile deodată
+    first = max(1, _BROADCAST_LIMIT // (n * n))
+    survivors = (payoffs[:, None, :first] > payoffs[None, :, :first]).all(axis=2)
+    dominated = np.zeros(n, dtype=bool)
+    for i in np.flatnonzero(survivors.any(axis=0)):
+        candidates = np.flatnonzero(survivors[:, i])
+        start, step = first, 8
+        while candidates.size and start < m:
+            block = slice(start, start + step)
+            candidates = candidates[(payoffs[candidates, block] > payoffs[i, block]).all(axis=1)]
+            start, step = start + step, step * 2
+        dominated[i] = candidates.size > 0
+    return dominated
 
 
 def find_dominated_strategies(payoff_matrix: Matrix) -> Dict[str, List[int]]:
@@ -11,67 +78,44 @@ def find_dominated_strategies(payoff_matrix: Matrix) -> Dict[str, List[int]]:
     
     O strategie este STRICT DOMINATĂ dacă există o altă strategie care dă
     un payoff STRICT mai mare pentru TOATE strategiile posibile ale oponentului.
+    Funcționează și pentru jocuri cu N jucători (vezi `tensor_payoffs`).
     
     Args:
         payoff_matrix: Matricea de plăți (lista de liste de tuple [p1, p2])
     
     Returns:
-        Dict cu cheile 'player1' și 'player2', fiecare conținând lista de 
-        indici ai strategiilor dominate (0-indexed)
+        Dict cu cheile 'player1', 'player2' (, 'player3', ...), fiecare
+        conținând lista de indici ai strategiilor dominate (0-indexed)
         
     Exemplu:
         Pentru matricea unde rândul 0 este dominat de rândul 1:
         {'player1': [0], 'player2': []}
     """
-    if not payoff_matrix or not payoff_matrix[0]:
+    if len(payoff_matrix) == 0 or len(payoff_matrix[0]) == 0:
         return {'player1': [], 'player2': []}
     
-    num_rows = len(payoff_matrix)
-    num_cols = len(payoff_matrix[0])
-    
-    dominated_p1 = []  # Strategii dominate pentru jucătorul 1 (rânduri)
-    dominated_p2 = []  # Strategii dominate pentru jucătorul 2 (coloane)
-    
-    # Verificăm strategiile jucătorului 1 (rânduri)
-    # Strategia i este dominată de strategia j dacă:
-    # payoff_p1[j][c] > payoff_p1[i][c] pentru TOATE coloanele c
-    for i in range(num_rows):
-        for j in range(num_rows):
-            if i == j:
-                continue
-            # Verificăm dacă rândul j domină strict rândul i
-            is_dominated = True
-            for c in range(num_cols):
-                if payoff_matrix[j][c][0] <= payoff_matrix[i][c][0]:
-                    is_dominated = False
-                    break
-            if is_dominated:
-                if i not in dominated_p1:
-                    dominated_p1.append(i)
-                break  # Am găsit că i este dominat, nu mai căutăm
-    
-    # Verificăm strategiile jucătorului 2 (coloane)
-    # Strategia i este dominată de strategia j dacă:
-    # payoff_p2[r][j] > payoff_p2[r][i] pentru TOATE rândurile r
-    for i in range(num_cols):
-        for j in range(num_cols):
-            if i == j:
-                continue
-            # Verificăm dacă coloana j domină strict coloana i
-            is_dominated = True
-            for r in range(num_rows):
-                if payoff_matrix[r][j][1] <= payoff_matrix[r][i][1]:
-                    is_dominated = False
-                    break
-            if is_dominated:
-                if i not in dominated_p2:
-                    dominated_p2.append(i)
-                break  # Am găsit că i este dominat, nu mai căutăm
+    dominated = {}
+    for k, payoffs in enumerate(tensor_payoffs(payoff_matrix)):
+        # Strategiile jucătorului k devin rânduri, profilurile celorlalți coloane
+        # (pentru jucătorul 2 dintr-un joc bimatricial, asta înseamnă p2.T)
+        rows = np.moveaxis(payoffs, k, 0).reshape(payoffs.shape[k], -1)
+        dominated[f'player{k + 1}'] = [int(i) for i in np.flatnonzero(_strictly_dominated_rows(rows))]
+    return dominated
+
+
+def find_pure_nash_tensor(payoffs: TensorGame) -> List[Tuple[int, ...]]:
+    """
+    Echilibrele Nash pure ale unui joc cu N jucători dat prin câte un tablou
+    de plăți per jucător (toate de forma s1 x ... x sN).
     
-    return {
-        'player1': sorted(dominated_p1),
-        'player2': sorted(dominated_p2)
-    }
+    Jucătorul k răspunde optim într-un profil dacă plata lui este maximul de
+    pe axa k (ceilalți jucători rămânând fixați); o singură reducere max pe
+    axă per jucător acoperă toate profilurile deodată.
+    """
+    best = np.ones(payoffs[0].shape, dtype=bool)
+    for k, player_payoffs in enumerate(payoffs):
+        best &= player_payoffs == player_payoffs.max(axis=k, keepdims=True)
+    return [tuple(int(i) for i in profile) for profile in np.argwhere(best)]
 
 
 def find_pure_nash(payoff_matrix: Matrix) -> Coordinates:
@@ -82,52 +126,598 @@ def find_pure_nash(payoff_matrix: Matrix) -> Coordinates:
         payoff_matrix: O listă de liste de tuple. 
                        Ex: [[(1, 2), (0, 5)], [(3, 1), (2, 0)]]
                        (Jucătorul 1 alege rândul, Jucătorul 2 alege coloana)
+                       Pentru N jucători: tablou imbricat s1 x ... x sN x N.
 
     Returns:
         O listă de tuple (rând, coloană) reprezentând coordonatele 
-        tuturor echilibrelor Nash pure.
+        tuturor echilibrelor Nash pure (câte un indice per jucător).
     """
     
-    if not payoff_matrix or not payoff_matrix[0]:
+    if len(payoff_matrix) == 0 or len(payoff_matrix[0]) == 0:
         return []
 
-    num_rows = len(payoff_matrix)
-    num_cols = len(payoff_matrix[0])
+    # Echilibru Nash: niciun jucător nu are stimulent să devieze unilateral
+    return find_pure_nash_tensor(tensor_payoffs(payoff_matrix))
+
+
+def _find_witnesses(payoffs: np.ndarray, active: np.ndarray, js: np.ndarray,
+                    is_: np.ndarray, start: np.ndarray) -> np.ndarray:
+    """
+    Pentru fiecare pereche de rânduri (js[k], is_[k]) caută, începând cu coloana
+    start[k], prima coloană activă c în care payoffs[j, c] <= payoffs[i, c],
+    adică un „martor” că j NU domină strict i. Întoarce m dacă nu există martor.
+    """
+    m = payoffs.shape[1]
+    witness = np.full(js.size, m)
+    pos = start.copy()
+    pending = np.arange(js.size)
+    while pending.size:
+        pending = pending[pos[pending] < m]
+        c = pos[pending]
+        hit = active[c] & (payoffs[js[pending], c] <= payoffs[is_[pending], c])
+        witness[pending[hit]] = c[hit]
+        pending = pending[~hit]
+        pos[pending] += 1
+    return witness
+
+
+def _initial_witnesses(payoffs: np.ndarray) -> np.ndarray:
+    n, m = payoffs.shape
+    js, is_ = np.indices((n, n)).reshape(2, -1)
+    active = np.ones(m, dtype=bool)
+    return _find_witnesses(payoffs, active, js, is_, np.zeros(js.size, dtype=np.int64)).reshape(n, n)
+
+
+def _refresh_witnesses(witness: np.ndarray, payoffs: np.ndarray, active: np.ndarray,
+                       removed: np.ndarray) -> None:
+    """Mută mai departe doar martorii care cădeau pe coloanele tocmai eliminate."""
+    js, is_ = np.nonzero(np.isin(witness, removed))
+    if js.size:
+        witness[js, is_] = _find_witnesses(payoffs, active, js, is_, witness[js, is_] + 1)
+
+
+def iterated_elimination(payoff_matrix: Matrix) -> Dict[str, Any]:
+    """
+    Eliminarea iterată a strategiilor strict dominate (IESDS).
+    
+    În fiecare rundă se elimină simultan toate strategiile strict dominate
+    (pentru ambii jucători) în jocul rămas, până când nu mai există niciuna.
+    Pentru dominanța strictă rezultatul nu depinde de ordinea eliminărilor.
+    
+    Relațiile de dominanță sunt ținute incremental: pentru fiecare pereche de
+    rânduri (j, i) păstrăm o coloană rămasă în care j NU îl întrece strict pe i
+    („martor”); j domină i când nu mai există martor. La eliminarea unei coloane
+    se caută un martor nou doar pentru perechile care o foloseau, iar martorii
+    avansează monoton, deci jocurile mari se reduc în timp aproape pătratic.
+    
+    Args:
+        payoff_matrix: Matricea de plăți (lista de liste de tuple [p1, p2])
+    
+    Returns:
+        Dict cu:
+        - 'player1' / 'player2': indicii originali ai strategiilor rămase
+        - 'eliminated': ordinea eliminărilor, fiecare intrare fiind
+          {'round', 'player', 'strategy', 'dominated_by'} (indici originali)
+        - 'rounds': numărul de runde în care s-a eliminat ceva
+    """
+    if len(payoff_matrix) == 0 or len(payoff_matrix[0]) == 0:
+        return {'player1': [], 'player2': [], 'eliminated': [], 'rounds': 0}
+    
+    p1, p2 = payoff_arrays(payoff_matrix)
+    # Coloanele lui p2 devin rânduri, ca ambii jucători să fie tratați la fel
+    p2 = p2.T
+    active_rows = np.ones(p1.shape[0], dtype=bool)
+    active_cols = np.ones(p1.shape[1], dtype=bool)
+    row_witness = _initial_witnesses(p1)
+    col_witness = _initial_witnesses(p2)
+    
+    eliminated = []
+    rounds = 0
+    while True:
+        # row_dom[j, i]: j (activ) domină strict i (activ) în jocul rămas
+        row_dom = (row_witness == p1.shape[1]) & active_rows[:, None] & active_rows[None, :]
+        col_dom = (col_witness == p2.shape[1]) & active_cols[:, None] & active_cols[None, :]
+        dead_rows = np.flatnonzero(row_dom.any(axis=0))
+        dead_cols = np.flatnonzero(col_dom.any(axis=0))
+        if dead_rows.size == 0 and dead_cols.size == 0:
+            break
+        rounds += 1
+        
+        for i in dead_rows:
+            eliminated.append({'round': rounds, 'player': 1, 'strategy': int(i),
+                               'dominated_by': int(np.argmax(row_dom[:, i]))})
+        for i in dead_cols:
+            eliminated.append({'round': rounds, 'player': 2, 'strategy': int(i),
+                               'dominated_by': int(np.argmax(col_dom[:, i]))})
+        
+        active_rows[dead_rows] = False
+        active_cols[dead_cols] = False
+        # Un rând eliminat nu mai poate fi martor pentru coloane și invers
+        _refresh_witnesses(col_witness, p2, active_rows, dead_rows)
+        _refresh_witnesses(row_witness, p1, active_cols, dead_cols)
+    
+    return {
+        'player1': [int(i) for i in np.flatnonzero(active_rows)],
+        'player2': [int(i) for i in np.flatnonzero(active_cols)],
+        'eliminated': eliminated,
+        'rounds': rounds
+    }
+
+
+# --- Echilibre în strategii mixte ---
+
+# Până la această dimensiune (r * c) enumerăm suporturile exact; peste ea, Lemke-Howson
+SUPPORT_ENUMERATION_LIMIT = 36
+
+# Pivoți permiși pentru o etichetă inițială Lemke-Howson înainte de a încerca alta
+LH_MAX_PIVOTS = 1000
+
+# Rapoarte mai apropiate de atât sunt egale în testul lexicografic (erori de rotunjire)
+_LH_TIE_TOLERANCE = 1e-9
+MixedProfile = Dict[str, Any]
+
+
+def _solve_exact(matrix: List[List[Fraction]], rhs: List[Fraction]) -> Optional[List[Fraction]]:
+    """Eliminare Gauss cu fracții; întoarce None dacă sistemul e singular."""
+    n = len(matrix)
+    aug = [row[:] + [b] for row, b in zip(matrix, rhs)]
+    for col in range(n):
+        pivot = next((r for r in range(col, n) if aug[r][col] != 0), None)
+        if pivot is None:
+            return None
+        aug[col], aug[pivot] = aug[pivot], aug[col]
+        for r in range(n):
+            if r != col and aug[r][col] != 0:
+                factor = aug[r][col] / aug[col][col]
+                aug[r] = [a - factor * b for a, b in zip(aug[r], aug[col])]
+    return [aug[i][n] / aug[i][i] for i in range(n)]
+
+
+def _indifferent_mix(payoffs: List[List[Fraction]], own: Tuple[int, ...],
+                     other: Tuple[int, ...]) -> Optional[Tuple[List[Fraction], Fraction]]:
+    """
+    Găsește distribuția pe suportul `other` care îl face indiferent pe jucătorul
+    cu strategiile `own`: sum_j payoffs[i][j] * q_j = v pentru orice i din own,
+    sum_j q_j = 1. Necunoscutele sunt (q_j pentru j din other) și v.
+    """
+    k = len(other)
+    rows = [[payoffs[i][j] for j in other] + [Fraction(-1)] for i in own]
+    rows.append([Fraction(1)] * k + [Fraction(0)])
+    solution = _solve_exact(rows, [Fraction(0)] * len(own) + [Fraction(1)])
+    if solution is None or any(q < 0 for q in solution[:k]):
+        return None
+    return solution[:k], solution[k]
+
+
+def support_enumeration(payoff_matrix: Matrix) -> List[MixedProfile]:
+    """
+    Toate echilibrele Nash (pure și mixte) prin enumerarea suporturilor,
+    în aritmetică rațională exactă.
+    
+    Pentru fiecare pereche de suporturi de aceeași dimensiune k rezolvăm
+    condițiile de indiferență și păstrăm soluțiile în care nicio strategie
+    din afara suportului nu aduce un câștig mai mare. Pentru jocurile
+    nedegenerate acestea sunt toate echilibrele; costul crește exponențial,
+    deci se folosește doar pentru jocuri mici.
+    
+    Returns:
+        Listă de dict-uri {'p1': [Fraction], 'p2': [Fraction], 'payoff': (v1, v2)}
+    """
+    if len(payoff_matrix) == 0 or len(payoff_matrix[0]) == 0:
+        return []
+    
+    num_rows, num_cols = len(payoff_matrix), len(payoff_matrix[0])
+    a = [[Fraction(int(cell[0])) for cell in row] for row in payoff_matrix]
+    # bt[j][i] = plata jucătorului 2 pentru (i, j), ca să refolosim _indifferent_mix
+    bt = [[Fraction(int(payoff_matrix[i][j][1])) for i in range(num_rows)] for j in range(num_cols)]
     
     equilibria = []
+    for k in range(1, min(num_rows, num_cols) + 1):
+        for rows in combinations(range(num_rows), k):
+            for cols in combinations(range(num_cols), k):
+                # y face rândurile din suport indiferente, x face coloanele indiferente
+                col_mix = _indifferent_mix(a, rows, cols)
+                if col_mix is None:
+                    continue
+                row_mix = _indifferent_mix(bt, cols, rows)
+                if row_mix is None:
+                    continue
+                y = [Fraction(0)] * num_cols
+                x = [Fraction(0)] * num_rows
+                for j, q in zip(cols, col_mix[0]):
+                    y[j] = q
+                for i, p in zip(rows, row_mix[0]):
+                    x[i] = p
+                v1, v2 = col_mix[1], row_mix[1]
+                # Nicio deviere profitabilă în afara suportului
+                if any(sum(a[i][j] * y[j] for j in range(num_cols)) > v1 for i in range(num_rows)):
+                    continue
+                if any(sum(bt[j][i] * x[i] for i in range(num_rows)) > v2 for j in range(num_cols)):
+                    continue
+                profile = {'p1': x, 'p2': y, 'payoff': (v1, v2)}
+                if all(profile['p1'] != e['p1'] or profile['p2'] != e['p2'] for e in equilibria):
+                    equilibria.append(profile)
+    return equilibria
+
+
+def _lh_pivot(tableau: np.ndarray, basis: List[int], entering: int, slack_cols: List[int]) -> int:
+    """
+    Un pivot Lemke-Howson: coloana `entering` intră în bază, iar linia iese după
+    testul de raport minim cu departajare lexicografică (evită ciclarea în
+    jocurile degenerate). Întoarce eticheta care a ieșit din bază.
+    """
+    column = tableau[:, entering]
+    candidates = np.flatnonzero(column > 1e-12)
+    if candidates.size == 0:
+        raise ValueError("Lemke-Howson: pivot column without a positive entry")
+    # Raportul (rhs, coloanele slack) / coeficient, comparat lexicografic; egalitățile
+    # se decid cu toleranță, altfel rotunjirile rup departajarea și algoritmul ciclează
+    ratios = tableau[candidates][:, [-1] + slack_cols] / column[candidates, None]
+    tied = np.arange(candidates.size)
+    for k in range(ratios.shape[1]):
+        values = ratios[tied, k]
+        best = values.min()
+        tied = tied[values <= best + _LH_TIE_TOLERANCE * max(1.0, abs(best))]
+        if tied.size == 1:
+            break
+    row = candidates[tied[0]]
+    pivot_row = tableau[row] / tableau[row, entering]
+    tableau -= np.outer(tableau[:, entering], pivot_row)
+    tableau[row] = pivot_row
+    leaving = basis[row]
+    basis[row] = entering
+    return leaving
 
-    # Iterăm prin fiecare celulă (r, c) din matrice
-    for r in range(num_rows):
-        for c in range(num_cols):
-            payoff_p1, payoff_p2 = payoff_matrix[r][c]
-            
-            # --- Verificare pentru Jucătorul 1 (Rânduri) ---
-            # Este P1 mulțumit de alegerea sa (rândul 'r')?
-            # Verificăm dacă P1 ar câștiga mai mult mutându-se pe alt rând,
-            # în timp ce P2 RĂMÂNE pe coloana 'c'.
-            is_p1_best_response = True
-            for i in range(num_rows):
-                if payoff_matrix[i][c][0] > payoff_p1:
-                    is_p1_best_response = False
-                    break # P1 are o mutare mai bună, deci (r, c) nu e echilibru
-            
-            # Dacă P1 nu e mulțumit, trecem la următoarea celulă
-            if not is_p1_best_response:
+
+def lemke_howson(payoff_matrix: Matrix, initial_label: Optional[int] = None,
+                 max_pivots: int = LH_MAX_PIVOTS) -> MixedProfile:
+    """
+    Un echilibru Nash prin algoritmul Lemke-Howson (aritmetică în virgulă mobilă).
+    
+    Etichetele 0..r-1 sunt strategiile jucătorului 1, r..r+c-1 ale jucătorului 2.
+    Pornind de la (0, 0) se eliberează eticheta `initial_label` și se pivotează
+    alternativ în cele două tablouri până când eticheta lipsă reapare.
+    Fără `initial_label` se încearcă pe rând toate etichetele, trecând la
+    următoarea dacă drumul depășește `max_pivots` pivoți.
+    
+    Returns:
+        Dict {'p1': [float], 'p2': [float], 'payoff': (v1, v2)}
+    
+    Raises:
+        ValueError: dacă niciun drum nu se termină în `max_pivots` pivoți
+    """
+    if initial_label is None:
+        num_labels = len(payoff_matrix) + len(payoff_matrix[0])
+        for label in range(num_labels):
+            try:
+                return lemke_howson(payoff_matrix, label, max_pivots)
+            except ValueError:
                 continue
+        raise ValueError(f"Lemke-Howson did not converge within {max_pivots} pivots for any initial label")
+
+    p1, p2 = payoff_arrays(payoff_matrix)
+    p1, p2 = p1.astype(float), p2.astype(float)
+    num_rows, num_cols = p1.shape
+    # Plățile strict pozitive garantează politopi mărginiți; echilibrele nu se schimbă
+    a = p1 - p1.min() + 1
+    b = p2 - p2.min() + 1
+    
+    # Coloanele ambelor tablouri sunt indexate după etichetă, plus termenul liber
+    # Jucătorul 1: B^T x + s = 1 (x: etichete 0..r-1, s: etichete r..r+c-1)
+    row_tableau = np.hstack([b.T, np.eye(num_cols), np.ones((num_cols, 1))])
+    row_basis = list(range(num_rows, num_rows + num_cols))
+    # Jucătorul 2: A y + t = 1 (t: etichete 0..r-1, y: etichete r..r+c-1)
+    col_tableau = np.hstack([np.eye(num_rows), a, np.ones((num_rows, 1))])
+    col_basis = list(range(num_rows))
+    
+    tableaux = [(row_tableau, row_basis, list(range(num_rows, num_rows + num_cols))),
+                (col_tableau, col_basis, list(range(num_rows)))]
+    side = 0 if initial_label < num_rows else 1
+    entering = initial_label
+    for _ in range(max_pivots):
+        tableau, basis, slack_cols = tableaux[side]
+        leaving = _lh_pivot(tableau, basis, entering, slack_cols)
+        if leaving == initial_label:
+            break
+        side, entering = 1 - side, leaving
+    else:
+        raise ValueError(f"Lemke-Howson did not converge within {max_pivots} pivots (initial label {initial_label})")
+    
+    x = np.zeros(num_rows)
+    y = np.zeros(num_cols)
+    for row, label in enumerate(row_basis):
+        if label < num_rows:
+            x[label] = row_tableau[row, -1]
+    for row, label in enumerate(col_basis):
+        if label >= num_rows:
+            y[label - num_rows] = col_tableau[row, -1]
+    x /= x.sum()
+    y /= y.sum()
+    return {'p1': x.tolist(), 'p2': y.tolist(),
+            'payoff': (float(x @ p1 @ y), float(x @ p2 @ y))}
+
+
+def find_mixed_nash(payoff_matrix: Matrix) -> List[MixedProfile]:
+    """
+    Echilibre Nash în strategii mixte pentru un joc bimatricial.
+    
+    Jocurile mici (r * c <= SUPPORT_ENUMERATION_LIMIT) sunt rezolvate exact prin
+    enumerarea suporturilor (toate echilibrele, cu probabilități Fraction).
+    Pentru jocurile mari, sau dacă enumerarea nu găsește nimic într-un joc
+    degenerat, se întoarce echilibrul găsit de Lemke-Howson (probabilități float).
+    
+    Raises:
+        ValueError: dacă Lemke-Howson nu converge (vezi `lemke_howson`)
+    """
+    if len(payoff_matrix) == 0 or len(payoff_matrix[0]) == 0:
+        return []
+    if len(payoff_matrix) * len(payoff_matrix[0]) <= SUPPORT_ENUMERATION_LIMIT:
+        equilibria = support_enumeration(payoff_matrix)
+        if equilibria:
+            return equilibria
+    return [lemke_howson(payoff_matrix)]
+
+
+def is_mixed_nash(payoff_matrix: Matrix, p1_mix: List[float], p2_mix: List[float],
+                  tolerance: float = 1e-6) -> bool:
+    """
+    Verifică dacă profilul (p1_mix, p2_mix) este echilibru Nash: niciun
+    jucător nu câștigă mai mult de `tolerance` trecând la o strategie pură.
+    """
+    p1, p2 = payoff_arrays(payoff_matrix)
+    x = np.asarray(p1_mix, dtype=float)
+    y = np.asarray(p2_mix, dtype=float)
+    if x.shape != (p1.shape[0],) or y.shape != (p1.shape[1],):
+        return False
+    if (x < -tolerance).any() or (y < -tolerance).any():
+        return False
+    if abs(x.sum() - 1) > tolerance or abs(y.sum() - 1) > tolerance:
+        return False
+    row_gain = (p1 @ y).max() - x @ p1 @ y
+    col_gain = (x @ p2).max() - x @ p2 @ y
+    return bool(row_gain <= tolerance and col_gain <= tolerance)
+
+
+def _mixed_dominated_rows(payoffs: np.ndarray) -> Dict[int, List[float]]:
+    """
+    Rândurile strict dominate de o strategie mixtă, cu amestecul care le domină.
+    
+    Cu plăți strict pozitive P, rândul i este strict dominat dacă și numai dacă
+    min sum(σ) cu σ^T P >= P[i], σ >= 0 este < 1 (σ = e_i dă mereu 1).
+    Rezolvăm duala: max P[i]·y cu P y <= 1, y >= 0. Regiunea fezabilă este
+    aceeași pentru toate rândurile, deci orice y optim de la un test anterior
+    rămâne fezabil: dacă P[i]·y >= 1 pentru vreunul, rândul i nu e dominat și
+    LP-ul nu mai trebuie rezolvat. Punctele inițiale y = e_c / max P[:, c]
+    elimină direct rândurile care sunt cel mai bun răspuns la o coloană pură.
+    """
+    p = payoffs.astype(float) - payoffs.min() + 1
+    n = p.shape[0]
+    # Soluții fezabile ale dualei, refolosite ca certificate de nedominare
+    certificates = np.diag(1 / p.max(axis=0))
+    dominated = {}
+    for i in range(n):
+        if (certificates @ p[i]).max() >= 1 - 1e-9:
+            continue
+        result = simplex(p[i], p, np.ones(n))
+        if result['status'] != 'optimal':
+            continue
+        if result['value'] >= 1 - 1e-9:
+            certificates = np.vstack([certificates, result['x']])
+            continue
+        # Variabilele duale sunt σ; fără componenta proprie, normalizate, dau amestecul
+        sigma = np.clip(result['duals'], 0, None)
+        sigma[i] = 0
+        if sigma.sum() > 1e-12:
+            dominated[i] = (sigma / sigma.sum()).tolist()
+    return dominated
+
+
+def find_mixed_dominated_strategies(payoff_matrix: Matrix) -> Dict[str, Any]:
+    """
+    Găsește strategiile strict dominate de o strategie pură SAU mixtă.
+    
+    Fiecare test este o problemă de programare liniară rezolvată cu simplexul
+    din `lp_logic`; soluțiile testelor anterioare sunt refolosite ca puncte de
+    pornire, astfel că majoritatea strategiilor nu mai cer un LP propriu.
+    
+    Returns:
+        Dict cu 'player1' / 'player2' (indici dominați, 0-indexed) și 'mixes':
+        {'player1': {i: amestec}, 'player2': {j: amestec}}, unde amestecul dă
+        probabilitățile strategiilor care domină strategia i (respectiv j).
+    """
+    if len(payoff_matrix) == 0 or len(payoff_matrix[0]) == 0:
+        return {'player1': [], 'player2': [], 'mixes': {'player1': {}, 'player2': {}}}
+    
+    p1, p2 = payoff_arrays(payoff_matrix)
+    mixes_p1 = _mixed_dominated_rows(p1)
+    mixes_p2 = _mixed_dominated_rows(p2.T)
+    return {
+        'player1': sorted(mixes_p1),
+        'player2': sorted(mixes_p2),
+        'mixes': {'player1': mixes_p1, 'player2': mixes_p2}
+    }
+
+
+# --- Jocuri de sumă nulă ---
 
-            # --- Verificare pentru Jucătorul 2 (Coloane) ---
-            # Este P2 mulțumit de alegerea sa (coloana 'c')?
-            # Verificăm dacă P2 ar câștiga mai mult mutându-se pe altă coloană,
-            # în timp ce P1 RĂMÂNE pe rândul 'r'.
-            is_p2_best_response = True
-            for j in range(num_cols):
-                if payoff_matrix[r][j][1] > payoff_p2:
-                    is_p2_best_response = False
-                    break # P2 are o mutare mai bună, deci (r, c) nu e echilibru
-            
-            # Dacă AMBII jucători sunt mulțumiți (nu au niciun stimulent
-            # să își schimbe unilateral strategia), am găsit un echilibru Nash.
-            if is_p2_best_response:
-                equilibria.append((r, c))
-
-    return equilibria
\ No newline at end of file
+def is_zero_sum(payoff_matrix: Matrix) -> bool:
+    """Verifică dacă plata jucătorului 2 este mereu opusul plății jucătorului 1."""
+    if len(payoff_matrix) == 0 or len(payoff_matrix[0]) == 0:
+        return False
+    p1, p2 = payoff_arrays(payoff_matrix)
+    return bool((p1 == -p2).all())
+
+
+def find_saddle_points(payoff_matrix: Matrix) -> Coordinates:
+    """
+    Punctele șa ale matricei jucătorului 1 (jucătorul 1 maximizează, 2 minimizează):
+    celulele care sunt minimul rândului și maximul coloanei. Cost O(r * c).
+    """
+    p1, _ = payoff_arrays(payoff_matrix)
+    row_min = p1.min(axis=1, keepdims=True)
+    col_max = p1.max(axis=0, keepdims=True)
+    return [(int(r), int(c)) for r, c in np.argwhere((p1 == row_min) & (p1 == col_max))]
+
+
+def solve_zero_sum(payoff_matrix: Matrix) -> Dict[str, Any]:
+    """
+    Valoarea jocului și strategiile optime pentru un joc de sumă nulă.
+    
+    Întâi căutăm un punct șa (maximin == minimax), caz în care strategiile
+    optime sunt pure. Altfel rezolvăm programul liniar al jucătorului 2: cu
+    plățile deplasate P > 0, max sum(w) cu P w <= 1, w >= 0; valoarea jocului
+    este 1 / sum(w), strategia jucătorului 2 este w normalizat, iar cea a
+    jucătorului 1 rezultă din variabilele duale.
+    
+    Returns:
+        Dict cu 'value', 'p1', 'p2' (strategii optime), 'saddle_points' și
+        'maximin' / 'minimax' (garanțiile în strategii pure).
+    """
+    p1, _ = payoff_arrays(payoff_matrix)
+    num_rows, num_cols = p1.shape
+    maximin = int(p1.min(axis=1).max())
+    minimax = int(p1.max(axis=0).min())
+    saddle_points = find_saddle_points(payoff_matrix)
+    
+    if saddle_points:
+        r, c = saddle_points[0]
+        x = [0.0] * num_rows
+        y = [0.0] * num_cols
+        x[r] = y[c] = 1.0
+        value = float(p1[r, c])
+    else:
+        shift = 1 - p1.min()
+        shifted = p1.astype(float) + shift
+        result = simplex(np.ones(num_cols), shifted, np.ones(num_rows))
+        scale = 1 / result['value']
+        y = (result['x'] * scale).tolist()
+        x = (np.clip(result['duals'], 0, None) * scale).tolist()
+        value = scale - shift
+    
+    return {
+        'value': round(float(value), 4),
+        'p1': [round(p, 4) for p in x],
+        'p2': [round(p, 4) for p in y],
+        'saddle_points': saddle_points,
+        'maximin': maximin,
+        'minimax': minimax
+    }
+
+
+# --- Echilibru corelat ---
+
+# Toleranța încălcărilor (constrângerile sunt scalate la norma maximă 1)
+_CE_TOLERANCE = 1e-7
+
+
+def _incentive_constraints(p1: np.ndarray, p2: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray, int]:
+    """
+    Constrângerile de stimulent ale echilibrului corelat, în format rar (COO).
+    
+    Variabilele sunt probabilitățile profilurilor, indexate r * num_cols + c.
+    Pentru jucătorul 1 și fiecare pereche i != i2 (recomandat i, deviază la i2):
+        sum_c prob(i, c) * (p1[i2, c] - p1[i, c]) <= 0
+    iar pentru jucătorul 2, analog pe coloane. Fiecare rând are doar r sau c
+    elemente nenule, deci construim direct tablourile (rând, coloană, valoare).
+    
+    Returns:
+        (rows, cols, values, num_constraints)
+    """
+    num_rows, num_cols = p1.shape
+    # Jucătorul 1: perechi (i, i2) cu i != i2, câte num_cols termeni
+    i, i2 = np.nonzero(~np.eye(num_rows, dtype=bool))
+    k1 = i.size
+    rows_1 = np.repeat(np.arange(k1), num_cols)
+    cols_1 = (i[:, None] * num_cols + np.arange(num_cols)).ravel()
+    vals_1 = (p1[i2] - p1[i]).ravel()
+    # Jucătorul 2: perechi (j, j2) cu j != j2, câte num_rows termeni
+    j, j2 = np.nonzero(~np.eye(num_cols, dtype=bool))
+    k2 = j.size
+    rows_2 = k1 + np.repeat(np.arange(k2), num_rows)
+    cols_2 = (np.arange(num_rows)[None, :] * num_cols + j[:, None]).ravel()
+    vals_2 = (p2[:, j2] - p2[:, j]).T.ravel()
+    return (np.concatenate([rows_1, rows_2]), np.concatenate([cols_1, cols_2]),
+            np.concatenate([vals_1, vals_2]).astype(float), k1 + k2)
+
+
+def correlated_equilibrium(payoff_matrix: Matrix, maximize_welfare: bool = True,
+                           batch: int = 50, max_rounds: int = 200) -> Dict[str, Any]:
+    """
+    Un echilibru corelat pentru un joc bimatricial, prin programare liniară.
+    
+    Distribuția p peste profiluri trebuie să respecte constrângerile de stimulent
+    (niciun jucător nu câștigă urmând altă strategie decât cea recomandată),
+    p >= 0 și sum(p) = 1; opțional maximizăm bunăstarea socială sum p * (p1 + p2).
+    
+    Cele r(r-1) + c(c-1) constrângeri sunt construite rar și vectorizat, dar LP-ul
+    dens primește doar constrângerile încălcate: rezolvăm, calculăm toate
+    încălcările dintr-un singur produs rar și adăugăm cele mai mari `batch`,
+    până când nu mai e încălcată niciuna (generare de constrângeri).
+    LP-ul e foarte degenerat (toate constrângerile trec prin origine), așa că
+    folosim metoda de punct interior din `lp_logic` în locul simplexului.
+    
+    Returns:
+        Dict cu 'distribution' (r x c), 'payoffs' (v1, v2), 'welfare',
+        'constraints_used' și 'rounds'.
+
+    Raises:
+        ValueError: dacă LP-ul eșuează sau după `max_rounds` runde încă sunt
+            constrângeri încălcate (distribuția nu ar fi un echilibru corelat)
+    """
+    p1, p2 = payoff_arrays(payoff_matrix)
+    p1, p2 = p1.astype(float), p2.astype(float)
+    num_rows, num_cols = p1.shape
+    n = num_rows * num_cols
+    rows, cols, vals, num_constraints = _incentive_constraints(p1, p2)
+    # Scalăm fiecare constrângere la norma maximă 1 (mulțimea fezabilă nu se schimbă),
+    # ca toleranța încălcărilor să fie relativă la aceeași scară
+    row_scale = np.zeros(num_constraints)
+    np.maximum.at(row_scale, rows, np.abs(vals))
+    vals = vals / np.where(row_scale > 0, row_scale, 1.0)[rows]
+    # Constrângerile de stimulent formează un con, deci putem relaxa sum(p) = 1 la
+    # sum(p) <= 1 (doar inegalități), iar cu costuri strict pozitive optimul are
+    # sum(p) = 1. Deplasarea bunăstării adaugă doar o constantă.
+    welfare = (p1 + p2).ravel()
+    objective = welfare - welfare.min() + 1 if maximize_welfare else np.ones(n)
+    objective = objective / objective.max()
+    
+    active = np.zeros(0, dtype=np.int64)
+    rounds = 0
+    while True:
+        rounds += 1
+        # Rândurile dense doar pentru constrângerile active
+        a_ub = np.zeros((active.size + 1, n))
+        position = np.full(num_constraints, -1)
+        position[active] = np.arange(active.size)
+        keep = position[rows] >= 0
+        a_ub[position[rows[keep]], cols[keep]] = vals[keep]
+        a_ub[-1] = 1.0
+        b_ub = np.zeros(active.size + 1)
+        b_ub[-1] = 1.0
+        result = interior_point(objective, a_ub, b_ub)
+        if result['status'] != 'optimal':
+            raise ValueError(f"Correlated equilibrium LP ended with status {result['status']}")
+        prob = np.clip(result['x'], 0, None)
+        
+        # Toate încălcările G @ prob dintr-o singură trecere prin formatul rar
+        violation = np.bincount(rows, weights=vals * prob[cols], minlength=num_constraints)
+        violated = np.flatnonzero(violation > _CE_TOLERANCE)
+        if violated.size == 0:
+            break
+        if rounds >= max_rounds:
+            raise ValueError(f"Correlated equilibrium: {violated.size} incentive constraints "
+                             f"still violated after {max_rounds} rounds")
+        worst = violated[np.argsort(-violation[violated])[:batch]]
+        active = np.union1d(active, worst)
+    
+    prob /= prob.sum()
+    distribution = prob.reshape(num_rows, num_cols)
+    v1 = float((distribution * p1).sum())
+    v2 = float((distribution * p2).sum())
+    return {
+        'distribution': np.round(distribution, 4).tolist(),
+        'payoffs': (round(v1, 4), round(v2, 4)),
+        'welfare': round(v1 + v2, 4),
+        'constraints_used': int(active.size),
+        'rounds': rounds
+    }
@@ -48,11 +48,14 @@ class AnswerGenerator:
             if not result:
                 return "Nu există echilibre Nash pure în acest joc."
 
-            if len(result) == 1:
+            if len(result) == 1 and len(result[0]) == 2:
                 row, col = result[0]
                 return f"Echilibrul Nash pur este la linia {row}, coloana {col}."
+            elif len(result) == 1:
+                # Joc cu 3 jucători: (rând, coloană, matrice)
+                return f"Echilibrul Nash pur este profilul ({','.join(map(str, result[0]))})."
             else:
-                coords_str = ", ".join([f"({r},{c})" for r, c in result])
+                coords_str = ", ".join(["(" + ",".join(map(str, coords)) + ")" for coords in result])
                 return f"Există {len(result)} echilibre Nash pure la pozițiile: {coords_str}."
 
         elif q_type == 'csp':
@@ -71,8 +74,14 @@ class AnswerGenerator:
                 visited_count = result.get('visited_count')
 
                 if root_value is not None and visited_count is not None:
-                    return (f"Valoarea din rădăcină este {root_value}. "
+                    text = (f"Valoarea din rădăcină este {root_value}. "
                            f"Au fost vizitate {visited_count} noduri frunză.")
+                    if result.get('pruned_count'):
+                        text += f" Alpha-Beta a tăiat {result['pruned_count']} noduri."
+                    if result.get('best_case_visited') is not None:
+                        text += (f" Cu ordonarea optimă a copiilor s-ar vizita {result['best_case_visited']} frunze, "
+                                 f"iar cu cea mai defavorabilă {result['worst_case_visited']}.")
+                    return text
                 elif root_value is not None:
                     return f"Valoarea din rădăcină este {root_value}."
                 else:
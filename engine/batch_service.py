@@ -0,0 +1,144 @@
+import multiprocessing
+import os
+import random
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import List, Dict, Any, Optional, Iterator, Tuple
+
+from engine.question_service import QuestionService
+from engine.evaluation_service import EvaluationService
+
+
+# Question types accepted by a batch
+BATCH_TYPES = ('nash', 'csp', 'minmax', 'extensive', 'strategy')
+
+# Upper bound on the questions of a single batch
+MAX_BATCH_QUESTIONS = 5000
+
+# Batches up to this size are generated in-process: worker start-up and IPC would cost more
+INLINE_BATCH_QUESTIONS = 50
+
+# Questions per task sent to a worker process
+CHUNK_SIZE = 50
+
+# Per-process services, created on first use (one set per worker process)
+_services: Dict[str, QuestionService] = {}
+_evaluator: Optional[EvaluationService] = None
+
+
+def _generate_chunk(templates_path: str, q_type: str, options: Dict[str, Any], tasks: List[Tuple[int, int]],
+                    include_ground_truth: bool) -> List[Dict[str, Any]]:
+    """Generate the questions (index, seed) of one chunk; runs in a worker process."""
+    global _evaluator
+    service = _services.get(templates_path)
+    if service is None:
+        service = _services[templates_path] = QuestionService(templates_path)
+    if include_ground_truth and _evaluator is None:
+        _evaluator = EvaluationService()
+
+    items = []
+    for index, seed in tasks:
+        item = {'index': index, 'type': q_type, 'seed': seed}
+        try:
+            result = service.generate_question_by_type(q_type, seed=seed, **options)
+            if not result or "error" in result:
+                raise ValueError(result.get("error") if result else "empty result")
+            item.update(question_text=result.get("question_text", ""), raw_data=result.get("raw_data"),
+                        template_id=result.get("template_id"))
+            if include_ground_truth and result.get("raw_data") is not None:
+                item['ground_truth'] = _evaluator.ground_truth(q_type, result["raw_data"])
+        except Exception as e:
+            # One failing question becomes an error line; it must not cut the stream short
+            item['error'] = str(e) or type(e).__name__
+        items.append(item)
+    return items
+
+
+class BatchService:
+    """
+    Generates whole exam sheets: a mix of question types and counts, split in
+    chunks over a pool of worker processes, yielded as each chunk is ready.
+
+    Every question gets its own seed, drawn from the batch seed, so a batch
+    with a fixed seed is reproducible and its variants are distinct seeds.
+    """
+
+    def __init__(self, templates_path: str, max_workers: Optional[int] = None):
+        self.templates_path = templates_path
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self._executor: Optional[ProcessPoolExecutor] = None
+
+    def _pool(self) -> ProcessPoolExecutor:
+        if self._executor is None:
+            # 'spawn' workers do not inherit the server's threads (e.g. the question pool refill)
+            self._executor = ProcessPoolExecutor(self.max_workers, mp_context=multiprocessing.get_context('spawn'))
+        return self._executor
+
+    def shutdown(self):
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+    @staticmethod
+    def plan(items: List[Dict[str, Any]], seed: Optional[int] = None) -> List[Tuple[str, Dict[str, Any], List[Tuple[int, int]]]]:
+        """
+        Split the request into chunks (q_type, options, [(index, seed), ...]).
+
+        Raises:
+            ValueError: on unknown types, non-positive counts or more than MAX_BATCH_QUESTIONS questions
+        """
+        # Every item is checked before the total: a negative count must not offset an oversized one
+        for item in items:
+            if item['type'] not in BATCH_TYPES:
+                raise ValueError(f"Unknown question type '{item['type']}' (expected one of {', '.join(BATCH_TYPES)})")
+            if item['count'] < 1:
+                raise ValueError(f"Count for '{item['type']}' must be positive")
+        total = sum(item['count'] for item in items)
+        if total > MAX_BATCH_QUESTIONS:
+            raise ValueError(f"A batch can hold at most {MAX_BATCH_QUESTIONS} questions (requested {total})")
+        rng = random.Random(seed)
+        seeds = iter(rng.sample(range(2 ** 32), total))
+        chunks = []
+        index = 0
+        for item in items:
+            tasks = [(index + k, next(seeds)) for k in range(item['count'])]
+            index += item['count']
+            for start in range(0, len(tasks), CHUNK_SIZE):
+                chunks.append((item['type'], dict(item.get('options') or {}), tasks[start:start + CHUNK_SIZE]))
+        return chunks
+
+    def generate(self, items: List[Dict[str, Any]], seed: Optional[int] = None,
+                 include_ground_truth: bool = False) -> Iterator[Dict[str, Any]]:
+        """
+        Validate the request and return an iterator over its questions, in
+        completion order ('index' gives the position in the request).
+
+        Args:
+            items: [{'type': 'nash', 'count': 100, 'options': {...}}, ...]; options
+                   are forwarded to the generator as for the single-question endpoints
+            seed: Batch seed (default: random)
+            include_ground_truth: Add the correct answer ('ground_truth') for the answer key
+
+        Raises:
+            ValueError: if the request is invalid (raised here, before streaming starts)
+        """
+        chunks = self.plan(items, seed)
+        return self._stream(chunks, include_ground_truth)
+
+    def _stream(self, chunks: List[Tuple[str, Dict[str, Any], List[Tuple[int, int]]]],
+                include_ground_truth: bool) -> Iterator[Dict[str, Any]]:
+        total = sum(len(tasks) for _, _, tasks in chunks)
+        if total <= INLINE_BATCH_QUESTIONS or self.max_workers == 1:
+            for q_type, options, tasks in chunks:
+                yield from _generate_chunk(self.templates_path, q_type, options, tasks, include_ground_truth)
+            return
+
+        pool = self._pool()
+        futures = [pool.submit(_generate_chunk, self.templates_path, q_type, options, tasks, include_ground_truth)
+                   for q_type, options, tasks in chunks]
+        try:
+            for future in as_completed(futures):
+                yield from future.result()
+        finally:
+            # Client went away: drop the chunks that have not started
+            for future in futures:
+                future.cancel()
@@ -0,0 +1,62 @@
+import threading
+from collections import OrderedDict
+from typing import Hashable
+
+
+class SeenSet:
+    """
+    Bounded set of instance hashes: once `capacity` is reached the oldest
+    entry is forgotten, so a long session keeps a constant footprint.
+    """
+
+    def __init__(self, capacity: int = 1000):
+        self.capacity = capacity
+        self._keys: 'OrderedDict[Hashable, None]' = OrderedDict()
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._keys
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def add(self, key: Hashable) -> bool:
+        """Record key; False if it was already there (a duplicate)."""
+        if key in self._keys:
+            return False
+        self._keys[key] = None
+        if len(self._keys) > self.capacity:
+            self._keys.popitem(last=False)
+        return True
+
+
+class SessionRegistry:
+    """
+    One SeenSet per session (an exam, a student's practice run, ...), kept
+    across requests. The least recently used sessions are dropped beyond
+    `max_sessions`.
+    """
+
+    def __init__(self, max_sessions: int = 1000, capacity: int = 1000):
+        self.max_sessions = max_sessions
+        self.capacity = capacity
+        self._sessions: 'OrderedDict[str, SeenSet]' = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._sessions)
+
+    def claim(self, session: str, key: Hashable) -> bool:
+        """Record key for the session; False if the session has already seen it."""
+        with self._lock:
+            seen = self._sessions.get(session)
+            if seen is None:
+                seen = self._sessions[session] = SeenSet(self.capacity)
+                if len(self._sessions) > self.max_sessions:
+                    self._sessions.popitem(last=False)
+            else:
+                self._sessions.move_to_end(session)
+            return seen.add(key)
+
+    def forget(self, session: str) -> None:
+        with self._lock:
+            self._sessions.pop(session, None)
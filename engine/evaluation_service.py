@@ -1,3 +1,7 @@
+import hashlib
+import json
+import threading
+from collections import OrderedDict
 from typing import Any, Tuple, Dict, Optional
 from pathlib import Path
 
@@ -6,7 +10,11 @@ from core_logic.strategy_solver import StrategySolver
 from engine.answer_generator import AnswerGenerator
 from core_logic.nash_logic import find_pure_nash
 from core_logic.csp_logic import backtrack, ac3
-from core_logic.minmax_logic import dict_to_tree, minmax as minmax_compute
+from core_logic.minmax_logic import (
+    dict_to_tree, minmax, alphabeta_trace, has_chance_nodes, is_procedural, solve_expectiminimax
+)
+from core_logic.minmax_analysis import pruning_analysis
+from core_logic.extensive_logic import game_from_dict, backward_induction
 
 
 class EvaluationService:
@@ -16,6 +24,9 @@ class EvaluationService:
         'csp': ['csp', 'backtracking'],
         'minmax': ['minmax', 'alpha-beta'],
     }
+
+    # Correct answers kept per exact raw_data (pooled questions are solved ahead of time)
+    ANSWER_CACHE_SIZE = 1000
     
     def __init__(self, knowledge_base_path: Optional[str] = None):
         """
@@ -31,6 +42,8 @@ class EvaluationService:
             knowledge_base_path = str(project_root / "assets" / "json_output" / "knowledge_base.json")
         
         self.answer_generator = AnswerGenerator(knowledge_base_path)
+        self._answers: 'OrderedDict[Tuple[str, str], Any]' = OrderedDict()
+        self._answers_lock = threading.Lock()
 
     def evaluate(self, question_type: str, submission: Any):
         """
@@ -57,6 +70,95 @@ class EvaluationService:
         
         raise ValueError(f"No evaluator for type '{question_type}'")
     
+    def ground_truth(self, question_type: str, raw_data: Any) -> Any:
+        """
+        Correct answer for a generated question, as used in the feedback.
+
+        Answers are cached by the exact raw_data (not the canonical hash: the
+        answer refers to rows, columns and variables by position/name), so a
+        question solved ahead of time by the pool, or already evaluated once,
+        is not solved again. Callers must not modify the returned answer.
+        """
+        key = (question_type, hashlib.sha1(
+            json.dumps(raw_data, sort_keys=True, separators=(",", ":"), default=str).encode("utf-8")).hexdigest())
+        with self._answers_lock:
+            if key in self._answers:
+                self._answers.move_to_end(key)
+                return self._answers[key]
+        answer = self._solve(question_type, raw_data)
+        with self._answers_lock:
+            self._answers[key] = answer
+            if len(self._answers) > self.ANSWER_CACHE_SIZE:
+                self._answers.popitem(last=False)
+        return answer
+
+    def _solve(self, question_type: str, raw_data: Any) -> Any:
+        if question_type == 'nash':
+            return find_pure_nash(raw_data)
+        if question_type == 'csp':
+            return self._csp_ground_truth(raw_data)
+        if question_type == 'minmax':
+            return self._minmax_ground_truth(raw_data)
+        if question_type == 'extensive':
+            return backward_induction(game_from_dict(raw_data))
+        if question_type == 'strategy':
+            return StrategySolver().solve(raw_data)[0]
+        raise ValueError(f"No evaluator for type '{question_type}'")
+
+    @staticmethod
+    def _csp_ground_truth(raw_data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        try:
+            variables = raw_data['variables']
+            domains = raw_data['domains']
+            constraints = raw_data['constraints']
+            partial_assignment = raw_data.get('partial_assignment', {})
+            tags = raw_data.get('tags', [])
+
+            if 'use_ac3' in tags:
+                # Use AC-3 for arc consistency
+                correct_solution = ac3(variables, domains, constraints)
+            else:
+                # Use Backtracking with optional MRV and Forward Checking
+                use_mrv = 'use_mrv' in tags
+                use_fc = 'use_forward_checking' in tags
+                correct_solution = backtrack(variables, domains, constraints, partial_assignment, use_mrv, use_fc)
+        except Exception:
+            correct_solution = None
+        return correct_solution
+
+    @staticmethod
+    def _minmax_ground_truth(raw_data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        try:
+            tree = dict_to_tree(raw_data)
+            if has_chance_nodes(tree):
+                correct_root, visited = solve_expectiminimax(tree)
+                correct_result = {
+                    'root_value': correct_root,
+                    'visited_count': len(visited)
+                }
+            elif is_procedural(tree):
+                # Lazy tree: plain alpha-beta only expands the visited nodes
+                visited = []
+                correct_root = minmax(tree, 0, float('-inf'), float('inf'), True, visited)
+                correct_result = {
+                    'root_value': correct_root,
+                    'visited_count': len(visited)
+                }
+            else:
+                correct_root, visited, trace = alphabeta_trace(tree)
+                analysis = pruning_analysis(tree)
+                correct_result = {
+                    'root_value': correct_root,
+                    'visited_count': len(visited),
+                    'trace': trace,
+                    'pruned_count': sum(1 for row in trace if row[3]),
+                    'best_case_visited': analysis['best_case_visited'],
+                    'worst_case_visited': analysis['worst_case_visited'],
+                }
+        except Exception:
+            correct_result = None
+        return correct_result
+
     def _evaluate_nash(self, submission: Any) -> Tuple[float, str]:
         """
         Evaluate Nash equilibrium submission.
@@ -74,10 +176,9 @@ class EvaluationService:
         elif isinstance(user_answer, dict):
             user_answer = user_answer.get('equilibria', '')
         
-        score = evaluator.evaluate(user_answer, submission.raw_data)
-        
-        # Calculate ground truth for feedback
-        correct_coords = find_pure_nash(submission.raw_data)
+        # Ground truth (cached for pooled questions) for the score and the feedback
+        correct_coords = self.ground_truth('nash', submission.raw_data)
+        score = evaluator.evaluate(user_answer, submission.raw_data, correct_coords)
         
         # Generate feedback
         tags = self.TYPE_TAGS['nash']
@@ -96,24 +197,8 @@ class EvaluationService:
         evaluator = CSPEvaluator()
         score = evaluator.evaluate(submission.user_answer, submission.raw_data)
 
-        # Calculate the correct solution (ground truth)
-        try:
-            variables = submission.raw_data['variables']
-            domains = submission.raw_data['domains']
-            constraints = submission.raw_data['constraints']
-            partial_assignment = submission.raw_data.get('partial_assignment', {})
-            tags = submission.raw_data.get('tags', [])
-
-            if 'use_ac3' in tags:
-                # Use AC-3 for arc consistency
-                correct_solution = ac3(variables, domains, constraints)
-            else:
-                # Use Backtracking with optional MRV and Forward Checking
-                use_mrv = 'use_mrv' in tags
-                use_fc = 'use_forward_checking' in tags
-                correct_solution = backtrack(variables, domains, constraints, partial_assignment, use_mrv, use_fc)
-        except Exception:
-            correct_solution = None
+        # The correct solution (ground truth, cached for pooled questions)
+        correct_solution = self.ground_truth('csp', submission.raw_data)
 
         # Generate feedback
         tags = self.TYPE_TAGS['csp'] + submission.raw_data.get('tags', [])
@@ -139,22 +224,14 @@ class EvaluationService:
             "root_value": submission.root_value,
             "visited_count": submission.visited_count,
         }
-        score = evaluator.evaluate(user_answer, submission.raw_data)
-        
-        # Calculate ground truth for feedback
-        try:
-            tree = dict_to_tree(submission.raw_data)
-            visited = []
-            correct_root = minmax_compute(tree, 0, float('-inf'), float('inf'), True, visited)
-            correct_result = {
-                'root_value': correct_root,
-                'visited_count': len(visited)
-            }
-        except Exception:
-            correct_result = None
+        # Ground truth (cached for pooled questions) for the score and the feedback
+        correct_result = self.ground_truth('minmax', submission.raw_data)
+        score = evaluator.evaluate(user_answer, submission.raw_data, correct_result)
         
         # Generate feedback
-        tags = self.TYPE_TAGS['minmax']
+        tags = list(self.TYPE_TAGS['minmax'])
+        if correct_result and isinstance(correct_result['root_value'], float):
+            tags.append('expectiminimax')
         feedback = self.answer_generator.generate_full_answer('minmax', correct_result, tags)
         
         return score, feedback
@@ -1,24 +1,30 @@
 import re
 from typing import List, Tuple, Dict, Optional
-from core_logic.nash_logic import find_pure_nash, find_dominated_strategies
+from core_logic.nash_logic import (
+    find_pure_nash, find_dominated_strategies, iterated_elimination, find_mixed_nash, is_mixed_nash, num_players
+)
 
 
 class NashEvaluator:
     def __init__(self):
         pass
 
-    def _extract_coordinates(self, answer: str) -> List[Tuple[int, int]]:
+    def _extract_coordinates(self, answer: str) -> List[Tuple[int, ...]]:
         if not answer:
             return []
-        pattern = r"\((\d+),\s*(\d+)\)"
+        # (r, c) pentru 2 jucători, (r, c, l) pentru 3 jucători
+        pattern = r"\((\d+(?:,\s*\d+)+)\)"
         matches = re.findall(pattern, str(answer))
-        return [(int(r), int(c)) for r, c in matches]
+        return [tuple(int(v) for v in m.split(',')) for m in matches]
 
-    def evaluate(self, user_answer: str, raw_data: List[List[Tuple[int, int]]]) -> float:
+    def evaluate(self, user_answer: str, raw_data: List[List[Tuple[int, int]]],
+                 correct_coords: Optional[List[Tuple[int, ...]]] = None) -> float:
         """
         Evaluate a Nash-style answer. Returns float score between 0 and 1.
+        `correct_coords` (precomputed pure equilibria) skips solving the game again.
         """
-        correct_coords = find_pure_nash(raw_data)
+        if correct_coords is None:
+            correct_coords = find_pure_nash(raw_data)
         user_coords = self._extract_coordinates(user_answer)
 
         if not user_coords:
@@ -41,19 +47,22 @@ class NashEvaluator:
         has_dominated: Optional[bool] = None,
         dominated_p1: Optional[List[int]] = None,
         dominated_p2: Optional[List[int]] = None,
-        has_equilibrium: Optional[bool] = None
+        has_equilibrium: Optional[bool] = None,
+        correct_coords: Optional[List[Tuple[int, ...]]] = None
     ) -> Tuple[float, Dict]:
         """
         Evaluează un răspuns extins care include și strategii dominate.
+        `correct_coords` (echilibrele pure deja calculate) evită rezolvarea din nou.
         
         Returns:
             Tuple[float, Dict]: (scor_total, detalii_evaluare)
         """
         # Calculăm răspunsurile corecte
-        correct_coords = find_pure_nash(raw_data)
+        if correct_coords is None:
+            correct_coords = find_pure_nash(raw_data)
         correct_dominated = find_dominated_strategies(raw_data)
         
-        has_correct_dominated = bool(correct_dominated['player1'] or correct_dominated['player2'])
+        has_correct_dominated = any(correct_dominated.values())
         has_correct_equilibrium = bool(correct_coords)
         
         scores = {}
@@ -134,7 +143,44 @@ class NashEvaluator:
             'correct_dominated': correct_dominated,
             'correct_coords': correct_coords,
             'has_correct_dominated': has_correct_dominated,
-            'has_correct_equilibrium': has_correct_equilibrium
+            'has_correct_equilibrium': has_correct_equilibrium,
+            # Ordinea eliminării iterate, pentru feedback (doar jocuri cu 2 jucători)
+            'elimination': iterated_elimination(raw_data) if num_players(raw_data) == 2 else None
         }
         
         return final_score, details
+
+    def evaluate_mixed(
+        self,
+        raw_data: List[List[Tuple[int, int]]],
+        p1_mix: List[float],
+        p2_mix: List[float],
+        tolerance: float = 0.01
+    ) -> Tuple[float, Dict]:
+        """
+        Evaluează un echilibru în strategii mixte dat de utilizator.
+        
+        Răspunsul este corect dacă se află la cel mult `tolerance` (pe fiecare
+        probabilitate) de un echilibru calculat, sau dacă este el însuși un
+        echilibru (orice deviere pură câștigă cel mult `tolerance` ori amplitudinea plăților).
+        
+        Returns:
+            Tuple[float, Dict]: (scor, detalii cu echilibrele corecte)
+        """
+        correct_mixed = find_mixed_nash(raw_data)
+        
+        close_to_known = any(
+            len(p1_mix) == len(eq['p1']) and len(p2_mix) == len(eq['p2'])
+            and all(abs(u - float(c)) <= tolerance for u, c in zip(p1_mix, eq['p1']))
+            and all(abs(u - float(c)) <= tolerance for u, c in zip(p2_mix, eq['p2']))
+            for eq in correct_mixed
+        )
+        values = [v for row in raw_data for cell in row for v in cell]
+        payoff_range = max(1, max(values) - min(values))
+        is_equilibrium = close_to_known or is_mixed_nash(raw_data, p1_mix, p2_mix, tolerance * payoff_range)
+        
+        details = {
+            'correct_mixed': correct_mixed,
+            'is_equilibrium': is_equilibrium
+        }
+        return (1.0 if is_equilibrium else 0.0), details
@@ -3,6 +3,8 @@ import random
 from pathlib import Path
 from typing import List, Tuple, Dict, Any, Optional
 
+from core_logic.csp_logic import search_stats, ac3
+
 
 class CSPGenerator:
     # Tags that trigger data generation
@@ -10,41 +12,50 @@ class CSPGenerator:
     
     # Default fallback template if JSON file is empty or not found
     DEFAULT_TEMPLATE = "Se dă următoarea problemă CSP:"
+
+    # Difficulty bands: backtracks of plain backtracking (static order, no FC) on the instance
+    DIFFICULTY_BANDS = {'easy': (0, 0), 'medium': (1, 4), 'hard': (5, 60)}
+
+    # Variables available to difficulty-targeted instances, which grow one variable at a time
+    TARGETED_VARIABLES = ['A', 'B', 'C', 'D', 'E', 'F', 'G', 'H', 'I', 'J']
     
-    def __init__(self, templates_path: Optional[str] = None):
-        self.csp_templates = []
+    def __init__(self, templates_path: Optional[str] = None,
+                 templates: Optional[List[Dict[str, Any]]] = None):
+        all_templates = templates or []
         
-        if templates_path:
+        # Preloaded templates (QuestionService's registry) skip reading the file
+        if templates is None and templates_path:
             try:
                 with open(templates_path, 'r', encoding='utf-8') as f:
                     all_templates = json.load(f)
-                # Filter templates that have 'csp' in tags BUT NOT 'strategy'
-                # This prevents strategy templates (like graph-coloring strategy questions) 
-                # from being used as CSP calculation questions
-                self.csp_templates = [
-                    t for t in all_templates 
-                    if 'csp' in t.get('tags', []) and 'strategy' not in t.get('tags', [])
-                ]
             except (FileNotFoundError, json.JSONDecodeError) as e:
                 # Log warning but continue with empty list
                 print(f"Warning: Could not load CSP templates from {templates_path}: {e}")
-                self.csp_templates = []
+                all_templates = []
 
-    def _generate_csp_data(self):
+        # Filter templates that have 'csp' in tags BUT NOT 'strategy'
+        # This prevents strategy templates (like graph-coloring strategy questions) 
+        # from being used as CSP calculation questions
+        self.csp_templates = [
+            t for t in all_templates 
+            if 'csp' in t.get('tags', []) and 'strategy' not in t.get('tags', [])
+        ]
+
+    def _generate_csp_data(self, rng=random):
         """
         Generate a random CSP instance with random variables, domains, constraints,
         and a partial assignment.
         """
         # 1. Random number of variables (3 to 5)
         available_vars = ['A', 'B', 'C', 'D', 'E']
-        num_variables = random.randint(3, 5)
+        num_variables = rng.randint(3, 5)
         variables = available_vars[:num_variables]
         
         # 2. Random domains for each variable
         # Domain sizes can be 2 or 3 elements
         domains = {}
         for var in variables:
-            domain_size = random.randint(2, 3)
+            domain_size = rng.randint(2, 3)
             domains[var] = list(range(1, domain_size + 1))
         
         # 3. Random constraints (create a connected graph)
@@ -54,21 +65,189 @@ class CSPGenerator:
             constraints.append((variables[i], variables[i + 1]))
         
         # Add additional random edges (0 to 2 extra constraints)
-        num_extra_constraints = random.randint(0, min(2, len(variables) - 2))
+        num_extra_constraints = rng.randint(0, min(2, len(variables) - 2))
         for _ in range(num_extra_constraints):
             # Pick two random non-adjacent variables
-            var1, var2 = random.sample(variables, 2)
+            var1, var2 = rng.sample(variables, 2)
             # Avoid duplicate constraints
             if (var1, var2) not in constraints and (var2, var1) not in constraints:
                 constraints.append((var1, var2))
         
         # 4. Random partial assignment (assign one variable)
-        assigned_var = random.choice(variables)
-        assigned_value = random.choice(domains[assigned_var])
+        assigned_var = rng.choice(variables)
+        assigned_value = rng.choice(domains[assigned_var])
         partial_assignment = {assigned_var: assigned_value}
         
         return variables, domains, constraints, partial_assignment
 
+    @staticmethod
+    def _measure_difficulty(data, solutions: List[Dict[str, int]]) -> Dict[str, Any]:
+        """Solver effort on an instance whose complete solution list is known."""
+        variables, domains, constraints, partial_assignment = data
+        plain = search_stats(variables, domains, constraints, partial_assignment, use_mrv=False, use_fc=False)
+        smart = search_stats(variables, domains, constraints, partial_assignment, use_mrv=True, use_fc=True)
+        return {
+            'backtracks_bt': plain['backtracks'],
+            'backtracks_fc_mrv': smart['backtracks'],
+            'nodes_bt': plain['nodes'],
+            'nodes_fc_mrv': smart['nodes'],
+            'satisfiable': bool(solutions),
+            'solutions': len(solutions),
+        }
+
+    def _generate_targeted_csp_data(self, difficulty: str, satisfiable: Optional[bool] = None, rng=random,
+                                    restarts: int = 100, max_steps: int = 60):
+        """
+        Grow a CSP until plain backtracking needs a number of backtracks inside the
+        `difficulty` band, optionally with the requested satisfiability.
+        
+        The instance starts as a chain of 3-5 variables and grows by one constraint
+        at a time (one new variable when no constraint fits). Its full
+        solution list is enumerated once and afterwards only filtered by each new
+        constraint or extended by each new variable, so satisfiability and the
+        solution count never need a new search; only the two effort measurements
+        are re-run. A step that overshoots the band, or makes the instance
+        unsatisfiable while still too easy, is undone and another constraint is tried.
+        
+        Returns:
+            ((variables, domains, constraints, partial_assignment), difficulty metrics)
+        
+        Raises:
+            ValueError: unknown band, impossible request ('easy' and unsatisfiable: proving
+                        inconsistency takes at least one backtrack) or no instance found
+        """
+        if difficulty not in self.DIFFICULTY_BANDS:
+            raise ValueError(f"Unknown difficulty: {difficulty} (expected one of {', '.join(self.DIFFICULTY_BANDS)})")
+        low, high = self.DIFFICULTY_BANDS[difficulty]
+        if satisfiable is False and high < 1:
+            raise ValueError(f"An unsatisfiable CSP always takes a backtrack to refute; '{difficulty}' allows none")
+
+        def fits(metrics):
+            return low <= metrics['backtracks_bt'] <= high and satisfiable in (None, metrics['satisfiable'])
+
+        def acceptable(metrics):
+            # Unsatisfiable instances only get easier to refute as they grow, so never grow past one
+            if fits(metrics):
+                return True
+            return metrics['backtracks_bt'] <= high and metrics['satisfiable']
+
+        for _ in range(restarts):
+            variables = self.TARGETED_VARIABLES[:rng.randint(3, 5)]
+            domains = {var: list(range(1, rng.randint(2, 3) + 1)) for var in variables}
+            constraints = [(variables[i], variables[i + 1]) for i in range(len(variables) - 1)]
+            assigned_var = rng.choice(variables)
+            partial_assignment = {assigned_var: rng.choice(domains[assigned_var])}
+            solutions = search_stats(variables, domains, constraints, partial_assignment,
+                                     max_solutions=None, record=True)['assignments']
+            metrics = self._measure_difficulty((variables, domains, constraints, partial_assignment), solutions)
+
+            for _ in range(max_steps):
+                if fits(metrics):
+                    return (variables, domains, constraints, partial_assignment), metrics
+                if not acceptable(metrics):
+                    break
+
+                present = set(constraints) | {(v2, v1) for v1, v2 in constraints}
+                candidates = [(v1, v2) for i, v1 in enumerate(variables) for v2 in variables[i + 1:]
+                              if (v1, v2) not in present]
+                rng.shuffle(candidates)
+                # Missing constraints in random order: take the first that makes plain
+                # backtracking work harder, else the first that keeps the instance acceptable
+                fallback = None
+                for v1, v2 in candidates:
+                    new_constraints = constraints + [(v1, v2)]
+                    new_solutions = [sol for sol in solutions if sol[v1] != sol[v2]]
+                    if satisfiable and not new_solutions:
+                        continue  # known from the solution list alone, no search needed
+                    new_metrics = self._measure_difficulty((variables, domains, new_constraints, partial_assignment),
+                                                           new_solutions)
+                    if not acceptable(new_metrics):
+                        continue
+                    step = (new_constraints, new_solutions, new_metrics)
+                    if new_metrics['backtracks_bt'] > metrics['backtracks_bt'] or fits(new_metrics):
+                        break
+                    fallback = fallback or step
+                else:
+                    step = fallback
+                if step is not None:
+                    constraints, solutions, metrics = step
+                else:
+                    # No constraint fits: add a variable tied to a random existing one
+                    if len(variables) == len(self.TARGETED_VARIABLES):
+                        break
+                    new_var = self.TARGETED_VARIABLES[len(variables)]
+                    neighbor = rng.choice(variables)
+                    variables = variables + [new_var]
+                    domains = dict(domains, **{new_var: list(range(1, rng.randint(2, 3) + 1))})
+                    constraints = constraints + [(neighbor, new_var)]
+                    solutions = [dict(sol, **{new_var: value}) for sol in solutions
+                                 for value in domains[new_var] if value != sol[neighbor]]
+                    metrics = self._measure_difficulty((variables, domains, constraints, partial_assignment),
+                                                       solutions)
+        raise ValueError(f"Could not generate a '{difficulty}' CSP instance"
+                         + ("" if satisfiable is None else f" (satisfiable={satisfiable})"))
+
+    def _generate_unique_csp_data(self, num_variables: Optional[int] = None, rng=random, restarts: int = 50):
+        """
+        Random CSP whose solution is unique given its partial assignment.
+        
+        Starting from a random connected instance, a count-up-to-2 search looks
+        for two solutions s1 and s2. While it finds both, the instance is tightened
+        so that s1 survives and s2 does not: preferably a new constraint u != v
+        with s1[u] != s1[v] and s2[u] == s2[v], otherwise a partial assignment
+        x = s1[x] where they differ. Since s1 always stays a solution the
+        instance never becomes inconsistent.
+        
+        The arc-consistent domains are kept between iterations: each change only
+        re-revises the arcs it touched (incremental AC-3) and the next count runs
+        on the already reduced domains, so even 10 variables take milliseconds.
+        
+        Returns:
+            ((variables, domains, constraints, partial_assignment), solution)
+        """
+        if num_variables is None:
+            num_variables = rng.randint(4, 6)
+        if not 3 <= num_variables <= len(self.TARGETED_VARIABLES):
+            raise ValueError(f"Unsupported number of variables: {num_variables} "
+                             f"(3-{len(self.TARGETED_VARIABLES)})")
+
+        for _ in range(restarts):
+            variables = self.TARGETED_VARIABLES[:num_variables]
+            domains = {var: list(range(1, rng.randint(2, 3) + 1)) for var in variables}
+            constraints = [(variables[i], variables[i + 1]) for i in range(num_variables - 1)]
+            for _ in range(rng.randint(0, num_variables // 2)):
+                v1, v2 = rng.sample(variables, 2)
+                if (v1, v2) not in constraints and (v2, v1) not in constraints:
+                    constraints.append((v1, v2))
+            assigned_var = rng.choice(variables)
+            partial_assignment = {assigned_var: rng.choice(domains[assigned_var])}
+
+            reduced = ac3(variables, dict(domains, **{assigned_var: [partial_assignment[assigned_var]]}), constraints)
+            if reduced is None:
+                continue
+            while True:
+                found = search_stats(variables, reduced, constraints, partial_assignment,
+                                     max_solutions=2, record=True)['assignments']
+                if len(found) < 2:
+                    break
+                first, second = found
+                candidates = [(v1, v2) for i, v1 in enumerate(variables) for v2 in variables[i + 1:]
+                              if first[v1] != first[v2] and second[v1] == second[v2]
+                              and (v1, v2) not in constraints and (v2, v1) not in constraints]
+                if candidates:
+                    v1, v2 = rng.choice(candidates)
+                    constraints = constraints + [(v1, v2)]
+                    reduced = ac3(variables, reduced, constraints, arcs=[(v1, v2), (v2, v1)])
+                else:
+                    var = rng.choice([v for v in variables if first[v] != second[v]])
+                    partial_assignment = dict(partial_assignment, **{var: first[var]})
+                    reduced = dict(reduced, **{var: [first[var]]})
+                    neighbors = {v2 for v1, v2 in constraints if v1 == var} | {v1 for v1, v2 in constraints if v2 == var}
+                    reduced = ac3(variables, reduced, constraints, arcs=[(n, var) for n in neighbors])
+            if found:
+                return (variables, domains, constraints, partial_assignment), found[0]
+        raise ValueError(f"Could not generate a unique-solution CSP with {num_variables} variables")
+
     def _format_csp_data_string(self, data) -> str:
         """Format the CSP data as a structured string."""
         variables, domains, constraints, partial_assignment = data
@@ -85,7 +264,30 @@ class CSPGenerator:
         )
         return data_text
 
-    def generate(self, template_id: Optional[str] = None) -> Dict[str, Any]:
+    def generate(self, template_id: Optional[str] = None, difficulty: Optional[str] = None,
+                 satisfiable: Optional[bool] = None, unique: bool = False, num_variables: Optional[int] = None,
+                 rng=random) -> Dict[str, Any]:
+        """
+        Generate a CSP question.
+        
+        Args:
+            template_id: Specific template to use (default: random selection)
+            difficulty: 'easy', 'medium' or 'hard' - grow the instance until plain
+                        backtracking needs that many backtracks (see DIFFICULTY_BANDS)
+            satisfiable: Require a solvable (True) or inconsistent (False) instance;
+                         implies difficulty='medium' if no band is given
+            unique: Tighten the instance until its solution is unique (exact grading)
+            num_variables: Number of variables of a unique-solution instance (3-10)
+            rng: Source of randomness (a per-request `random.Random`; default: the `random` module)
+        
+        Returns:
+            Dictionary with question_text, raw_data and template_id (plus the measured
+            'difficulty' metrics for targeted instances, 'unique' for unique-solution ones)
+        """
+        if unique and (difficulty is not None or satisfiable is False):
+            raise ValueError("Unique-solution CSPs cannot be combined with a difficulty band or satisfiable=false")
+        if num_variables is not None and not unique:
+            raise ValueError("num_variables is only supported for unique-solution CSPs")
         # Select template
         selected_template = None
         
@@ -98,21 +300,28 @@ class CSPGenerator:
         
         if not selected_template and self.csp_templates:
             # Random selection from available templates
-            selected_template = random.choice(self.csp_templates)
+            selected_template = rng.choice(self.csp_templates)
         
         # Use template text or fallback
         if selected_template:
             template_text = selected_template['template']
             final_template_id = selected_template['id']
-            template_tags = set(selected_template.get('tags', []))
+            # Ordered like the template (a set's order changes between processes)
+            template_tags = list(dict.fromkeys(selected_template.get('tags', [])))
         else:
             template_text = self.DEFAULT_TEMPLATE
             final_template_id = 'csp-default'
-            template_tags = set()
+            template_tags = []
         
         # CSP questions always need raw_data for evaluation
         # Generate CSP data for all questions
-        data = self._generate_csp_data()
+        metrics = None
+        if unique:
+            data, _ = self._generate_unique_csp_data(num_variables, rng)
+        elif difficulty is not None or satisfiable is not None:
+            data, metrics = self._generate_targeted_csp_data(difficulty or 'medium', satisfiable, rng)
+        else:
+            data = self._generate_csp_data(rng)
         variables, domains, constraints, partial_assignment = data
         question_text = template_text + "\n\n" + self._format_csp_data_string(data)
         
@@ -122,11 +331,16 @@ class CSPGenerator:
             'domains': domains,
             'constraints': constraints,
             'partial_assignment': partial_assignment,
-            'tags': list(template_tags),
+            'tags': template_tags,
         }
         
-        return {
+        result = {
             'question_text': question_text,
             'raw_data': raw_data,
             'template_id': final_template_id,
         }
+        if metrics is not None:
+            result['difficulty'] = dict(metrics, band=difficulty or 'medium')
+        if unique:
+            result['unique'] = True
+        return result
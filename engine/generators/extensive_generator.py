@@ -0,0 +1,94 @@
+import json
+import random
+from typing import List, Dict, Any, Optional
+
+from core_logic.extensive_logic import ExtensiveGame, generate_random_extensive, game_to_dict
+
+
+class ExtensiveGenerator:
+    # Default fallback template if no 'extensive-form' template is available
+    DEFAULT_TEMPLATE = (
+        "Pentru jocul în formă extinsă de mai jos, aplicați inducția inversă și găsiți "
+        "echilibrul perfect în subjocuri (SPE). Care sunt plățile de echilibru?"
+    )
+
+    def __init__(self, templates_path: Optional[str] = None,
+                 templates: Optional[List[Dict[str, Any]]] = None):
+        all_templates = templates or []
+
+        # Preloaded templates (QuestionService's registry) skip reading the file
+        if templates is None and templates_path:
+            try:
+                with open(templates_path, 'r', encoding='utf-8') as f:
+                    all_templates = json.load(f)
+            except (FileNotFoundError, json.JSONDecodeError) as e:
+                print(f"Warning: Could not load extensive-form templates from {templates_path}: {e}")
+                all_templates = []
+
+        self.extensive_templates = [
+            t for t in all_templates
+            if 'extensive-form' in t.get('tags', [])
+        ]
+
+    @staticmethod
+    def _format_game_as_string(game: ExtensiveGame) -> str:
+        """
+        One line per decision node: "N0 (J1): A -> N1, B -> (3,2)".
+        Decision nodes come first in the game arrays, so Nk is node k.
+        """
+        players = ", ".join(f"J{p}" for p in range(1, game.num_players + 1))
+        game_str = f"\nArborele jocului (Nk = nod de decizie, frunzele sunt plățile ({players})):\n"
+        game_str += "--------------------------------------------------\n"
+        for node in range(len(game)):
+            if game.is_terminal(node):
+                continue
+            edges = []
+            for action, child in zip(game.actions[node], game.children[node]):
+                target = (f"({','.join(map(str, game.payoffs[child]))})" if game.is_terminal(child)
+                          else f"N{child}")
+                edges.append(f"{action} -> {target}")
+            game_str += f"\tN{node} (J{game.players[node]}): {', '.join(edges)}\n"
+        game_str += "--------------------------------------------------\n"
+        return game_str
+
+    def generate(self, depth: Optional[int] = None, branching: int = 2, players: int = 2,
+                 template_id: Optional[str] = None, rng=random) -> Dict[str, Any]:
+        """
+        Generate an extensive-form (sequential) game question.
+
+        Args:
+            depth: Number of moves on every path (default: random 2-3)
+            branching: Actions per decision node (2-4)
+            players: 2 or 3; the players move in turn, player 1 at the root
+            template_id: Specific template to use (default: random selection)
+            rng: Source of randomness (a per-request `random.Random`; default: the `random` module)
+
+        Returns:
+            Dictionary with question_text, raw_data (`game_to_dict` layout) and template_id
+        """
+        if players not in (2, 3):
+            raise ValueError(f"Unsupported number of players: {players}")
+        if not 2 <= branching <= 4:
+            raise ValueError(f"Unsupported branching factor: {branching} (2-4)")
+        depth = depth if depth is not None else rng.randint(2, 3)
+        if not 1 <= depth <= 5:
+            raise ValueError(f"Unsupported depth: {depth} (1-5)")
+
+        selected_template = None
+        if template_id:
+            selected_template = next((t for t in self.extensive_templates if t['id'] == template_id), None)
+        if not selected_template and self.extensive_templates:
+            selected_template = rng.choice(self.extensive_templates)
+        if selected_template:
+            template_text = selected_template['template']
+            final_template_id = selected_template['id']
+        else:
+            template_text = self.DEFAULT_TEMPLATE
+            final_template_id = 'extensive-default'
+
+        game = generate_random_extensive(depth, branching, players, rng=rng)
+        return {
+            "question_text": template_text + "\n" + self._format_game_as_string(game),
+            "raw_data": game_to_dict(game),
+            "template_id": final_template_id,
+        }
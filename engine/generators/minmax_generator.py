@@ -1,8 +1,10 @@
 import json
 import random
 from pathlib import Path
-from typing import Dict, Any, Optional
-from core_logic.minmax_logic import generate_random_tree, tree_to_dict, Node
+from typing import List, Dict, Any, Optional
+from core_logic.minmax_logic import generate_random_tree, generate_random_chance_tree, tree_to_dict, encode_tree, leaf_bounds, Node, ProceduralNode, CHANCE, check_tree_size
+from core_logic.game_logic import GAMES, BitboardGame, GameState, build_game_tree
+from core_logic.minmax_analysis import achievable_visits, generate_pruning_tree
 
 
 class MinMaxGenerator:
@@ -14,45 +16,149 @@ class MinMaxGenerator:
         "Pentru arborele dat mai jos, aplică strategia MinMax cu optimizarea Alpha-Beta.\n"
         "Care va fi valoarea din rădăcină și câte noduri frunze vor fi vizitate?"
     )
+
+    # Upper bound on leaves for game-derived trees (keeps questions solvable by hand)
+    MAX_GAME_LEAVES = 16
+
+    # Procedural trees larger than this are described instead of drawn
+    MAX_RENDERED_LEAVES = 64
+
+    # Depths tried for a visited-count target when no depth is given
+    TARGET_DEPTHS = range(2, 7)
+
+    # raw_data layouts besides the default nested dicts (see `encode_tree`)
+    ENCODINGS = ('compact', 'base64')
     
-    def __init__(self, templates_path: Optional[str] = None):
-        self.minmax_templates = []
+    def __init__(self, templates_path: Optional[str] = None,
+                 templates: Optional[List[Dict[str, Any]]] = None):
+        all_templates = templates or []
         
-        if templates_path:
+        # Preloaded templates (QuestionService's registry) skip reading the file
+        if templates is None and templates_path:
             try:
                 with open(templates_path, 'r', encoding='utf-8') as f:
                     all_templates = json.load(f)
-                # Filter templates that have 'minmax' in tags
-                self.minmax_templates = [
-                    t for t in all_templates 
-                    if 'minmax' in t.get('tags', [])
-                ]
             except (FileNotFoundError, json.JSONDecodeError) as e:
                 # Log warning but continue with empty list
                 print(f"Warning: Could not load MinMax templates from {templates_path}: {e}")
-                self.minmax_templates = []
+                all_templates = []
+
+        # Filter templates that have 'minmax' in tags
+        self.minmax_templates = [
+            t for t in all_templates 
+            if 'minmax' in t.get('tags', [])
+        ]
 
     @staticmethod
     def _tree_to_string(node: Node, prefix: str = "", is_left: bool = True) -> str:
         if not node.children:
             return f"{prefix}{'└── ' if is_left else '┌── '}{node.value}\n"
-        result = f"{prefix}{'└── ' if is_left else '┌── '}[ ]\n"
-        result += MinMaxGenerator._tree_to_string(node.children[0], prefix + ("    " if is_left else "│   "), True)
-        result += MinMaxGenerator._tree_to_string(node.children[1], prefix + ("    " if is_left else "│   "), False)
+        if node.kind == CHANCE:
+            # Chance node: [C p1/p2/...] with the probability of each child in order
+            label = "[C " + "/".join(f"{p:g}" for p in node.probs) + "]"
+        else:
+            label = "[ ]"
+        result = f"{prefix}{'└── ' if is_left else '┌── '}{label}\n"
+        child_prefix = prefix + ("    " if is_left else "│   ")
+        for i, child in enumerate(node.children):
+            result += MinMaxGenerator._tree_to_string(child, child_prefix, i == 0)
         return result
 
-    def generate(self, depth: Optional[int] = None, max_leaf_value: Optional[int] = None, template_id: Optional[str] = None) -> Dict[str, Any]:
+    def _generate_game_position(self, game: BitboardGame, depth: int, rng=random) -> GameState:
+        """
+        Play random non-final moves until the position is small enough that a
+        depth-limited tree stays under MAX_GAME_LEAVES leaves.
+        """
+        state = game.initial_state()
+        while len(game.legal_moves(state)) ** depth > self.MAX_GAME_LEAVES:
+            moves = [m for m in game.legal_moves(state) if not game.is_terminal(game.play(state, m))]
+            if not moves:
+                break
+            state = game.play(state, rng.choice(moves))
+        return state
+
+    def _generate_game_tree(self, game_name: str, depth: int, max_leaf_value: int, rng=random):
+        """Build a MinMax tree from a random position of a real game."""
+        if game_name not in GAMES:
+            raise ValueError(f"Unknown game '{game_name}'. Available: {sorted(GAMES)}")
+        game = GAMES[game_name]()
+        state = self._generate_game_position(game, depth, rng)
+        tree = build_game_tree(game, state, depth, True, max_leaf_value)
+        to_move = 'X' if state[2] % 2 == 0 else 'O'
+        board_text = (
+            f"Poziția de joc ({game.name}), la mutare: {to_move} (MAX):\n"
+            f"{game.render(state)}\n"
+        )
+        return tree, board_text
+
+    def _target_visits(self, depth: Optional[int], visited: Optional[int], pruning_ratio: Optional[float],
+                       rng=random):
+        """
+        (depth, visited leaves) for a pruning target: an exact visited count, or
+        the achievable count closest to the requested pruned-leaf fraction.
+        """
+        if depth is not None and not 1 <= depth <= self.TARGET_DEPTHS[-1]:
+            raise ValueError(f"Pruning targets support depths 1-{self.TARGET_DEPTHS[-1]}, got {depth}")
+        if visited is not None:
+            if depth is not None:
+                return depth, visited
+            depths = [d for d in self.TARGET_DEPTHS if visited in achievable_visits(d)]
+            if not depths:
+                raise ValueError(f"No tree of depth {self.TARGET_DEPTHS[0]}-{self.TARGET_DEPTHS[-1]} "
+                                 f"visits exactly {visited} leaves")
+            return rng.choice(depths), visited
+        if not 0 <= pruning_ratio < 1:
+            raise ValueError(f"pruning_ratio must be in [0, 1), got {pruning_ratio}")
+        if depth is None:
+            depth = rng.randint(2, 4)
+        target = (1 - pruning_ratio) * 2 ** depth
+        return depth, min(achievable_visits(depth), key=lambda k: abs(k - target))
+
+    def generate(self, depth: Optional[int] = None, max_leaf_value: Optional[int] = None, template_id: Optional[str] = None, game: Optional[str] = None, chance: bool = False,
+                 procedural: bool = False, branching: Optional[int] = None,
+                 encoding: Optional[str] = None, visited: Optional[int] = None,
+                 pruning_ratio: Optional[float] = None, rng=random) -> Dict[str, Any]:
         """
         Generate a MinMax question with optional parameters.
         
         Args:
-            depth: Tree depth (default: random 2-4)
+            depth: Tree depth (default: random 2-4, or 2-3 for game trees)
             max_leaf_value: Maximum leaf value (default: random 9-20)
             template_id: Specific template to use (default: random selection)
+            game: Derive the tree from a real game position ('tictactoe' or 'connect4')
+                  instead of random leaves
+            chance: Interleave chance nodes (expectiminimax question)
+            procedural: Seeded lazy tree; raw_data is the small descriptor
+                        (seed, depth, branching, max_leaf_value) instead of the tree
+            branching: Children per node for procedural trees (default 2)
+            encoding: 'compact' (branching/arity + flat leaf list) or 'base64'
+                      (same, with base64-packed leaves) instead of nested dicts
+            visited: Build the leaves so alpha-beta visits exactly this many
+                     (default depth: one of TARGET_DEPTHS where it is achievable)
+            pruning_ratio: Build the leaves so alpha-beta skips this fraction of
+                           leaves (closest achievable count for the depth)
+            rng: Source of randomness (a per-request `random.Random`; default: the `random` module)
             
         Returns:
             Dictionary with question_text, raw_data, and template_id
+            ('pruning': visited, total_leaves and pruning_ratio for targeted trees)
+
+        Raises:
+            ValueError: for both targets at once, a target on game/chance/procedural
+                        trees, a target the depth cannot reach, a depth/branching
+                        over the limits of `check_tree_size`, an unknown encoding,
+                        or a branching for a tree that is not procedural
         """
+        targeted = visited is not None or pruning_ratio is not None
+        if encoding is not None and encoding not in self.ENCODINGS:
+            raise ValueError(f"Unknown encoding {encoding!r}; expected one of {', '.join(self.ENCODINGS)}")
+        if branching is not None and (game or not procedural):
+            raise ValueError("branching applies only to procedural trees (random and game trees are binary or follow the game)")
+        if visited is not None and pruning_ratio is not None:
+            raise ValueError("Give either visited or pruning_ratio, not both")
+        if targeted and (game or chance or procedural):
+            raise ValueError("Pruning targets apply only to random MAX/MIN trees (no game, chance or procedural)")
+        target_visits = None
         # Select template
         selected_template = None
         
@@ -64,8 +170,11 @@ class MinMaxGenerator:
             )
         
         if not selected_template and self.minmax_templates:
-            # Random selection from available templates
-            selected_template = random.choice(self.minmax_templates)
+            # Random selection from available templates; a pruning target needs a tree
+            candidates = self.minmax_templates
+            if targeted:
+                candidates = [t for t in candidates if set(t.get('tags', [])) & self.DATA_TRIGGER_TAGS] or candidates
+            selected_template = rng.choice(candidates)
         
         # Use template text or fallback
         if selected_template:
@@ -82,26 +191,74 @@ class MinMaxGenerator:
         
         # Check if data generation is needed (only if we have a real template)
         if selected_template:
-            needs_data = bool(template_tags & self.DATA_TRIGGER_TAGS)
+            needs_data = targeted or bool(template_tags & self.DATA_TRIGGER_TAGS)
         
         if needs_data:
             # Generate random parameters if not provided
+            if targeted:
+                depth, target_visits = self._target_visits(depth, visited, pruning_ratio, rng)
             if depth is None:
-                depth = random.randint(2, 4)  # Random depth between 2 and 4
+                # Game trees branch wider, so keep them shallower
+                depth = rng.randint(2, 3) if game else rng.randint(2, 4)
+            # Client-chosen sizes: random trees are built in full, procedural ones may be searched in full
+            check_tree_size(depth, (branching or 2) if procedural and not game else 2,
+                            procedural=procedural and not game)
             if max_leaf_value is None:
-                max_leaf_value = random.randint(9, 20)  # Random max value between 9 and 20
+                max_leaf_value = rng.randint(9, 20)  # Random max value between 9 and 20
+                if target_visits is not None:
+                    # Room for distinct values on every visited leaf
+                    max_leaf_value = max(max_leaf_value, target_visits - 1)
             
             # Generate and append data for calculation-based questions
-            tree = generate_random_tree(depth, max_leaf_value)
-            question_text = template_text + "\n\n" + self._tree_to_string(tree)
-            raw_data = tree_to_dict(tree)
+            if game:
+                tree, board_text = self._generate_game_tree(game, depth, max_leaf_value, rng)
+                question_text = template_text + "\n\n" + board_text + "\n" + self._tree_to_string(tree)
+            elif procedural:
+                tree = ProceduralNode(rng.getrandbits(32), depth, branching or 2, max_leaf_value)
+                if tree.branching ** depth <= self.MAX_RENDERED_LEAVES:
+                    tree_text = self._tree_to_string(tree)
+                else:
+                    tree_text = (
+                        f"Arbore procedural: adâncime {depth}, {tree.branching} copii per nod, "
+                        f"frunze în intervalul [0, {max_leaf_value}] (seed {tree.seed}).\n"
+                    )
+                question_text = template_text + "\n\n" + tree_text
+            elif chance:
+                tree = generate_random_chance_tree(depth, max_leaf_value, rng=rng)
+                # The evaluator prunes chance nodes (Star1) with these same bounds
+                lower, upper = leaf_bounds(tree)
+                chance_text = (
+                    "Nodurile [C p1/p2] sunt noduri de șansă (Expectiminimax); "
+                    f"valorile frunzelor sunt în intervalul [{lower}, {upper}].\n"
+                )
+                question_text = template_text + "\n\n" + chance_text + "\n" + self._tree_to_string(tree)
+            elif targeted:
+                tree = generate_pruning_tree(depth, target_visits, max_leaf_value, rng)
+                question_text = template_text + "\n\n" + self._tree_to_string(tree)
+            else:
+                tree = generate_random_tree(depth, max_leaf_value, rng)
+                question_text = template_text + "\n\n" + self._tree_to_string(tree)
+            # Procedural trees travel as their descriptor and are re-expanded lazily
+            if procedural and not game:
+                raw_data = tree.descriptor()
+            elif encoding in self.ENCODINGS:
+                raw_data = encode_tree(tree, use_base64=(encoding == 'base64'))
+            else:
+                raw_data = tree_to_dict(tree)
         else:
             # Pure theory question - no data generation
             question_text = template_text
             raw_data = None
 
-        return {
+        result = {
             "question_text": question_text,
             "raw_data": raw_data,
             "template_id": final_template_id,
-        }
\ No newline at end of file
+        }
+        if target_visits is not None:
+            result["pruning"] = {
+                "visited": target_visits,
+                "total_leaves": 2 ** depth,
+                "pruning_ratio": round(1 - target_visits / 2 ** depth, 3),
+            }
+        return result
\ No newline at end of file
@@ -7,6 +7,8 @@ Matrix = List[List[Tuple[int, int]]]
 class NashGenerator:
     # Tags that trigger data generation
     DATA_TRIGGER_TAGS = {'requires_calculation', 'hybrid'}
+    # Tiparele de dominare acceptate de generarea constructivă
+    DOMINANCE_PATTERNS = (None, 'none', 'player1', 'player2', 'both')
     
     def __init__(self, templates: Dict[str, Dict[str, Any]]):
         # templates: mapping id -> template dict
@@ -16,21 +18,156 @@ class NashGenerator:
             if 'nash' in tmpl.get('tags', [])
         }
 
-    def _generate_nash_data(self) -> Matrix:
-        rows = random.randint(2, 3)
-        cols = random.randint(2, 3)
+    def _generate_nash_data(self, rng=random) -> Matrix:
+        rows = rng.randint(2, 3)
+        cols = rng.randint(2, 3)
 
         matrix = []
         for _ in range(rows):
             row = []
             for _ in range(cols):
-                p1_payoff = random.randint(0, 9)
-                p2_payoff = random.randint(0, 9)
+                p1_payoff = rng.randint(0, 9)
+                p2_payoff = rng.randint(0, 9)
                 row.append((p1_payoff, p2_payoff))
             matrix.append(row)
 
         return matrix
 
+    def _best_response_maps(self, rows: int, cols: int, equilibria: int,
+                            dominated_row: Optional[int], dominated_col: Optional[int], rng=random
+                            ) -> Optional[Tuple[List[int], List[int]]]:
+        """
+        Alege răspunsurile optime (unice) br1[c] -> rând și br2[r] -> coloană.
+        
+        Profilul (r, c) e echilibru pur exact când br1[c] == r și br2[r] == c, deci
+        împerechem `equilibria` rânduri cu tot atâtea coloane și, pentru restul,
+        alegem răspunsuri care nu închid alt punct fix. Strategiile care trebuie să
+        fie dominate nu pot fi răspuns optim nicăieri.
+        Returns None dacă alegerile aleatoare nu respectă constrângerile.
+        """
+        free_rows = [r for r in range(rows) if r != dominated_row]
+        free_cols = [c for c in range(cols) if c != dominated_col]
+        eq_rows = rng.sample(free_rows, equilibria)
+        eq_cols = rng.sample(free_cols, equilibria)
+        br1: List[Optional[int]] = [None] * cols
+        br2: List[Optional[int]] = [None] * rows
+        for r, c in zip(eq_rows, eq_cols):
+            br1[c], br2[r] = r, c
+        for r in range(rows):
+            if br2[r] is None:
+                br2[r] = rng.choice(free_cols)
+        used = set(eq_rows)
+        for c in rng.sample(range(cols), cols):
+            if br1[c] is not None:
+                continue
+            allowed = [r for r in free_rows if br2[r] != c]
+            if not allowed:
+                return None
+            # Preferăm rânduri care nu sunt încă răspuns optim: mai puține strategii dominate
+            unused = [r for r in allowed if r not in used]
+            br1[c] = rng.choice(unused or allowed)
+            used.add(br1[c])
+        return br1, br2
+
+    @staticmethod
+    def _plant_payoffs(br: List[int], num_strategies: int, dominated: Optional[int],
+                       no_dominated: bool, rng=random) -> Optional[List[List[int]]]:
+        """
+        Câștigurile unui jucător, transpuse: values[s][o] pentru strategia proprie s
+        și strategia o a adversarului, cu maxim strict unic în br[o].
+        
+        Răspunsul optim primește `top`, restul valori din [1, top - 2]. Cu `no_dominated`,
+        fiecare strategie care nu e răspuns optim primește top - 1 în două coloane cu
+        răspunsuri optime diferite, deci nu o poate domina strict nimeni. Strategia
+        `dominated` copiază o altă strategie minus 1, deci e strict dominată de ea.
+        Returns None dacă nu există două coloane cu răspunsuri optime diferite.
+        """
+        num_opponent = len(br)
+        tops = [rng.randint(4, 9) for _ in range(num_opponent)]
+        values = [[rng.randint(1, tops[o] - 2) for o in range(num_opponent)] for _ in range(num_strategies)]
+        for o, s in enumerate(br):
+            values[s][o] = tops[o]
+        if no_dominated:
+            for s in set(range(num_strategies)) - set(br) - {dominated}:
+                first = rng.randrange(num_opponent)
+                second = [o for o in range(num_opponent) if br[o] != br[first]]
+                if not second:
+                    return None
+                for o in (first, rng.choice(second)):
+                    values[s][o] = tops[o] - 1
+        if dominated is not None:
+            dominator = rng.choice([s for s in range(num_strategies) if s != dominated])
+            values[dominated] = [v - 1 for v in values[dominator]]
+        return values
+
+    def _plant_nash_data(self, rows: int, cols: int, equilibria: int,
+                         dominated: Optional[str] = None, attempts: int = 50, rng=random) -> Matrix:
+        """
+        Matrice construită direct (O(r·c)) cu exact `equilibria` echilibre Nash pure.
+        
+        Args:
+            rows, cols: Dimensiunea matricei (2-10)
+            equilibria: Numărul de echilibre pure (0..min(rows, cols))
+            dominated: None (fără cerințe), 'none' (nicio strategie strict dominată),
+                       'player1', 'player2' sau 'both' (exact acei jucători au o
+                       strategie strict dominată de o strategie pură)
+        """
+        if not (2 <= rows <= 10 and 2 <= cols <= 10):
+            raise ValueError(f"Unsupported matrix size: {rows}x{cols} (2-10 rows and columns)")
+        if dominated not in self.DOMINANCE_PATTERNS:
+            raise ValueError(f"Unknown dominance pattern: {dominated}")
+        dominated_p1 = dominated in ('player1', 'both')
+        dominated_p2 = dominated in ('player2', 'both')
+        max_equilibria = min(rows - dominated_p1, cols - dominated_p2)
+        if not 0 <= equilibria <= max_equilibria:
+            raise ValueError(f"Cannot plant {equilibria} pure equilibria in a {rows}x{cols} game "
+                             f"with dominance pattern {dominated} (at most {max_equilibria})")
+        
+        for _ in range(attempts):
+            dominated_row = rng.randrange(rows) if dominated_p1 else None
+            dominated_col = rng.randrange(cols) if dominated_p2 else None
+            maps = self._best_response_maps(rows, cols, equilibria, dominated_row, dominated_col, rng)
+            if maps is None:
+                continue
+            br1, br2 = maps
+            p1 = self._plant_payoffs(br1, rows, dominated_row, dominated is not None, rng)
+            p2 = self._plant_payoffs(br2, cols, dominated_col, dominated is not None, rng)
+            if p1 is None or p2 is None:
+                continue
+            return [[(p1[r][c], p2[c][r]) for c in range(cols)] for r in range(rows)]
+        raise ValueError(f"Could not plant {equilibria} pure equilibria with dominance pattern "
+                         f"{dominated} in a {rows}x{cols} game")
+
+    def _plant_any_count(self, rows: int, cols: int, dominated: Optional[str], rng=random) -> Matrix:
+        """Număr aleator de echilibre pure; unele combinații (ex. 2xN, 0 echilibre, J1 dominat) sunt imposibile."""
+        counts = list(range(min(rows, cols) + 1))
+        rng.shuffle(counts)
+        for equilibria in counts[:-1]:
+            try:
+                return self._plant_nash_data(rows, cols, equilibria, dominated, rng=rng)
+            except ValueError:
+                continue
+        return self._plant_nash_data(rows, cols, counts[-1], dominated, rng=rng)
+
+    def _generate_three_player_data(self, rng=random) -> List[List[List[Tuple[int, int, int]]]]:
+        """Joc 3 jucători: raw[r][c][l] = (p1, p2, p3), 2-3 strategii pentru J1/J2 și 2 pentru J3."""
+        rows = rng.randint(2, 3)
+        cols = rng.randint(2, 3)
+        layers = 2
+        return [[[tuple(rng.randint(0, 9) for _ in range(3)) for _ in range(layers)]
+                 for _ in range(cols)] for _ in range(rows)]
+
+    def _format_three_player_as_string(self, game: List[List[List[Tuple[int, int, int]]]]) -> str:
+        game_str = "\nMatricile de plati (Jucator 1: randuri, Jucator 2: coloane, Jucator 3: matrice):\n"
+        game_str += "--------------------------------------------------\n"
+        for layer in range(len(game[0][0])):
+            game_str += f"Jucator 3 alege strategia {layer + 1}:\n"
+            for row in game:
+                row_str = "\t".join([f"({p1},{p2},{p3})" for p1, p2, p3 in (cell[layer] for cell in row)])
+                game_str += f"\t{row_str}\n"
+        game_str += "--------------------------------------------------\n"
+        return game_str
+
     def _format_matrix_as_string(self, matrix: Matrix) -> str:
         matrix_str = "\nMatricea de plati (Jucator 1: randuri, Jucator 2: coloane):\n"
         matrix_str += "--------------------------------------------------\n"
@@ -42,12 +179,30 @@ class NashGenerator:
         matrix_str += "--------------------------------------------------\n"
         return matrix_str
 
-    def generate(self) -> Dict[str, Any]:
+    def generate(self, players: int = 2, rows: Optional[int] = None, cols: Optional[int] = None,
+                 equilibria: Optional[int] = None, dominated: Optional[str] = None,
+                 rng=random) -> Dict[str, Any]:
+        """
+        Args:
+            players: 2 (matrice bimatricială) sau 3 (câte o matrice pentru fiecare strategie a J3)
+            rows, cols: Dimensiunea matricei (implicit aleatoare 2-3)
+            equilibria: Numărul cerut de echilibre Nash pure (implicit aleator)
+            dominated: Tiparul de dominare ('none', 'player1', 'player2', 'both')
+            rng: Sursa de aleatorism (un `random.Random` per cerere; implicit modulul `random`)
+        
+        Dacă oricare dintre rows/cols/equilibria/dominated e dat, matricea e construită
+        direct (vezi `_plant_nash_data`) în loc să fie aleasă uniform.
+        """
+        if players not in (2, 3):
+            raise ValueError(f"Unsupported number of players: {players}")
+        planted = any(option is not None for option in (rows, cols, equilibria, dominated))
+        if planted and players != 2:
+            raise ValueError("Planted equilibria and dominance patterns are only supported for 2 players")
         if not self.nash_templates:
             return {"error": "Nu s-au găsit șabloane pentru tipul 'nash'."}
 
         # Select template
-        template_id = random.choice(list(self.nash_templates.keys()))
+        template_id = rng.choice(list(self.nash_templates.keys()))
         selected_template = self.nash_templates[template_id]
         template_text = selected_template['template']
         template_tags = set(selected_template.get('tags', []))
@@ -60,8 +215,20 @@ class NashGenerator:
         
         if needs_data:
             # Generate and append data for calculation-based questions
-            raw_matrix = self._generate_nash_data()
-            formatted_matrix_str = self._format_matrix_as_string(raw_matrix)
+            if players == 3:
+                raw_matrix = self._generate_three_player_data(rng)
+                formatted_matrix_str = self._format_three_player_as_string(raw_matrix)
+            elif planted:
+                rows = rows if rows is not None else rng.randint(2, 3)
+                cols = cols if cols is not None else rng.randint(2, 3)
+                if equilibria is not None:
+                    raw_matrix = self._plant_nash_data(rows, cols, equilibria, dominated, rng=rng)
+                else:
+                    raw_matrix = self._plant_any_count(rows, cols, dominated, rng)
+                formatted_matrix_str = self._format_matrix_as_string(raw_matrix)
+            else:
+                raw_matrix = self._generate_nash_data(rng)
+                formatted_matrix_str = self._format_matrix_as_string(raw_matrix)
             final_question_text = template_text + "\n" + formatted_matrix_str
             raw_data = raw_matrix
         else:
@@ -74,4 +241,5 @@ class NashGenerator:
             "raw_data": raw_data,
             "template_id": template_id,
             "requires_dominated": requires_dominated,
+            "players": players,
         }
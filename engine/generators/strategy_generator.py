@@ -7,7 +7,7 @@ class StrategyGenerator:
     generation rules and replacing placeholders in the template text.
     """
     
-    def generate(self, template_data: Dict[str, Any]) -> Dict[str, Any]:
+    def generate(self, template_data: Dict[str, Any], rng=random) -> Dict[str, Any]:
         # Deep copy to avoid modifying the original template
         result = {
             "id": template_data.get("id"),
@@ -25,7 +25,7 @@ class StrategyGenerator:
 
         # Logic for N-Queens
         if problem_type == 'n-queens':
-            n_val = random.choice(rules.get('values', [8]))
+            n_val = rng.choice(rules.get('values', [8]))
             generated_params = {'n_value': n_val}
             result['template'] = result['template'].replace('{{n_value}}', str(n_val))
 
@@ -37,7 +37,7 @@ class StrategyGenerator:
             density = rules.get('density', 'medium')
             
             # Generate random number of nodes within range
-            num_nodes = random.randint(num_nodes_range[0], num_nodes_range[1])
+            num_nodes = rng.randint(num_nodes_range[0], num_nodes_range[1])
             
             generated_params = {
                 'num_nodes': num_nodes,
@@ -52,7 +52,7 @@ class StrategyGenerator:
         elif problem_type in ['hanoi', 'knights-tour']:
             scenarios = rules.get('scenarios', [])
             if scenarios:
-                scenario = random.choice(scenarios)
+                scenario = rng.choice(scenarios)
                 generated_params = scenario
                 
                 # Replace all keys in the scenario dictionary
@@ -29,7 +29,9 @@ class QuestionParser:
         'matrice', 'matrix', 'jucător', 'jucatori', 'player', 'players',
         'payoff', 'câștig', 'castig', 'plată', 'joc', 'game theory',
         'strategie pură', 'strategie pura', 'pure strategy',
-        'dominate', 'dominat', 'dominated'
+        'dominate', 'dominat', 'dominated',
+        'formă extinsă', 'forma extinsa', 'extensive form', 'inducția inversă', 'inductia inversa',
+        'inducție inversă', 'inductie inversa', 'backward induction', 'subjocuri', 'subgame'
     ]
     
     # Keywords pentru detectarea cererii de strategii dominate
@@ -38,6 +40,14 @@ class QuestionParser:
         'strategii dominate', 'strategie dominată', 'strategie dominata'
     ]
 
+    CORRELATED_KEYWORDS = [
+        'corelat', 'corelată', 'corelata', 'correlated'
+    ]
+
+    EVOLUTIONARY_KEYWORDS = [
+        'evolutiv', 'evolutivă', 'evolutiva', 'evolutionar', 'evolutionary', 'replicator'
+    ]
+
     CSP_KEYWORDS = [
         'csp', 'constraint', 'constrângere', 'constrangere', 'satisfacere',
         'colorare', 'coloring', 'graf', 'graph', 'variabil', 'variable',
@@ -55,7 +65,8 @@ class QuestionParser:
     MINMAX_KEYWORDS = [
         'minmax', 'min-max', 'minimax', 'alpha-beta', 'alpha beta',
         'arbore', 'tree', 'maximizator', 'minimizator', 'max', 'min',
-        'adâncime', 'adancime', 'depth', 'tăiere', 'taiere', 'pruning'
+        'adâncime', 'adancime', 'depth', 'tăiere', 'taiere', 'pruning',
+        'expectiminimax', 'șansă', 'sansa', 'chance'
     ]
 
     def parse(self, text: str) -> ParsedQuestion:
@@ -192,6 +203,87 @@ class QuestionParser:
 
         return best_type, confidence
 
+    def _extract_three_player_data(self, text: str) -> Dict[str, Any]:
+        """
+        Extrage un joc cu 3 jucători scris ca blocuri de linii cu triplete (a,b,c):
+        fiecare bloc este matricea (J1 rânduri x J2 coloane) pentru o strategie a J3.
+        Blocurile sunt separate de orice linie ne-goală fără triplete.
+        """
+        triple_pattern = r'\((-?\d+)\s*,\s*(-?\d+)\s*,\s*(-?\d+)\)'
+        blocks = []
+        current = []
+        for line in text.split('\n'):
+            triples = re.findall(triple_pattern, line)
+            if triples:
+                current.append([[int(v) for v in t] for t in triples])
+            elif current and line.strip():
+                blocks.append(current)
+                current = []
+        if current:
+            blocks.append(current)
+        
+        if not blocks:
+            return {}
+        rows, cols = len(blocks[0]), len(blocks[0][0])
+        if any(len(b) != rows or any(len(r) != cols for r in b) for b in blocks):
+            return {}
+        
+        # raw_data[r][c][l] = plățile (p1, p2, p3) pentru profilul (r, c, l)
+        matrix = [[[blocks[l][r][c] for l in range(len(blocks))] for c in range(cols)] for r in range(rows)]
+        return {'raw_data': matrix, 'rows': rows, 'cols': cols, 'layers': len(blocks), 'players': 3}
+    
+    def _extract_extensive_data(self, text: str) -> Dict[str, Any]:
+        """
+        Extrage un joc în formă extinsă scris câte un nod de decizie pe linie:
+            N0 (J1): A -> N1, B -> (3,2)
+        Țintele sunt alte noduri Nk (un nod poate fi refolosit de mai mulți părinți)
+        sau plățile unei frunze. Rădăcina este nodul de pe prima linie.
+        """
+        node_pattern = r'^\s*N(\d+)\s*\(J(\d+)\)\s*:\s*(.+)$'
+        edge_pattern = r'([^\s,:>-]+)\s*->\s*(N\d+|\([-\d,\s]+\))'
+        headers = []
+        for line in text.split('\n'):
+            match = re.match(node_pattern, line)
+            if match:
+                headers.append((int(match.group(1)), int(match.group(2)), re.findall(edge_pattern, match.group(3))))
+        if not headers:
+            return {}
+        
+        # Nodurile de decizie păstrează numerele Nk dacă sunt 0..k-1 cu rădăcina N0,
+        # altfel sunt numerotate în ordinea liniilor; frunzele urmează după ele
+        names = [name for name, _, _ in headers]
+        if sorted(names) == list(range(len(names))) and names[0] == 0:
+            ids = {name: name for name in names}
+        else:
+            ids = {name: i for i, name in enumerate(names)}
+        size = len(headers)
+        players = [0] * size
+        children = [[] for _ in range(size)]
+        actions = [[] for _ in range(size)]
+        payoffs = [None] * size
+        for name, player, edges in headers:
+            node = ids[name]
+            players[node] = player
+            for action, target in edges:
+                if target.startswith('N'):
+                    if int(target[1:]) not in ids:
+                        return {}
+                    child = ids[int(target[1:])]
+                else:
+                    child = len(players)
+                    players.append(0)
+                    children.append([])
+                    actions.append([])
+                    payoffs.append([int(v) for v in re.findall(r'-?\d+', target)])
+                children[node].append(child)
+                actions[node].append(action)
+        num_players = max(len(p) for p in payoffs if p is not None) if size < len(players) else max(players)
+        raw_data = {
+            'format': 'extensive', 'num_players': num_players, 'players': players,
+            'children': children, 'actions': actions, 'payoffs': payoffs
+        }
+        return {'raw_data': raw_data, 'extensive': True, 'players': num_players}
+
     def _extract_nash_data(self, text: str) -> Dict[str, Any]:
         """
         Extrage matricea de payoff din textul întrebării Nash.
@@ -201,10 +293,17 @@ class QuestionParser:
         - [[3,2], [1,4]] sau [[(3,2), (1,4)], ...]
         - Tabel cu valori separate de spații/virgule
         """
-        data = {}
+        # Jocuri în formă extinsă: plățile din frunze nu trebuie citite ca matrice
+        data = self._extract_extensive_data(text)
+        if data:
+            return data
         
-        # Pattern pentru perechi (x,y) sau (x, y)
-        pair_pattern = r'\((\d+)\s*,\s*(\d+)\)'
+        # Jocuri cu 3 jucători: câte o matrice de triplete pentru fiecare strategie a J3
+        # (dacă nu există triplete, rezultatul e gol și continuăm cu perechile)
+        data = self._extract_three_player_data(text)
+        
+        # Pattern pentru perechi (x,y) sau (x, y); plățile pot fi negative (jocuri de sumă nulă)
+        pair_pattern = r'\((-?\d+)\s*,\s*(-?\d+)\)'
         
         # Încercăm să detectăm numărul de coloane pe baza primei linii cu perechi
         lines = text.split('\n')
@@ -306,6 +405,8 @@ class QuestionParser:
         text_lower = text.lower()
         asks_dominated = any(kw in text_lower for kw in self.DOMINATED_KEYWORDS)
         data['asks_dominated'] = asks_dominated
+        data['asks_correlated'] = any(kw in text_lower for kw in self.CORRELATED_KEYWORDS)
+        data['asks_evolutionary'] = any(kw in text_lower for kw in self.EVOLUTIONARY_KEYWORDS)
 
         return data
 
@@ -566,7 +667,8 @@ class QuestionParser:
         """
         Extrage arborele MinMax din text.
         
-        Suportă formatul ASCII tree generat de aplicație:
+        Suportă formatul ASCII tree generat de aplicație (nodurile de șansă
+        apar ca [C p1/p2]):
         └── [ ]
             └── [ ]
                 └── 11
@@ -610,8 +712,8 @@ class QuestionParser:
             return None
         
         def get_indent_level(line: str) -> int:
-            """Calculează nivelul de indentare (4 spații = 1 nivel)"""
-            stripped = line.lstrip()
+            """Calculează nivelul de indentare (4 caractere = 1 nivel, inclusiv ghidajele │)"""
+            stripped = line.replace('│', ' ').lstrip()
             indent = len(line) - len(stripped)
             return indent // 4
         
@@ -640,6 +742,12 @@ class QuestionParser:
                 "children": []
             }
             
+            # Nod de șansă: [C 0.25/0.75] (probabilitățile copiilor, în ordine)
+            chance_match = re.search(r'\[C\s+([\d./\s]+)\]', line)
+            if chance_match:
+                node["kind"] = "chance"
+                node["probs"] = [float(p) for p in chance_match.group(1).split('/') if p.strip()]
+            
             next_idx = start_idx + 1
             
             # Dacă e nod intern (value=None), căutăm copiii
@@ -0,0 +1,141 @@
+import threading
+import time
+from collections import deque
+from typing import Dict, Any, Optional, Callable
+
+
+class QuestionPool:
+    """
+    Pre-generated questions per type, kept topped up by a background thread.
+
+    Endpoints `pop()` a ready question (O(1), no generation or solving on the
+    request path) and fall back to inline generation on a miss. The refill
+    thread generates one question per under-filled type in turn until every
+    queue is back at its watermark, then sleeps until a pop wakes it up.
+    Each pooled question carries its precomputed 'ground_truth' when a
+    solver is given (EvaluationService.ground_truth also keeps it for the
+    evaluate endpoints).
+
+    Only questions generated with default options are pooled; requests with
+    explicit options (sizes, seeds, ...) are still generated inline.
+    """
+
+    def __init__(self, service: Any, watermarks: Dict[str, int],
+                 ground_truth: Optional[Callable[[str, Any], Any]] = None,
+                 idle_interval: float = 1.0):
+        """
+        Args:
+            service: QuestionService used for generation
+            watermarks: q_type -> number of questions kept ready
+            ground_truth: Optional solver (q_type, raw_data) -> correct answer
+            idle_interval: Seconds the refill thread sleeps when all pools are full
+        """
+        self.service = service
+        self.watermarks = dict(watermarks)
+        self.ground_truth = ground_truth
+        self.idle_interval = idle_interval
+        # deque append/popleft are atomic, so pops never wait on the refill thread
+        self._queues = {q_type: deque() for q_type in self.watermarks}
+        self._stats = {q_type: {'hits': 0, 'misses': 0, 'generated': 0, 'errors': 0, 'generation_seconds': 0.0}
+                       for q_type in self.watermarks}
+        # Completion times of the latest refills, for the refill rate
+        self._refills = {q_type: deque(maxlen=100) for q_type in self.watermarks}
+        self._stats_lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self):
+        """Start the background refill thread (no-op if already running)."""
+        if self._thread and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="question-pool-refill", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: float = 5.0):
+        self._stop.set()
+        self._wakeup.set()
+        if self._thread:
+            self._thread.join(timeout)
+            self._thread = None
+
+    def pop(self, q_type: str) -> Optional[Dict[str, Any]]:
+        """A pre-generated question of q_type, or None if that pool is empty (or not pooled)."""
+        queue = self._queues.get(q_type)
+        if queue is None:
+            return None
+        try:
+            item = queue.popleft()
+        except IndexError:
+            item = None
+        with self._stats_lock:
+            self._stats[q_type]['hits' if item is not None else 'misses'] += 1
+        if len(queue) < self.watermarks[q_type]:
+            self._wakeup.set()
+        return item
+
+    def refill_once(self) -> int:
+        """Generate one question for every type below its watermark; returns how many were added."""
+        added = 0
+        for q_type, queue in self._queues.items():
+            if self._stop.is_set():
+                break
+            if len(queue) >= self.watermarks[q_type]:
+                continue
+            start = time.perf_counter()
+            try:
+                item = self.service.generate_question_by_type(q_type)
+                if not item or "error" in item:
+                    raise ValueError(item.get("error") if item else "empty result")
+                # Theory questions (template only) have nothing to solve
+                if self.ground_truth is not None and item.get('raw_data') is not None:
+                    item['ground_truth'] = self.ground_truth(q_type, item['raw_data'])
+            except Exception as e:
+                print(f"Warning: Could not pre-generate a '{q_type}' question: {e}")
+                with self._stats_lock:
+                    self._stats[q_type]['errors'] += 1
+                continue
+            elapsed = time.perf_counter() - start
+            queue.append(item)
+            added += 1
+            with self._stats_lock:
+                self._stats[q_type]['generated'] += 1
+                self._stats[q_type]['generation_seconds'] += elapsed
+                self._refills[q_type].append(time.monotonic())
+        return added
+
+    def fill(self):
+        """Synchronously fill every pool up to its watermark (e.g. before an exam starts)."""
+        while self.refill_once():
+            pass
+
+    def _run(self):
+        while not self._stop.is_set():
+            self._wakeup.clear()
+            if not self.refill_once():
+                # Full (or every generator failing): wait for a pop instead of spinning
+                self._wakeup.wait(self.idle_interval)
+
+    def metrics(self) -> Dict[str, Any]:
+        """Pool depth, hit/miss counts, mean generation time and refill rate per type."""
+        now = time.monotonic()
+        types = {}
+        with self._stats_lock:
+            for q_type, queue in self._queues.items():
+                stats = self._stats[q_type]
+                refills = self._refills[q_type]
+                # Refills per second over the window covered by the latest refills
+                window = now - refills[0] if refills else 0.0
+                types[q_type] = {
+                    'depth': len(queue),
+                    'watermark': self.watermarks[q_type],
+                    'hits': stats['hits'],
+                    'misses': stats['misses'],
+                    'generated': stats['generated'],
+                    'errors': stats['errors'],
+                    'avg_generation_ms': round(1000 * stats['generation_seconds'] / stats['generated'], 3)
+                    if stats['generated'] else 0.0,
+                    'refill_rate': round(len(refills) / window, 3) if window > 0 else 0.0,
+                }
+        return {'running': bool(self._thread and self._thread.is_alive()), 'types': types}
@@ -1,10 +1,14 @@
-import json
-from pathlib import Path
-from typing import Dict, Any
+import random
+import secrets
+from typing import Dict, Any, Optional
 
 from engine.generators.nash_generator import NashGenerator
 from engine.generators.csp_generator import CSPGenerator
 from engine.generators.minmax_generator import MinMaxGenerator
+from engine.generators.extensive_generator import ExtensiveGenerator
+from engine.template_registry import TemplateRegistry
+from engine.dedup import SessionRegistry
+from core_logic.canonical_forms import canonical_hash
 
 
 class QuestionService:
@@ -12,48 +16,124 @@ class QuestionService:
         'nash': ['nash'],
         'csp': ['csp'],
         'minmax': ['minmax'],
+        'extensive': ['extensive-form'],
         'strategy': ['strategy']  # <--- Add this line
     }
 
+    # Fresh draws tried when a session has already seen the generated instance
+    MAX_DUPLICATE_RETRIES = 20
+
     def __init__(self, templates_path: str):
         self.templates_path = templates_path
-        self.templates = {}
-        tp = Path(templates_path)
-        try:
-            with open(tp, 'r', encoding='utf-8') as f:
-                all_templates = json.load(f)
-            # map id -> template dict (kept for NashGenerator compatibility)
-            self.templates = {t['id']: t for t in all_templates if t.get('tags')}
-        except Exception:
-            # keep templates empty; generators will handle missing templates
-            self.templates = {}
-
-    def generate_question_by_type(self, q_type: str = 'nash') -> Dict[str, Any]:
+        # Templates are parsed once and re-read only when the file changes on disk
+        self.registry = TemplateRegistry(templates_path)
+        self._generators: Dict[str, Any] = {}
+        self._generators_version = None
+        # Instances already handed out, per session (canonical hashes)
+        self.sessions = SessionRegistry()
+
+    @property
+    def templates(self) -> Dict[str, Dict[str, Any]]:
+        """map id -> template dict (kept for NashGenerator compatibility)"""
+        return self.registry.by_id()
+
+    def _generator(self, q_type: str):
+        """
+        Generator instance for q_type, shared across requests and rebuilt
+        only after the registry reloads templates.json.
+        """
+        version = self.registry.refresh()
+        if version != self._generators_version:
+            self._generators = {}
+            self._generators_version = version
+        gen = self._generators.get(q_type)
+        if gen is None:
+            templates = self.registry.all()
+            if q_type == 'nash':
+                gen = NashGenerator(self.registry.by_id())
+            elif q_type == 'csp':
+                gen = CSPGenerator(templates=templates)
+            elif q_type == 'minmax':
+                gen = MinMaxGenerator(templates=templates)
+            elif q_type == 'extensive':
+                gen = ExtensiveGenerator(templates=templates)
+            else:
+                raise KeyError(q_type)
+            self._generators[q_type] = gen
+        return gen
+
+    def claim(self, session: str, q_type: str, result: Dict[str, Any]) -> bool:
+        """
+        Record a generated question for the session; False if the session has
+        already seen the same instance up to renaming (see canonical_hash).
+        """
+        key = canonical_hash(q_type, result.get("raw_data"))
+        if key is None:
+            # Theory questions: the template is the question
+            key = f"{q_type}:template:{result.get('template_id')}"
+        return self.sessions.claim(session, key)
+
+    def generate_question_by_type(self, q_type: str = 'nash', seed: Optional[int] = None,
+                                  session: Optional[str] = None, **options: Any) -> Dict[str, Any]:
+        """
+        Generate a question of the given type.
+
+        Extra keyword options are forwarded to the type's generator
+        (e.g. game='tictactoe' for MinMax, players=3 for Nash).
+
+        Each call draws from its own `random.Random(seed)`: the same seed, options
+        and templates give the same question, and concurrent requests share no
+        random state. Without a seed one is drawn; it is returned as 'seed' so
+        the question can be regenerated.
+
+        With a `session`, instances the session has already seen (up to row/column
+        permutations, variable renaming, ...) are skipped: the next seed is drawn
+        from the current one, up to MAX_DUPLICATE_RETRIES times. The returned
+        'seed' is the one that produced the question; 'duplicate' is set when
+        every retry repeated an instance (the option space is exhausted).
+        """
+        if seed is None:
+            seed = secrets.randbits(32)
+        for _ in range(self.MAX_DUPLICATE_RETRIES + 1):
+            result = self._generate(q_type, random.Random(seed), options)
+            if not result or "error" in result:
+                return result
+            result['seed'] = seed
+            if session is None or self.claim(session, q_type, result):
+                return result
+            seed = random.Random(seed).getrandbits(32)
+        result['duplicate'] = True
+        return result
+
+    def _generate(self, q_type: str, rng: random.Random, options: Dict[str, Any]) -> Dict[str, Any]:
         if q_type == 'nash':
-            gen = NashGenerator(self.templates)
-            return gen.generate()
+            gen = self._generator('nash')
+            return gen.generate(rng=rng, **options)
 
         if q_type == 'csp':
-            gen = CSPGenerator(self.templates_path)
-            return gen.generate()
+            gen = self._generator('csp')
+            return gen.generate(rng=rng, **options)
 
         if q_type == 'minmax':
-            gen = MinMaxGenerator(self.templates_path)
-            return gen.generate()
+            gen = self._generator('minmax')
+            return gen.generate(rng=rng, **options)
+
+        if q_type == 'extensive':
+            gen = self._generator('extensive')
+            return gen.generate(rng=rng, **options)
 
         if q_type == 'strategy':
             from engine.generators.strategy_generator import StrategyGenerator
-            # Filter templates with the 'strategy' tag
-            strategy_templates = [t for t in self.templates.values() if 'strategy' in t.get('tags', [])]
+            self.registry.refresh()
+            strategy_templates = self.registry.with_tag('strategy')
             if not strategy_templates:
                 return {"error": "No templates available for strategy questions."}
 
             # Randomly select one template
-            import random
-            selected_template = random.choice(strategy_templates)
+            selected_template = rng.choice(strategy_templates)
 
             # Generate the question using StrategyGenerator
             gen = StrategyGenerator()
-            return gen.generate(selected_template)
+            return gen.generate(selected_template, rng=rng)
 
         return {"error": f"Generator for type '{q_type}' not implemented."}
@@ -0,0 +1,91 @@
+import hashlib
+import json
+import os
+import threading
+from typing import List, Dict, Any, Optional, Tuple
+
+
+class TemplateRegistry:
+    """
+    In-memory copy of templates.json, indexed by id and by tag.
+
+    `refresh()` only stats the file; it is re-read when the (mtime, size)
+    stamp changes and re-parsed only when the content hash changes too, so
+    touching the file is cheap and generating a question does no JSON work.
+    A file that fails to parse after a successful load keeps the previous
+    templates (an editor may be in the middle of saving it).
+    """
+
+    def __init__(self, templates_path: Optional[str]):
+        self.templates_path = templates_path
+        self.version = 0
+        self.loads = 0
+        self._stamp: Optional[Tuple[int, int]] = None
+        self._digest: Optional[str] = None
+        self._templates: List[Dict[str, Any]] = []
+        self._by_id: Dict[str, Dict[str, Any]] = {}
+        self._by_tag: Dict[str, List[Dict[str, Any]]] = {}
+        self._lock = threading.Lock()
+        self.refresh()
+
+    def refresh(self) -> int:
+        """Reload the file if it changed on disk; returns the current version."""
+        try:
+            stat = os.stat(self.templates_path) if self.templates_path else None
+        except OSError:
+            stat = None
+        stamp = (stat.st_mtime_ns, stat.st_size) if stat else None
+        if stamp == self._stamp:
+            return self.version
+
+        with self._lock:
+            if stamp == self._stamp:
+                return self.version
+            if stamp is None:
+                self._install([], None)
+            else:
+                try:
+                    with open(self.templates_path, 'rb') as f:
+                        content = f.read()
+                except OSError:
+                    content = b''
+                digest = hashlib.sha1(content).hexdigest()
+                if digest != self._digest:
+                    try:
+                        templates = json.loads(content.decode('utf-8'))
+                        if not isinstance(templates, list):
+                            raise ValueError("templates.json must hold a list of templates")
+                    except (ValueError, UnicodeDecodeError) as e:
+                        print(f"Warning: Could not load templates from {self.templates_path}: {e}")
+                        if self._digest is None:
+                            self._install([], digest)
+                    else:
+                        self._install(templates, digest)
+            self._stamp = stamp
+        return self.version
+
+    def _install(self, templates: List[Dict[str, Any]], digest: Optional[str]):
+        by_tag: Dict[str, List[Dict[str, Any]]] = {}
+        for t in templates:
+            for tag in t.get('tags', []):
+                by_tag.setdefault(tag, []).append(t)
+        # Swap whole objects so readers never see a half-built index
+        self._templates = templates
+        self._by_id = {t['id']: t for t in templates if t.get('tags')}
+        self._by_tag = by_tag
+        self._digest = digest
+        self.version += 1
+        self.loads += 1
+
+    def all(self) -> List[Dict[str, Any]]:
+        return self._templates
+
+    def by_id(self) -> Dict[str, Dict[str, Any]]:
+        """id -> template, for templates that have tags (the layout NashGenerator expects)."""
+        return self._by_id
+
+    def get(self, template_id: str) -> Optional[Dict[str, Any]]:
+        return self._by_id.get(template_id)
+
+    def with_tag(self, tag: str) -> List[Dict[str, Any]]:
+        return self._by_tag.get(tag, [])
@@ -1,13 +1,29 @@
+import json
+from contextlib import asynccontextmanager
 from pathlib import Path
+from fractions import Fraction
+from typing import Optional
 from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import StreamingResponse
 
 from engine.question_service import QuestionService
 from engine.evaluation_service import EvaluationService
 from engine.question_parser import QuestionParser
-from core_logic.nash_logic import find_pure_nash, find_dominated_strategies
+from engine.question_pool import QuestionPool
+from engine.batch_service import BatchService
+from core_logic.nash_logic import (
+    find_pure_nash, find_dominated_strategies, iterated_elimination, find_mixed_nash, find_mixed_dominated_strategies,
+    is_zero_sum, solve_zero_sum, num_players, correlated_equilibrium
+)
+from core_logic.evolution_logic import simulate_dynamics
+from core_logic.extensive_logic import game_from_dict, backward_induction, normal_form, spe_profile
 from core_logic.csp_logic import backtrack as csp_backtrack, ac3
-from core_logic.minmax_logic import dict_to_tree, minmax as minmax_compute
+from core_logic.minmax_logic import (
+    dict_to_tree, minmax, alphabeta_trace, has_chance_nodes, is_procedural, solve_expectiminimax
+)
+from core_logic.mcts_logic import mcts_solve, LARGE_TREE_LEAVES
+from core_logic.minmax_analysis import pruning_analysis
 from core_logic.strategy_solver import StrategySolver
 from schemas import (
     NashQuestionResponse,
@@ -19,15 +35,27 @@ from schemas import (
     MinMaxQuestionResponse,
     MinMaxSubmission,
     MinMaxEvaluationResponse,
+    ExtensiveQuestionResponse,
     StrategySubmission,
     StrategyQuestionResponse,  # Add this import for Strategy questions
     StrategyEvaluationResponse,
     SolveRequest,
     SolveResponse,
+    PoolMetricsResponse,
+    BatchRequest,
 )
 
 # FastAPI app
-app = FastAPI(title="SmarTest API")
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Keep pre-generated questions ready while the server runs
+    question_pool.start()
+    yield
+    question_pool.stop()
+    batch_service.shutdown()
+
+
+app = FastAPI(title="SmarTest API", lifespan=lifespan)
 
 # Add CORS middleware
 app.add_middleware(
@@ -46,16 +74,207 @@ generator = QuestionService(str(TEMPLATES_PATH))
 evaluator_service = EvaluationService()
 question_parser = QuestionParser()
 
+# Questions kept ready per type (default-option requests are served from the pool)
+POOL_WATERMARKS = {'nash': 20, 'csp': 20, 'minmax': 20, 'extensive': 10}
+question_pool = QuestionPool(generator, POOL_WATERMARKS, ground_truth=evaluator_service.ground_truth)
+batch_service = BatchService(str(TEMPLATES_PATH))
+
+
+def _pooled(q_type: str, session: Optional[str]):
+    """A ready question from the pool, unless the session has already seen that instance."""
+    result = question_pool.pop(q_type)
+    if result and session is not None and not generator.claim(session, q_type, result):
+        return None
+    return result
+
 
 def _tuples_to_lists(matrix):
-    """Convert any tuples in matrix cells to lists for JSON serialization."""
-    return [[list(cell) for cell in row] for row in matrix]
+    """Convert any tuples in matrix cells (at any depth) to lists for JSON serialization."""
+    if isinstance(matrix, (list, tuple)):
+        return [_tuples_to_lists(item) for item in matrix]
+    return matrix
+
+
+def _format_elimination_order(iesds):
+    """Describe the IESDS elimination order (original 0-indexed strategies)."""
+    steps = []
+    for step in iesds['eliminated']:
+        kind = 'rând' if step['player'] == 1 else 'col'
+        steps.append(f"runda {step['round']}: J{step['player']} {kind} {step['strategy']} "
+                     f"(dominat de {kind} {step['dominated_by']})")
+    return (f"Eliminare iterată (IESDS): {'; '.join(steps)}. "
+            f"Rămân rândurile {iesds['player1']} și coloanele {iesds['player2']}.")
+
+
+def _mixed_to_json(profile):
+    """Mixed equilibrium with float probabilities; exact fractions are kept as text."""
+    result = {
+        'p1': [round(float(p), 4) for p in profile['p1']],
+        'p2': [round(float(p), 4) for p in profile['p2']],
+        'payoff': [round(float(v), 4) for v in profile['payoff']],
+    }
+    if isinstance(profile['p1'][0], Fraction):
+        result['p1_exact'] = [str(p) for p in profile['p1']]
+        result['p2_exact'] = [str(p) for p in profile['p2']]
+    return result
+
+
+def _solve_minmax(raw_data):
+    """
+    Exact alpha-beta (Expectiminimax for chance nodes). Only lazy procedural
+    trees over LARGE_TREE_LEAVES leaves, which exact search cannot expand, are
+    estimated with MCTS; an explicit tree was already parsed in full, and
+    alpha-beta is linear in its size.
+    """
+    tree = dict_to_tree(raw_data)
+    if is_procedural(tree) and tree.branching ** tree.depth > LARGE_TREE_LEAVES:
+        result = mcts_solve(tree)
+        solution = {
+            'estimated_root_value': result['root_value'],
+            'method': 'MCTS (UCT)',
+            'best_move': result['best_move'],
+            'confidence': result['confidence'],
+            'playouts': result['playouts']
+        }
+        justification = (
+            f"Valoarea estimată a rădăcinii: {result['root_value']}\n"
+            f"Mutarea recomandată: copilul {result['best_move']} "
+            f"(încredere {result['confidence']:.0%} din {result['playouts']} simulări)\n\n"
+            f"Arborele procedural are peste {LARGE_TREE_LEAVES} frunze, prea multe pentru o căutare exactă, "
+            f"așa că am folosit Monte Carlo Tree Search: UCT echilibrează explorarea și exploatarea, "
+            f"iar valoarea este media simulărilor mutării alese (o estimare, nu valoarea exactă)."
+        )
+        return solution, justification
+    if is_procedural(tree):
+        # Arbore leneș: Alpha-Beta simplu expandează doar nodurile vizitate
+        visited = []
+        root_value = minmax(tree, 0, float('-inf'), float('inf'), True, visited)
+        solution = {
+            'root_value': root_value,
+            'visited_count': len(visited),
+            'visited_nodes': visited
+        }
+        justification = (
+            f"Valoarea rădăcinii: {root_value}\n"
+            f"Noduri frunză vizitate: {len(visited)}\n\n"
+            f"Am aplicat algoritmul MinMax cu optimizarea Alpha-Beta pe arborele procedural, "
+            f"generând doar nodurile pe care căutarea le vizitează."
+        )
+        return solution, justification
+    if has_chance_nodes(tree):
+        # Arbore cu noduri de șansă - Expectiminimax cu tăieri Star1
+        root_value, visited = solve_expectiminimax(tree)
+        solution = {
+            'root_value': root_value,
+            'visited_count': len(visited),
+            'visited_nodes': visited
+        }
+        justification = (
+            f"Valoarea rădăcinii (valoare așteptată): {root_value}\n"
+            f"Noduri frunză vizitate: {len(visited)}\n"
+            f"Ordinea vizitării: {visited}\n\n"
+            f"Am aplicat algoritmul Expectiminimax: nodurile de șansă iau media "
+            f"ponderată a copiilor, iar tăierile Star1 folosesc limitele valorilor frunzelor."
+        )
+        return solution, justification
+
+    # Aplicăm algoritmul MinMax cu Alpha-Beta (cu trace per nod)
+    root_value, visited, trace = alphabeta_trace(tree)
+    pruned_count = sum(1 for row in trace if row[3])
+    analysis = pruning_analysis(tree)
+
+    solution = {
+        'root_value': root_value,
+        'visited_count': len(visited),
+        'visited_nodes': visited,
+        'pruned_count': pruned_count,
+        'best_case_visited': analysis['best_case_visited'],
+        'worst_case_visited': analysis['worst_case_visited'],
+        'trace': trace
+    }
+
+    justification = (
+        f"Valoarea rădăcinii: {root_value}\n"
+        f"Noduri frunză vizitate: {len(visited)}\n"
+        f"Ordinea vizitării: {visited}\n"
+        f"Noduri tăiate: {pruned_count}\n"
+        f"Frunze vizitate cu ordonare optimă / defavorabilă: "
+        f"{analysis['best_case_visited']} / {analysis['worst_case_visited']}\n\n"
+        f"Am aplicat algoritmul MinMax cu optimizarea Alpha-Beta. "
+        f"Rădăcina este un nod MAX. Alpha-Beta pruning a permis eliminarea "
+        f"ramurilor care nu pot influența rezultatul final."
+    )
+    return solution, justification
+
+
+def _solve_extensive(raw_data):
+    """SPE by backward induction, plus the pure Nash equilibria of the normal form for small games."""
+    game = game_from_dict(raw_data)
+    spe = backward_induction(game)
+    solution = {
+        'spe_payoffs': list(spe['payoffs']),
+        'path': spe['path'],
+        'strategy': {f"N{node}": action for node, action in spe['strategy'].items()},
+    }
+    strategy_text = ', '.join(f"{node}: {action}" for node, action in solution['strategy'].items())
+    parts = [
+        f"Prin inducție inversă (fiecare jucător alege, de la frunze spre rădăcină, acțiunea cu plata "
+        f"maximă pentru el), echilibrul perfect în subjocuri este {strategy_text}. Drumul de echilibru "
+        f"este {' -> '.join(spe['path'])}, cu plățile ({', '.join(map(str, spe['payoffs']))})."
+    ]
+    try:
+        form = normal_form(game)
+    except ValueError:
+        return solution, parts[0]
+
+    labels = form['labels']
+    equilibria = find_pure_nash(form['payoffs'])
+    spe_index = spe_profile(game, spe, form)
+    solution['normal_form'] = {'labels': labels, 'payoffs': _tuples_to_lists(form['payoffs'])}
+    solution['nash_equilibria'] = [
+        [labels[player][index] for player, index in enumerate(eq)] for eq in equilibria
+    ]
+    # Echilibrele Nash care nu sunt perfecte în subjocuri se sprijină pe amenințări necredibile
+    non_credible = [eq for eq in equilibria if tuple(eq) != spe_index]
+    if non_credible:
+        names = '; '.join('(' + ', '.join(labels[p][i] for p, i in enumerate(eq)) + ')' for eq in non_credible[:5])
+        if len(non_credible) > 5:
+            names += f" și încă {len(non_credible) - 5}"
+        parts.append(
+            f"În forma normală ({' x '.join(str(len(l)) for l in labels)} strategii) există și echilibrele "
+            f"Nash {names}, care nu sunt perfecte în subjocuri: se bazează pe amenințări necredibile "
+            "în noduri care nu sunt atinse pe drumul de echilibru."
+        )
+    return solution, "\n\n".join(parts)
+
+
+def _format_mix(mixed):
+    """'(1/3, 2/3)' from a _mixed_to_json entry."""
+    p1 = mixed.get('p1_exact', mixed['p1'])
+    p2 = mixed.get('p2_exact', mixed['p2'])
+    return f"J1 = ({', '.join(map(str, p1))}), J2 = ({', '.join(map(str, p2))})"
 
 
 @app.get("/generate/nash", response_model=NashQuestionResponse)
-def generate_nash():
-    """Generate a Nash question (matrix + text)."""
-    result = generator.generate_question_by_type("nash")
+def generate_nash(players: int = 2, rows: Optional[int] = None, cols: Optional[int] = None,
+                  equilibria: Optional[int] = None, dominated: Optional[str] = None, seed: Optional[int] = None,
+                  session: Optional[str] = None):
+    """
+    Generate a Nash question (matrix + text). `players=3` adds one matrix per strategy of player 3.
+    `rows`/`cols` (2-10), `equilibria` (pure equilibrium count) and `dominated`
+    ('none', 'player1', 'player2', 'both') plant the requested structure directly.
+    The same `seed` (and options) always gives the same question.
+    A `session` (e.g. an exam id) never gets the same matrix twice, up to row/column permutations.
+    """
+    result = None
+    if players == 2 and rows is None and cols is None and equilibria is None and dominated is None and seed is None:
+        result = _pooled("nash", session)
+    try:
+        result = result or generator.generate_question_by_type("nash", seed=seed, session=session, players=players,
+                                                               rows=rows, cols=cols, equilibria=equilibria,
+                                                               dominated=dominated)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     if not result or "error" in result:
         raise HTTPException(status_code=500, detail=result.get("error", "Failed to generate question"))
 
@@ -70,6 +289,8 @@ def generate_nash():
         raw_data=raw_data_json,
         template_id=result.get("template_id"),
         requires_dominated=result.get("requires_dominated", False),
+        players=result.get("players", 2),
+        seed=result.get("seed"),
     )
 
 
@@ -100,11 +321,30 @@ def evaluate_nash(payload: NashSubmission):
         user_answer = ""
 
     try:
-        correct_coords = find_pure_nash(raw_data)
+        # Cached answer for pooled questions (solved ahead of time)
+        correct_coords = evaluator_service.ground_truth('nash', raw_data)
         dominated = find_dominated_strategies(raw_data)
     except Exception as e:
         raise HTTPException(status_code=400, detail=f"Invalid raw_data: {e}")
 
+    if payload.mixed_p1 is not None and payload.mixed_p2 is not None:
+        # Mixed-strategy answer: any (approximate) equilibrium is accepted
+        if num_players(raw_data) != 2:
+            raise HTTPException(status_code=400, detail="Mixed-strategy answers are supported for 2-player games only")
+        from engine.evaluators.nash_evaluator import NashEvaluator
+        try:
+            score, details = NashEvaluator().evaluate_mixed(raw_data, payload.mixed_p1, payload.mixed_p2)
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+        correct_mixed = [_mixed_to_json(eq) for eq in details['correct_mixed']]
+        if details['is_equilibrium']:
+            feedback_text = "\u2713 Profilul mixt propus este un echilibru Nash."
+        else:
+            feedback_text = ("\u2717 Profilul mixt propus nu este un echilibru Nash. Echilibre corecte: "
+                             + "; ".join(_format_mix(eq) for eq in correct_mixed))
+        return EvaluationResponse(score=score, correct_coords=correct_coords,
+                                  feedback_text=feedback_text, correct_mixed=correct_mixed)
+
     # Check if this is an extended submission (with dominated strategies)
     is_extended = has_dominated is not None or payload.requires_dominated
     
@@ -118,7 +358,8 @@ def evaluate_nash(payload: NashSubmission):
             has_dominated=has_dominated,
             dominated_p1=dominated_p1,
             dominated_p2=dominated_p2,
-            has_equilibrium=has_equilibrium
+            has_equilibrium=has_equilibrium,
+            correct_coords=correct_coords
         )
         
         # Build feedback text
@@ -137,6 +378,9 @@ def evaluate_nash(payload: NashSubmission):
             else:
                 feedback_parts.append("\u2717 Nu ai identificat corect strategiile dominate.")
         
+        if details['elimination'] and details['elimination']['rounds'] > 1:
+            feedback_parts.append(_format_elimination_order(details['elimination']))
+        
         if 'equilibrium_existence' in details['scores']:
             if details['scores']['equilibrium_existence'] == 1.0:
                 feedback_parts.append("\u2713 Ai r\u0103spuns corect despre existen\u021ba echilibrului Nash.")
@@ -171,9 +415,29 @@ def evaluate_nash(payload: NashSubmission):
 
 
 @app.get("/generate/csp", response_model=CSPQuestionResponse)
-def generate_csp():
-    """Generate a CSP question (variables/domains/constraints + text)."""
-    result = generator.generate_question_by_type("csp")
+def generate_csp(seed: Optional[int] = None, difficulty: Optional[str] = None, satisfiable: Optional[bool] = None,
+                 unique: bool = False, num_variables: Optional[int] = None, session: Optional[str] = None):
+    """
+    Generate a CSP question (variables/domains/constraints + text); a `seed` makes it reproducible.
+    `difficulty` ('easy', 'medium', 'hard') and `satisfiable` target the solver effort
+    (backtracks of plain backtracking) and whether a solution exists.
+    `unique` returns an instance with exactly one solution (`num_variables`: 3-10).
+    A `session` never gets the same instance twice, up to variable renaming.
+    """
+    options = {}
+    if unique:
+        options["unique"] = True
+    if num_variables is not None:
+        options["num_variables"] = num_variables
+    if difficulty is not None:
+        options["difficulty"] = difficulty
+    if satisfiable is not None:
+        options["satisfiable"] = satisfiable
+    try:
+        result = ((not options and seed is None and _pooled("csp", session))
+                  or generator.generate_question_by_type("csp", seed=seed, session=session, **options))
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     if not result or "error" in result:
         raise HTTPException(status_code=500, detail=result.get("error", "Failed to generate CSP question"))
 
@@ -185,6 +449,9 @@ def generate_csp():
         question_text=result.get("question_text", ""),
         raw_data=raw_data,
         template_id=result.get("template_id"),
+        seed=result.get("seed"),
+        difficulty=result.get("difficulty"),
+        unique=result.get("unique", False),
     )
 
 
@@ -226,9 +493,43 @@ def evaluate_csp(payload: CSPSubmission):
 
 
 @app.get("/generate/minmax", response_model=MinMaxQuestionResponse)
-def generate_minmax():
-    """Generate a MinMax question (binary tree + text)."""
-    result = generator.generate_question_by_type("minmax")
+def generate_minmax(game: Optional[str] = None, chance: bool = False, procedural: bool = False,
+                    depth: Optional[int] = None, branching: Optional[int] = None,
+                    encoding: Optional[str] = None, seed: Optional[int] = None,
+                    visited: Optional[int] = None, pruning_ratio: Optional[float] = None,
+                    session: Optional[str] = None):
+    """
+    Generate a MinMax question (binary tree + text).
+    `game` derives the tree from a real game position, `chance` adds chance nodes,
+    `procedural` returns a seeded lazy tree whose raw_data is only a few fields,
+    `encoding` ('compact' or 'base64') returns raw_data as a flat leaf list,
+    `seed` makes the question reproducible.
+    `visited` (exact alpha-beta visited leaves) or `pruning_ratio` (fraction of
+    leaves pruned) builds the leaf values so the search hits that target.
+    A `session` never gets the same tree twice.
+    """
+    options = {}
+    if game:
+        options["game"] = game
+    if chance:
+        options["chance"] = True
+    if procedural:
+        options["procedural"] = True
+    if depth is not None:
+        options["depth"] = depth
+    if branching is not None:
+        options["branching"] = branching
+    if encoding:
+        options["encoding"] = encoding
+    if visited is not None:
+        options["visited"] = visited
+    if pruning_ratio is not None:
+        options["pruning_ratio"] = pruning_ratio
+    try:
+        result = ((not options and seed is None and _pooled("minmax", session))
+                  or generator.generate_question_by_type("minmax", seed=seed, session=session, **options))
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     if not result or "error" in result:
         raise HTTPException(status_code=500, detail=result.get("error", "Failed to generate MinMax question"))
 
@@ -240,35 +541,92 @@ def generate_minmax():
         question_text=result.get("question_text", ""),
         raw_data=raw_data,
         template_id=result.get("template_id"),
+        seed=result.get("seed"),
+        pruning=result.get("pruning"),
+    )
+
+
+@app.get("/generate/extensive", response_model=ExtensiveQuestionResponse)
+def generate_extensive(depth: Optional[int] = None, branching: int = 2, players: int = 2,
+                       seed: Optional[int] = None, session: Optional[str] = None):
+    """
+    Generate an extensive-form (sequential) game question solved by backward induction.
+    A `session` never gets the same game twice, up to the order of the moves at each node.
+    """
+    result = None
+    if depth is None and branching == 2 and players == 2 and seed is None:
+        result = _pooled("extensive", session)
+    try:
+        result = result or generator.generate_question_by_type("extensive", seed=seed, session=session, depth=depth,
+                                                               branching=branching, players=players)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    if not result or "error" in result:
+        raise HTTPException(status_code=500, detail=result.get("error", "Failed to generate extensive-form question"))
+
+    return ExtensiveQuestionResponse(
+        question_text=result.get("question_text", ""),
+        raw_data=result["raw_data"],
+        template_id=result.get("template_id"),
+        seed=result.get("seed"),
     )
 
 
+@app.post("/generate/batch")
+def generate_batch(payload: BatchRequest):
+    """
+    Generate a whole exam sheet (e.g. 200 Nash + 100 MinMax variants) in worker
+    processes, streamed as NDJSON: one JSON object per line, sent as soon as its
+    chunk is ready. Each line has index, type, seed, question_text, raw_data,
+    template_id and, with include_ground_truth, the answer key ('ground_truth');
+    a question that could not be generated has an 'error' field instead.
+    """
+    try:
+        questions = batch_service.generate([item.model_dump() for item in payload.items], payload.seed,
+                                           payload.include_ground_truth)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    lines = (json.dumps(question, ensure_ascii=False, default=str) + "\n" for question in questions)
+    return StreamingResponse(lines, media_type="application/x-ndjson")
+
+
+@app.get("/pool/metrics", response_model=PoolMetricsResponse)
+def pool_metrics():
+    """Depth, hit/miss counts and refill rate of the pre-generated question pools."""
+    return question_pool.metrics()
+
+
 @app.post("/evaluate/minmax", response_model=MinMaxEvaluationResponse)
 def evaluate_minmax(payload: MinMaxSubmission):
     """Evaluate a MinMax submission."""
-    # Recompute correct answers
+    # Correct answers with the per-node alpha-beta trace for feedback (cached
+    # for pooled questions; expectiminimax and lazy trees have no trace)
     try:
-        tree = dict_to_tree(payload.raw_data)
-        visited = []
-        correct_root = minmax_compute(tree, 0, float('-inf'), float('inf'), True, visited)
-        correct_visited = len(visited)
+        dict_to_tree(payload.raw_data)
     except Exception as e:
         raise HTTPException(status_code=400, detail=f"Invalid raw_data: {e}")
+    correct = evaluator_service.ground_truth('minmax', payload.raw_data)
+    if correct is None:
+        raise HTTPException(status_code=400, detail="Invalid raw_data: the tree could not be solved")
 
     try:
         score, feedback_text = evaluator_service.evaluate('minmax', payload)
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
-    return MinMaxEvaluationResponse(score=score, correct_root_value=correct_root, correct_visited_count=correct_visited, feedback_text=feedback_text)
+    return MinMaxEvaluationResponse(score=score, correct_root_value=correct['root_value'], correct_visited_count=correct['visited_count'],
+                                     feedback_text=feedback_text, trace=correct.get('trace'),
+                                     best_case_visited_count=correct.get('best_case_visited'),
+                                     worst_case_visited_count=correct.get('worst_case_visited'))
 
 @app.get("/generate/strategy", response_model=StrategyQuestionResponse)
-def get_strategy_question():
+def get_strategy_question(seed: Optional[int] = None, session: Optional[str] = None):
     """
     Generates a new Strategy Selection question.
     This uses the StrategyGenerator to create dynamic instances (e.g., N=100 vs N=5).
+    A `session` does not get the same instance twice while others are left.
     """
-    result = generator.generate_question_by_type("strategy")
+    result = generator.generate_question_by_type("strategy", seed=seed, session=session)
     if not result or "error" in result:
         raise HTTPException(status_code=500, detail=result.get("error", "Failed to generate Strategy question"))
 
@@ -276,6 +634,7 @@ def get_strategy_question():
         question_text=result.get("question_text", ""),
         raw_data=result.get("raw_data"),
         template_id=result.get("template_id"),
+        seed=result.get("seed"),
     )
 
 @app.post("/evaluate/strategy", response_model=StrategyEvaluationResponse)
@@ -316,11 +675,15 @@ def solve_question(request: SolveRequest):
     try:
         if parsed.question_type == 'nash':
             # Rezolvăm Nash
-            if 'raw_data' in parsed.extracted_data:
+            if parsed.extracted_data.get('extensive'):
+                solution, justification = _solve_extensive(parsed.extracted_data['raw_data'])
+            elif 'raw_data' in parsed.extracted_data:
                 matrix = parsed.extracted_data['raw_data']
                 equilibria = find_pure_nash(matrix)
                 dominated = find_dominated_strategies(matrix)
                 asks_dominated = parsed.extracted_data.get('asks_dominated', False)
+                # IESDS, amestecurile și suma nulă sunt definite doar pentru jocuri bimatriciale
+                two_player = num_players(matrix) == 2
                 
                 solution = {
                     'equilibria': equilibria,
@@ -330,28 +693,121 @@ def solve_question(request: SolveRequest):
                 # Adăugăm strategiile dominate DOAR dacă întrebarea le cere explicit
                 if asks_dominated:
                     solution['dominated'] = dominated
-                    solution['has_dominated'] = bool(dominated['player1'] or dominated['player2'])
+                    solution['has_dominated'] = any(dominated.values())
                 
                 # Construim justificarea
                 justification_parts = []
                 
                 # Partea despre strategii dominate (dacă se cere)
                 if asks_dominated:
-                    if dominated['player1'] or dominated['player2']:
+                    if any(dominated.values()):
                         dom_parts = []
                         if dominated['player1']:
                             dom_parts.append(f"Jucătorul 1: strategiile {', '.join([f'S{i+1} (rând {i})' for i in dominated['player1']])}")
                         if dominated['player2']:
                             dom_parts.append(f"Jucătorul 2: strategiile {', '.join([f'S{i+1} (col {i})' for i in dominated['player2']])}")
+                        if dominated.get('player3'):
+                            dom_parts.append(f"Jucătorul 3: strategiile {', '.join([f'S{i+1} (matricea {i})' for i in dominated['player3']])}")
                         justification_parts.append(f"DA, există strategii strict dominate. {'; '.join(dom_parts)}. O strategie este dominată dacă există o altă strategie care oferă un payoff mai mare indiferent de alegerea adversarului.")
+                        if two_player:
+                            iesds = iterated_elimination(matrix)
+                            solution['iesds'] = iesds
+                            if iesds['rounds'] > 1:
+                                justification_parts.append(_format_elimination_order(iesds))
                     else:
                         justification_parts.append("NU, nu există strategii strict dominate în această matrice. Nicio strategie nu este dominată de o alta pentru niciunul dintre jucători.")
+                    
+                    # Strategii dominate doar de un amestec (pe care testul pur nu le vede)
+                    mixed_dominated = find_mixed_dominated_strategies(matrix) if two_player else None
+                    mixed_parts = []
+                    for player, kind in ((('player1', 'rând'), ('player2', 'col')) if two_player else ()):
+                        for i in mixed_dominated[player]:
+                            if i in dominated[player]:
+                                continue
+                            mix = mixed_dominated['mixes'][player][i]
+                            terms = ' + '.join(f"{p:.2f}·{kind} {k}" for k, p in enumerate(mix) if p > 1e-9)
+                            mixed_parts.append(f"{kind} {i} este dominat de amestecul {terms}")
+                    if mixed_parts:
+                        solution['mixed_dominated'] = {player: mixed_dominated[player] for player in ('player1', 'player2')}
+                        justification_parts.append(f"Strategii strict dominate de o strategie mixtă: {'; '.join(mixed_parts)}.")
                 
                 # Partea despre echilibre Nash
                 if equilibria:
-                    justification_parts.append(f"Echilibrele Nash pure găsite: {', '.join([f'({e[0]}, {e[1]})' for e in equilibria])}. Un echilibru Nash apare când niciun jucător nu poate îmbunătăți unilateral câștigul său.")
+                    justification_parts.append(f"Echilibrele Nash pure găsite: {', '.join(['(' + ', '.join(map(str, e)) + ')' for e in equilibria])}. Un echilibru Nash apare când niciun jucător nu poate îmbunătăți unilateral câștigul său.")
+                elif not two_player:
+                    justification_parts.append("Nu există echilibre Nash pure în acest joc cu 3 jucători (fiecare profil lasă cel puțin un jucător cu o deviere profitabilă).")
                 else:
-                    justification_parts.append("Nu există echilibre Nash pure în această matrice. Jocul poate avea doar echilibre în strategii mixte.")
+                    mixed = [_mixed_to_json(eq) for eq in find_mixed_nash(matrix)]
+                    solution['mixed_equilibria'] = mixed
+                    justification_parts.append(
+                        "Nu există echilibre Nash pure în această matrice. Echilibre în strategii mixte "
+                        f"(probabilități pe rânduri / coloane): {'; '.join(_format_mix(eq) for eq in mixed)}. "
+                        "Fiecare jucător amestecă astfel încât adversarul să fie indiferent între strategiile din suport."
+                    )
+                
+                # Jocurile de sumă nulă au o valoare unică (legătura cu MinMax)
+                if two_player and is_zero_sum(matrix):
+                    zero_sum = solve_zero_sum(matrix)
+                    solution['zero_sum'] = zero_sum
+                    if zero_sum['saddle_points']:
+                        r, c = zero_sum['saddle_points'][0]
+                        justification_parts.append(
+                            f"Jocul este de sumă nulă și are punct șa în ({r}, {c}): maximin = minimax = {zero_sum['maximin']}, "
+                            f"deci valoarea jocului este {zero_sum['value']:g} în strategii pure."
+                        )
+                    else:
+                        justification_parts.append(
+                            f"Jocul este de sumă nulă fără punct șa (maximin = {zero_sum['maximin']} < minimax = {zero_sum['minimax']}). "
+                            f"Prin programare liniară, valoarea jocului este {zero_sum['value']:g}, cu strategiile optime "
+                            f"J1 = ({', '.join(f'{p:g}' for p in zero_sum['p1'])}), J2 = ({', '.join(f'{p:g}' for p in zero_sum['p2'])})."
+                        )
+                
+                # Echilibrul corelat (doar la cerere): distribuția care maximizează bunăstarea
+                if two_player and parsed.extracted_data.get('asks_correlated', False):
+                    correlated = correlated_equilibrium(matrix)
+                    solution['correlated'] = correlated
+                    support = [
+                        f"({r}, {c}): {p:g}"
+                        for r, row in enumerate(correlated['distribution'])
+                        for c, p in enumerate(row) if p > 0
+                    ]
+                    justification_parts.append(
+                        f"Echilibrul corelat care maximizează bunăstarea socială ({correlated['welfare']:g}) "
+                        f"recomandă profilurile cu probabilitățile {', '.join(support)}, "
+                        f"cu câștigurile așteptate {correlated['payoffs'][0]:g} și {correlated['payoffs'][1]:g}. "
+                        "Niciun jucător nu câștigă ignorând recomandarea primită."
+                    )
+
+                # Dinamica replicatorului (doar la cerere): stările stabile și bazinele lor de atracție
+                if two_player and parsed.extracted_data.get('asks_evolutionary', False):
+                    dynamics = simulate_dynamics(matrix, seed=0)
+                    converged = sum(dynamics['converged'])
+                    solution['evolutionary'] = {
+                        'symmetric': dynamics['symmetric'],
+                        'populations': len(dynamics['converged']),
+                        'converged': converged,
+                        'outcomes': dynamics['outcomes'],
+                    }
+                    states = []
+                    for outcome in dynamics['outcomes']:
+                        if dynamics['symmetric']:
+                            state = f"({', '.join(f'{p:g}' for p in outcome['state'])})"
+                            label = "ESS" if outcome['ess'] else "nu este ESS"
+                        else:
+                            state = (f"J1 = ({', '.join(f'{p:g}' for p in outcome['p1'])}), "
+                                     f"J2 = ({', '.join(f'{p:g}' for p in outcome['p2'])})")
+                            label = "echilibru Nash" if outcome['is_nash'] else "nu este echilibru Nash"
+                        states.append(f"{state}: {outcome['share']:.1%} din populații, {label}")
+                    if states:
+                        justification_parts.append(
+                            f"Dinamica replicatorului, pornită din {len(dynamics['converged'])} populații aleatoare, "
+                            f"converge către: {'; '.join(states)}."
+                        )
+                    if converged < len(dynamics['converged']):
+                        justification_parts.append(
+                            f"{len(dynamics['converged']) - converged} populații nu se stabilizează "
+                            "(traiectoriile ciclează în jurul unui echilibru mixt)."
+                        )
                 
                 justification = "\n\n".join(justification_parts)
             else:
@@ -504,29 +960,7 @@ def solve_question(request: SolveRequest):
             data = parsed.extracted_data
             if 'raw_data' in data and data['raw_data']:
                 try:
-                    from core_logic.minmax_logic import dict_to_tree, minmax
-                    
-                    # Reconstruim arborele
-                    tree = dict_to_tree(data['raw_data'])
-                    
-                    # Aplicăm algoritmul MinMax cu Alpha-Beta
-                    visited = []
-                    root_value = minmax(tree, 0, float('-inf'), float('inf'), True, visited)
-                    
-                    solution = {
-                        'root_value': root_value,
-                        'visited_count': len(visited),
-                        'visited_nodes': visited
-                    }
-                    
-                    justification = (
-                        f"Valoarea rădăcinii: {root_value}\n"
-                        f"Noduri frunză vizitate: {len(visited)}\n"
-                        f"Ordinea vizitării: {visited}\n\n"
-                        f"Am aplicat algoritmul MinMax cu optimizarea Alpha-Beta. "
-                        f"Rădăcina este un nod MAX. Alpha-Beta pruning a permis eliminarea "
-                        f"ramurilor care nu pot influența rezultatul final."
-                    )
+                    solution, justification = _solve_minmax(data['raw_data'])
                 except Exception as e:
                     error_message = f"Eroare la rezolvarea MinMax: {str(e)}"
             else:
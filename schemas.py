@@ -1,40 +1,54 @@
-from typing import List, Optional, Tuple
+from typing import List, Optional, Tuple, Union
 from pydantic import BaseModel
 from typing import Dict, Any
 
 
+# Matrice bimatricială (r x c x 2) sau joc cu 3 jucători (r x c x l x 3)
+NashPayoffs = Union[List[List[List[int]]], List[List[List[List[int]]]]]
+
+
 class NashQuestionResponse(BaseModel):
     question_text: str
-    raw_data: List[List[List[int]]]
+    raw_data: NashPayoffs
     template_id: Optional[str]
     requires_dominated: bool = False  # True dacă întrebarea cere și strategii dominate
+    players: int = 2
+    seed: Optional[int] = None  # aceeași valoare la /generate/nash?seed=... reproduce întrebarea
 
 
 class NashSubmission(BaseModel):
     user_answer: Optional[Any] = None  # String pentru Nash simplu, dict pentru extended, sau None
-    # raw_data is a matrix where each cell is [p1, p2]
-    raw_data: List[List[List[int]]]
+    # raw_data is a matrix where each cell is [p1, p2] (or a 3-player tensor of [p1, p2, p3])
+    raw_data: NashPayoffs
     # Pentru întrebări cu strategii dominate
     requires_dominated: Optional[bool] = None  # Dacă întrebarea cere strategii dominate
     has_dominated: Optional[bool] = None  # Răspunsul utilizatorului: există strategii dominate?
     dominated_p1: Optional[List[int]] = None  # Strategiile dominate pentru jucătorul 1
     dominated_p2: Optional[List[int]] = None  # Strategiile dominate pentru jucătorul 2
     has_equilibrium: Optional[bool] = None  # Răspunsul utilizatorului: există echilibru Nash?
+    # Echilibru în strategii mixte propus de utilizator (probabilități pe rânduri / coloane)
+    mixed_p1: Optional[List[float]] = None
+    mixed_p2: Optional[List[float]] = None
 
 
 class EvaluationResponse(BaseModel):
     score: float
-    correct_coords: List[Tuple[int, int]]
+    correct_coords: List[Tuple[int, ...]]
     feedback_text: Optional[str] = None
     # Pentru întrebări cu strategii dominate
     correct_dominated_p1: Optional[List[int]] = None
     correct_dominated_p2: Optional[List[int]] = None
+    # Pentru întrebări cu echilibre mixte
+    correct_mixed: Optional[List[Dict[str, Any]]] = None
 
 
 class CSPQuestionResponse(BaseModel):
     question_text: str
     raw_data: Dict[str, Any]
     template_id: Optional[str]
+    seed: Optional[int] = None
+    difficulty: Optional[Dict[str, Any]] = None  # backtrack-uri BT / BT+FC+MRV, satisfiabilitate, nr. soluții
+    unique: bool = False  # soluție unică (dată fiind asignarea parțială)
 
 
 class CSPSubmission(BaseModel):
@@ -55,19 +69,34 @@ class MinMaxQuestionResponse(BaseModel):
     question_text: str
     raw_data: Dict[str, Any]
     template_id: Optional[str]
+    seed: Optional[int] = None
+    pruning: Optional[Dict[str, Any]] = None  # ținta alpha-beta: frunze vizitate, total, fracție tăiată
+
+
+class ExtensiveQuestionResponse(BaseModel):
+    question_text: str
+    raw_data: Dict[str, Any]  # format 'extensive': players / children / actions / payoffs per nod
+    template_id: Optional[str]
+    seed: Optional[int] = None
 
 
 class MinMaxSubmission(BaseModel):
-    root_value: Optional[int] = None
+    root_value: Optional[Union[int, float]] = None  # float pentru arbori cu noduri de șansă
     visited_count: Optional[int] = None
+    # Arbore imbricat (tree_to_dict) sau format compact: "uniform"/"compact" (encode_tree), "procedural"
     raw_data: Dict[str, Any]
 
 
 class MinMaxEvaluationResponse(BaseModel):
     score: float
-    correct_root_value: int
+    correct_root_value: Union[int, float]
     correct_visited_count: int
     feedback_text: Optional[str] = None
+    # One row per node in preorder: [value, alpha, beta, pruned] (see TRACE_FIELDS)
+    trace: Optional[List[List[Any]]] = None
+    # Frunze vizitate cu ordonarea optimă / cea mai defavorabilă a copiilor
+    best_case_visited_count: Optional[int] = None
+    worst_case_visited_count: Optional[int] = None
 
 
 class StrategySubmission(BaseModel):
@@ -79,6 +108,7 @@ class StrategyQuestionResponse(BaseModel):
     question_text: str
     raw_data: Dict[str, Any]
     template_id: str
+    seed: Optional[int] = None
 
 class StrategyEvaluationResponse(BaseModel):
     score: float
@@ -86,6 +116,19 @@ class StrategyEvaluationResponse(BaseModel):
     feedback_text: Optional[str] = None
 
 
+# Bulk generation (exam sheets)
+class BatchItem(BaseModel):
+    type: str
+    count: int
+    options: Dict[str, Any] = {}  # aceleași opțiuni ca la /generate/<type>
+
+
+class BatchRequest(BaseModel):
+    items: List[BatchItem]
+    seed: Optional[int] = None
+    include_ground_truth: bool = False
+
+
 # Solver schemas
 class SolveRequest(BaseModel):
     question_text: str
@@ -97,4 +140,21 @@ class SolveResponse(BaseModel):
     extracted_data: Dict[str, Any]
     solution: Optional[Dict[str, Any]] = None
     justification: Optional[str] = None
-    error_message: Optional[str] = None
\ No newline at end of file
+    error_message: Optional[str] = None
+
+
+# Pre-generated question pool
+class PoolTypeMetrics(BaseModel):
+    depth: int
+    watermark: int
+    hits: int
+    misses: int
+    generated: int
+    errors: int
+    avg_generation_ms: float
+    refill_rate: float
+
+
+class PoolMetricsResponse(BaseModel):
+    running: bool
+    types: Dict[str, PoolTypeMetrics]
@@ -0,0 +1,101 @@
+"""
+Test script for bulk exam-sheet generation (/generate/batch): request planning,
+worker-process generation, reproducibility and the NDJSON stream.
+"""
+import sys
+import json
+from pathlib import Path
+
+# Add parent directory to Python path
+project_root = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(project_root))
+
+from engine import batch_service
+from engine.batch_service import BatchService, CHUNK_SIZE, MAX_BATCH_QUESTIONS
+from core_logic.nash_logic import find_pure_nash
+
+TEMPLATES_PATH = str(project_root / "assets" / "json_output" / "templates.json")
+
+SHEET = [
+    {'type': 'nash', 'count': 120},
+    {'type': 'minmax', 'count': 60, 'options': {'chance': True}},
+    {'type': 'csp', 'count': 20},
+]
+
+
+def test_plan():
+    chunks = BatchService.plan(SHEET, seed=1)
+    tasks = [task for _, _, chunk in chunks for task in chunk]
+    assert [index for index, _ in tasks] == list(range(200))
+    assert len({seed for _, seed in tasks}) == 200
+    assert all(len(chunk) <= CHUNK_SIZE for _, _, chunk in chunks)
+    assert chunks == BatchService.plan(SHEET, seed=1)
+    for bad in ([{'type': 'poker', 'count': 1}], [{'type': 'nash', 'count': 0}],
+                [{'type': 'nash', 'count': MAX_BATCH_QUESTIONS + 1}],
+                [{'type': 'nash', 'count': MAX_BATCH_QUESTIONS + 1000}, {'type': 'csp', 'count': -2000}],
+                [{'type': 'nash', 'count': -1}]):
+        try:
+            BatchService.plan(bad)
+        except ValueError:
+            continue
+        raise AssertionError(f"accepted {bad}")
+
+
+def test_worker_processes_reproducible():
+    service = BatchService(TEMPLATES_PATH, max_workers=2)
+    try:
+        first = sorted(service.generate(SHEET, seed=7, include_ground_truth=True), key=lambda q: q['index'])
+        second = sorted(service.generate(SHEET, seed=7, include_ground_truth=True), key=lambda q: q['index'])
+    finally:
+        service.shutdown()
+    assert len(first) == 200 and not any('error' in q for q in first)
+    assert first == second
+    nash = [q for q in first if q['type'] == 'nash' and q['raw_data'] is not None]
+    assert nash and all(q['ground_truth'] == find_pure_nash(q['raw_data']) for q in nash)
+    assert all(isinstance(q['ground_truth']['root_value'], float) for q in first if q['type'] == 'minmax')
+    # In-process generation (small batches) gives the same questions for the same seeds
+    inline = BatchService(TEMPLATES_PATH, max_workers=1)
+    assert sorted(inline.generate(SHEET, seed=7, include_ground_truth=True), key=lambda q: q['index']) == first
+
+
+def test_bad_options_reported_per_question():
+    questions = list(BatchService(TEMPLATES_PATH).generate([{'type': 'nash', 'count': 3, 'options': {'rows': 50}}]))
+    assert len(questions) == 3 and all('error' in q for q in questions)
+    # Any generator exception is an error line, not the end of the stream
+    class FailingService:
+        def generate_question_by_type(self, q_type, seed=None, **options):
+            raise RuntimeError("solver crashed")
+
+    batch_service._services['failing'] = FailingService()
+    try:
+        questions = batch_service._generate_chunk('failing', 'nash', {}, [(0, 1), (1, 2)], False)
+    finally:
+        del batch_service._services['failing']
+    assert [q['error'] for q in questions] == ["solver crashed"] * 2
+
+
+def test_api_ndjson_stream():
+    from fastapi.testclient import TestClient
+    import main
+
+    client = TestClient(main.app)
+    response = client.post("/generate/batch", json={
+        "items": [{"type": "extensive", "count": 10}, {"type": "strategy", "count": 5}],
+        "seed": 3, "include_ground_truth": True,
+    })
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+    lines = [json.loads(line) for line in response.text.splitlines()]
+    assert sorted(q['index'] for q in lines) == list(range(15))
+    assert all('ground_truth' in q for q in lines)
+    assert client.post("/generate/batch", json={"items": [{"type": "poker", "count": 1}]}).status_code == 400
+    assert client.post("/generate/batch", json={"items": [{"type": "nash", "count": 6000},
+                                                          {"type": "csp", "count": -2000}]}).status_code == 400
+
+
+if __name__ == "__main__":
+    test_plan()
+    test_worker_processes_reproducible()
+    test_bad_options_reported_per_question()
+    test_api_ndjson_stream()
+    print("✓ All batch generation tests passed")
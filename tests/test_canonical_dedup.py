@@ -0,0 +1,152 @@
+"""
+Test script for canonical instance hashing (Nash matrices up to row/column
+permutations, CSPs up to variable renaming, extensive-form games up to move
+order) and per-session duplicate suppression.
+"""
+import sys
+import time
+import random
+from pathlib import Path
+
+# Add parent directory to Python path
+project_root = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(project_root))
+
+from core_logic.canonical_forms import canonical_hash
+from core_logic.minmax_logic import generate_random_tree, tree_to_dict, encode_tree
+from engine.dedup import SeenSet, SessionRegistry
+from engine.question_service import QuestionService
+
+TEMPLATES_PATH = str(project_root / "assets" / "json_output" / "templates.json")
+
+NAMES = "ABCDEFGHIJ"
+
+
+def _csp(variables, domains, constraints, partial):
+    return {'variables': variables, 'domains': domains, 'constraints': constraints, 'partial_assignment': partial}
+
+
+def test_nash_permutations():
+    rng = random.Random(50)
+    for _ in range(200):
+        rows, cols = rng.randint(2, 6), rng.randint(2, 6)
+        matrix = [[(rng.randint(0, 3), rng.randint(0, 3)) for _ in range(cols)] for _ in range(rows)]
+        pr, pc = rng.sample(range(rows), rows), rng.sample(range(cols), cols)
+        permuted = [[matrix[r][c] for c in pc] for r in pr]
+        assert canonical_hash('nash', matrix) == canonical_hash('nash', permuted)
+    # Swapping the players' payoffs is a different game
+    matrix = [[(3, 0), (1, 1)], [(0, 0), (2, 2)]]
+    swapped = [[(b, a) for a, b in row] for row in matrix]
+    assert canonical_hash('nash', matrix) != canonical_hash('nash', swapped)
+    # Three players: permute the strategies of each
+    game = [[[[rng.randint(0, 5) for _ in range(3)] for _ in range(2)] for _ in range(2)] for _ in range(2)]
+    permuted = [[[game[1 - i][j][1 - k] for k in range(2)] for j in range(2)] for i in range(2)]
+    assert canonical_hash('nash', game) == canonical_hash('nash', permuted)
+
+
+def test_symmetric_games_are_fast():
+    """A permutation-matrix game has n! automorphisms; they must be pruned, not enumerated."""
+    n = 10
+    cyclic = [[(1, 1) if j == (i + 1) % n else (0, 0) for j in range(n)] for i in range(n)]
+    start = time.time()
+    digest = canonical_hash('nash', cyclic)
+    assert time.time() - start < 2
+    diagonal = [[(1, 1) if i == j else (0, 0) for j in range(n)] for i in range(n)]
+    assert canonical_hash('nash', diagonal) == digest
+    shifted = [[(1, 1) if j == (i + 2) % n else (0, 0) for j in range(n)] for i in range(n)]
+    shifted[0][0] = (0, 1)
+    assert canonical_hash('nash', shifted) != digest
+
+
+def test_csp_renaming():
+    rng = random.Random(51)
+    for _ in range(200):
+        n = rng.randint(3, 10)
+        variables = list(NAMES[:n])
+        domains = {v: sorted(rng.sample([1, 2, 3], rng.randint(1, 3))) for v in variables}
+        constraints = [(a, b) for i, a in enumerate(variables) for b in variables[i + 1:] if rng.random() < 0.3]
+        partial = {variables[0]: domains[variables[0]][0]} if rng.random() < 0.5 else {}
+        rename = dict(zip(variables, rng.sample(variables, n)))
+        renamed = _csp([rename[v] for v in reversed(variables)], {rename[v]: d for v, d in domains.items()},
+                       [(rename[b], rename[a]) for a, b in constraints], {rename[v]: x for v, x in partial.items()})
+        assert canonical_hash('csp', _csp(variables, domains, constraints, partial)) == canonical_hash('csp', renamed)
+    # Same degrees, different graphs: a 6-cycle and two triangles
+    six = list(NAMES[:6])
+    domains = {v: [1, 2] for v in six}
+    cycle = [(six[i], six[(i + 1) % 6]) for i in range(6)]
+    triangles = [('A', 'B'), ('B', 'C'), ('A', 'C'), ('D', 'E'), ('E', 'F'), ('D', 'F')]
+    assert canonical_hash('csp', _csp(six, domains, cycle, {})) != canonical_hash('csp', _csp(six, domains, triangles, {}))
+    # Highly symmetric graphs stay cheap (twins are tried once)
+    ten = list(NAMES)
+    complete = [(a, b) for i, a in enumerate(ten) for b in ten[i + 1:]]
+    for constraints in ([], complete):
+        assert canonical_hash('csp', _csp(ten, {v: [1, 2, 3] for v in ten}, constraints, {}))
+
+
+def test_trees():
+    tree = generate_random_tree(3, 9, random.Random(52))
+    assert canonical_hash('minmax', tree_to_dict(tree)) == canonical_hash('minmax', encode_tree(tree))
+    mirrored = tree_to_dict(tree)
+    mirrored['children'].reverse()
+    # Child order changes the alpha-beta answer: not a duplicate
+    assert canonical_hash('minmax', mirrored) != canonical_hash('minmax', tree_to_dict(tree))
+
+    game = {"format": "extensive", "num_players": 2, "players": [1, 2, 2, 0, 0, 0, 0],
+            "children": [[1, 2], [3, 4], [5, 6], [], [], [], []],
+            "actions": [["A", "B"], ["a", "b"], ["a", "b"], [], [], [], []],
+            "payoffs": [None, None, None, [1, 1], [5, 2], [4, 4], [9, 3]]}
+    swapped = dict(game, children=[[2, 1], [4, 3], [5, 6], [], [], [], []])
+    assert canonical_hash('extensive', game) == canonical_hash('extensive', swapped)
+    other = dict(game, payoffs=[None, None, None, [1, 1], [5, 2], [4, 4], [3, 9]])
+    assert canonical_hash('extensive', game) != canonical_hash('extensive', other)
+
+
+def test_seen_sets_are_bounded():
+    seen = SeenSet(capacity=3)
+    assert all(seen.add(k) for k in "abcd")
+    assert len(seen) == 3 and 'a' not in seen and not seen.add('d')
+    sessions = SessionRegistry(max_sessions=2, capacity=10)
+    assert sessions.claim('s1', 'x') and not sessions.claim('s1', 'x')
+    assert sessions.claim('s2', 'x') and sessions.claim('s3', 'x')
+    assert len(sessions) == 2 and sessions.claim('s1', 'x')
+
+
+def test_service_skips_duplicates():
+    service = QuestionService(TEMPLATES_PATH)
+    # Small 2x2 games repeat quickly without the session check
+    keys = set()
+    for _ in range(30):
+        result = service.generate_question_by_type('nash', session='exam-1', rows=2, cols=2)
+        if result.get('duplicate'):
+            continue
+        key = canonical_hash('nash', result['raw_data'])
+        assert key not in keys
+        keys.add(key)
+    # The returned seed regenerates the returned question
+    result = service.generate_question_by_type('csp', seed=5, session='exam-2')
+    assert service.generate_question_by_type('csp', seed=result['seed']) == result
+    retried = service.generate_question_by_type('csp', seed=5, session='exam-2')
+    assert retried['seed'] != 5 and canonical_hash('csp', retried['raw_data']) != canonical_hash('csp', result['raw_data'])
+    # Other sessions are unaffected
+    assert service.generate_question_by_type('csp', seed=5, session='exam-3') == result
+
+
+def test_api_session():
+    from fastapi.testclient import TestClient
+    import main
+
+    client = TestClient(main.app)
+    first = client.get("/generate/minmax", params={"seed": 8, "session": "api-exam"}).json()
+    second = client.get("/generate/minmax", params={"seed": 8, "session": "api-exam"}).json()
+    assert first['seed'] == 8 and second['seed'] != 8 and first['raw_data'] != second['raw_data']
+
+
+if __name__ == "__main__":
+    test_nash_permutations()
+    test_symmetric_games_are_fast()
+    test_csp_renaming()
+    test_trees()
+    test_seen_sets_are_bounded()
+    test_service_skips_duplicates()
+    test_api_session()
+    print("✓ All canonical hashing and deduplication tests passed")
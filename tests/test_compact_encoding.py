@@ -0,0 +1,111 @@
+"""
+Test script for the compact (uniform / arity + leaf array) MinMax raw_data encoding.
+"""
+import sys
+import random
+from pathlib import Path
+
+# Add parent directory to Python path
+project_root = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(project_root))
+
+from core_logic.minmax_logic import (
+    Node, generate_random_tree, generate_random_chance_tree,
+    tree_to_dict, dict_to_tree, encode_tree, minmax
+)
+from core_logic.game_logic import TicTacToe, build_game_tree
+from engine.evaluators.minmax_evaluator import MinMaxEvaluator
+from engine.generators.minmax_generator import MinMaxGenerator
+
+
+def _solve(tree):
+    visited = []
+    root = minmax(tree, 0, float('-inf'), float('inf'), True, visited)
+    return root, visited
+
+
+def test_uniform_round_trip():
+    random.seed(32)
+    tree = generate_random_tree(6, 50)
+    for use_base64 in (False, True):
+        encoded = encode_tree(tree, use_base64)
+        assert encoded['format'] == 'uniform'
+        assert encoded['branching'] == [2] * 6
+        assert tree_to_dict(dict_to_tree(encoded)) == tree_to_dict(tree)
+
+
+def test_irregular_tree_uses_arity():
+    game = TicTacToe()
+    state = game.initial_state()
+    for move in [4, 0, 8, 2]:
+        state = game.play(state, move)
+    tree = build_game_tree(game, state, 3, True, 10)
+    encoded = encode_tree(tree)
+    assert encoded['format'] == 'compact'
+    assert tree_to_dict(dict_to_tree(encoded)) == tree_to_dict(tree)
+
+
+def test_ragged_tree_round_trip():
+    # A leaf next to an internal node: not uniform even though the first node of each level agrees
+    tree = Node(children=[Node(value=3), Node(children=[Node(value=1), Node(value=5)])])
+    for use_base64 in (False, True):
+        encoded = encode_tree(tree, use_base64)
+        assert encoded['format'] == 'compact'
+        assert tree_to_dict(dict_to_tree(encoded)) == tree_to_dict(tree)
+    generator = MinMaxGenerator()
+    for seed in range(300):
+        raw_data = generator.generate(game='tictactoe', encoding='base64', rng=random.Random(seed))['raw_data']
+        _solve(dict_to_tree(raw_data))
+
+
+def test_wide_and_negative_leaves():
+    tree = Node(children=[Node(value=-40000), Node(value=7), Node(value=300)])
+    encoded = encode_tree(tree, use_base64=True)
+    assert encoded['leaf_bytes'] == 4
+    assert tree_to_dict(dict_to_tree(encoded)) == tree_to_dict(tree)
+
+
+def test_chance_tree_keeps_nested_format():
+    random.seed(32)
+    tree = generate_random_chance_tree(3)
+    assert encode_tree(tree) == tree_to_dict(tree)
+
+
+def test_inconsistent_payload_rejected():
+    for raw_data in ({"format": "uniform", "branching": [2, 2], "leaves": [1, 2, 3]},
+                     {"format": "compact", "arity": [2, 0], "leaves": [1]},
+                     {"format": "compact", "arity": [0, 0], "leaves": [1, 2]},
+                     {"format": "compact", "arity": [2, 0, 0], "leaves": [1, 2, 3]}):
+        try:
+            dict_to_tree(raw_data)
+        except ValueError:
+            continue
+        raise AssertionError(f"accepted {raw_data}")
+
+
+def test_generator_compact_payload():
+    templates_path = project_root / "assets" / "json_output" / "templates.json"
+    generator = MinMaxGenerator(str(templates_path))
+    for encoding in ('compact', 'base64'):
+        raw_data = generator.generate(depth=8, encoding=encoding)['raw_data']
+        assert 'children' not in raw_data
+        root, visited = _solve(dict_to_tree(raw_data))
+        score = MinMaxEvaluator().evaluate({"root_value": root, "visited_count": len(visited)}, raw_data)
+        assert score == 1.0
+    try:
+        generator.generate(depth=3, encoding='zip')
+    except ValueError:
+        pass
+    else:
+        raise AssertionError("unknown encoding accepted")
+
+
+if __name__ == "__main__":
+    test_uniform_round_trip()
+    test_irregular_tree_uses_arity()
+    test_ragged_tree_round_trip()
+    test_wide_and_negative_leaves()
+    test_chance_tree_keeps_nested_format()
+    test_inconsistent_payload_rejected()
+    test_generator_compact_payload()
+    print("✓ All compact encoding tests passed")
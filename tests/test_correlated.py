@@ -0,0 +1,104 @@
+"""
+Test script for correlated equilibria (incentive-constraint LP with constraint generation).
+"""
+import sys
+import time
+from pathlib import Path
+
+# Add parent directory to Python path
+project_root = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(project_root))
+
+import numpy as np
+
+from core_logic.nash_logic import correlated_equilibrium, payoff_arrays
+from core_logic.lp_logic import simplex, interior_point
+from engine.question_parser import QuestionParser
+
+
+CHICKEN = [[(6, 6), (2, 7)], [(7, 2), (0, 0)]]
+
+
+def _max_gain(m, distribution):
+    """Largest expected gain from deviating from a recommendation, over both players."""
+    a, b = payoff_arrays(m)
+    p = np.asarray(distribution)
+    gain_1 = (p[:, None, :] * (a[None, :, :] - a[:, None, :])).sum(axis=2)
+    gain_2 = (p.T[:, None, :] * (b.T[None, :, :] - b.T[:, None, :])).sum(axis=2)
+    return max(gain_1.max(), gain_2.max())
+
+
+def test_chicken_welfare_optimum():
+    result = correlated_equilibrium(CHICKEN)
+    print(result)
+    assert np.allclose(result['distribution'], [[0.5, 0.25], [0.25, 0]], atol=1e-3)
+    assert abs(result['welfare'] - 10.5) < 1e-3
+    assert abs(result['payoffs'][0] - 5.25) < 1e-3
+
+
+def test_feasibility_mode():
+    result = correlated_equilibrium(CHICKEN, maximize_welfare=False)
+    assert abs(np.sum(result['distribution']) - 1) < 1e-3
+    assert _max_gain(CHICKEN, result['distribution']) <= 1e-3
+
+
+def test_random_games_satisfy_incentives():
+    rng = np.random.default_rng(39)
+    for size in (3, 5, 20):
+        for maximize_welfare in (True, False):
+            m = rng.integers(0, 100, size=(size, size, 2))
+            result = correlated_equilibrium(m, maximize_welfare=maximize_welfare)
+            assert abs(np.sum(result['distribution']) - 1) < 1e-2
+            # Rounding the distribution to 4 decimals costs at most a few hundredths
+            assert _max_gain(m, result['distribution']) <= 0.05
+
+
+def test_large_game_is_fast():
+    m = np.random.default_rng(40).integers(0, 1000, size=(50, 50, 2))
+    start = time.perf_counter()
+    result = correlated_equilibrium(m)
+    elapsed = time.perf_counter() - start
+    print(f"50x50: {result['rounds']} rounds, {result['constraints_used']} constraints, {elapsed * 1000:.0f} ms")
+    assert result['constraints_used'] < 50 * 49 * 2
+    assert elapsed < 10.0
+
+
+def test_round_limit_is_an_error():
+    """Stopping with violated incentive constraints would return a non-equilibrium."""
+    m = np.random.default_rng(42).integers(0, 100, size=(6, 6, 2))
+    assert correlated_equilibrium(m, batch=1)['rounds'] > 2
+    try:
+        correlated_equilibrium(m, batch=1, max_rounds=2)
+    except ValueError:
+        pass
+    else:
+        raise AssertionError("returned a distribution with violated constraints")
+
+
+def test_interior_point_matches_simplex():
+    rng = np.random.default_rng(41)
+    for _ in range(50):
+        n, m = rng.integers(1, 8, size=2)
+        a = np.vstack([rng.integers(-5, 10, size=(m, n)), np.ones(n)])
+        b = np.append(rng.integers(0, 20, size=m), 10)
+        c = rng.integers(-3, 10, size=n)
+        result = interior_point(c, a, b)
+        assert result['status'] == 'optimal'
+        assert abs(result['value'] - simplex(c, a, b)['value']) < 1e-6
+
+
+def test_parser_detects_correlated_question():
+    text = "Calculați echilibrul corelat pentru jocul:\nA1 (6,6) (2,7)\nA2 (7,2) (0,0)"
+    parsed = QuestionParser().parse(text)
+    assert parsed.extracted_data['asks_correlated']
+
+
+if __name__ == "__main__":
+    test_chicken_welfare_optimum()
+    test_feasibility_mode()
+    test_random_games_satisfy_incentives()
+    test_large_game_is_fast()
+    test_round_limit_is_an_error()
+    test_interior_point_matches_simplex()
+    test_parser_detects_correlated_question()
+    print("✓ All correlated equilibrium tests passed")
@@ -0,0 +1,89 @@
+"""
+Test script for difficulty-targeted CSP generation (solver effort bands,
+satisfiability and solution counts).
+"""
+import sys
+import random
+import time
+from pathlib import Path
+
+# Add parent directory to Python path
+project_root = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(project_root))
+
+from core_logic.csp_logic import backtrack, search_stats
+from engine.generators.csp_generator import CSPGenerator
+
+
+def test_search_stats_matches_backtrack():
+    rng = random.Random(47)
+    generator = CSPGenerator()
+    for _ in range(200):
+        variables, domains, constraints, partial = generator._generate_csp_data(rng)
+        for use_mrv, use_fc in ((False, False), (True, True)):
+            stats = search_stats(variables, domains, constraints, partial, use_mrv, use_fc)
+            assert stats['first_solution'] == backtrack(variables, domains, constraints, dict(partial), use_mrv, use_fc)
+
+
+def test_search_stats_counts():
+    # Triangle with two colors: every branch fails
+    variables = ['A', 'B', 'C']
+    stats = search_stats(variables, {v: [1, 2] for v in variables}, [('A', 'B'), ('B', 'C'), ('A', 'C')], {},
+                         use_mrv=False, use_fc=False, max_solutions=None)
+    assert stats == {'nodes': 4, 'backtracks': 4, 'solutions': 0, 'first_solution': None}
+    # Chain with three colors: 3 * 2 * 2 solutions
+    stats = search_stats(variables, {v: [1, 2, 3] for v in variables}, [('A', 'B'), ('B', 'C')], {},
+                         max_solutions=None, record=True)
+    assert stats['solutions'] == 12 and len(stats['assignments']) == 12
+
+
+def test_bands_are_hit():
+    generator = CSPGenerator()
+    rng = random.Random(48)
+    start = time.perf_counter()
+    for difficulty, (low, high) in CSPGenerator.DIFFICULTY_BANDS.items():
+        for satisfiable in (None, True, False):
+            if difficulty == 'easy' and satisfiable is False:
+                continue
+            for _ in range(10):
+                data, metrics = generator._generate_targeted_csp_data(difficulty, satisfiable, rng)
+                variables, domains, constraints, partial = data
+                plain = search_stats(variables, domains, constraints, partial, use_mrv=False, use_fc=False)
+                every = search_stats(variables, domains, constraints, partial, max_solutions=None)
+                assert low <= plain['backtracks'] == metrics['backtracks_bt'] <= high
+                # The incrementally maintained solution list agrees with a fresh search
+                assert every['solutions'] == metrics['solutions']
+                assert metrics['satisfiable'] == (every['solutions'] > 0)
+                if satisfiable is not None:
+                    assert metrics['satisfiable'] == satisfiable
+    assert time.perf_counter() - start < 20.0
+
+
+def test_impossible_requests():
+    for args in (('easy', False), ('extreme', None)):
+        try:
+            CSPGenerator()._generate_targeted_csp_data(*args)
+        except ValueError:
+            continue
+        raise AssertionError(f"accepted {args}")
+
+
+def test_api_difficulty():
+    from fastapi.testclient import TestClient
+    import main
+
+    client = TestClient(main.app)
+    body = client.get("/generate/csp", params={"difficulty": "hard", "satisfiable": "false", "seed": 5}).json()
+    assert body['difficulty']['band'] == 'hard' and not body['difficulty']['satisfiable']
+    assert body['difficulty']['backtracks_bt'] >= CSPGenerator.DIFFICULTY_BANDS['hard'][0]
+    assert client.get("/generate/csp", params={"difficulty": "hard", "satisfiable": "false", "seed": 5}).json() == body
+    assert client.get("/generate/csp", params={"difficulty": "trivial"}).status_code == 400
+
+
+if __name__ == "__main__":
+    test_search_stats_matches_backtrack()
+    test_search_stats_counts()
+    test_bands_are_hit()
+    test_impossible_requests()
+    test_api_difficulty()
+    print("✓ All CSP difficulty tests passed")
@@ -0,0 +1,106 @@
+"""
+Test script for the evolutionary dynamics simulator (replicator / best-response)
+and the evolutionary stability (ESS) check.
+"""
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+# Add parent directory to Python path
+project_root = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(project_root))
+
+from core_logic.evolution_logic import simulate_dynamics, is_ess, is_symmetric_game
+from engine.question_parser import QuestionParser
+
+
+HAWK_DOVE = [[(0, 0), (4, 1)], [(1, 4), (2, 2)]]
+PRISONERS = [[(3, 3), (0, 5)], [(5, 0), (1, 1)]]
+STAG_HUNT = [[(4, 4), (0, 3)], [(3, 0), (2, 2)]]
+ROCK_PAPER_SCISSORS = [[(0, 0), (-1, 1), (1, -1)], [(1, -1), (0, 0), (-1, 1)], [(-1, 1), (1, -1), (0, 0)]]
+BATTLE_OF_SEXES = [[(2, 1), (0, 0)], [(0, 0), (1, 2)]]
+
+
+def test_hawk_dove_mixed_ess():
+    result = simulate_dynamics(HAWK_DOVE, populations=500, seed=1)
+    assert result['symmetric'] and all(result['converged'])
+    [outcome] = result['outcomes']
+    assert np.allclose(outcome['state'], [2 / 3, 1 / 3], atol=1e-3)
+    assert outcome['is_nash'] and outcome['ess'] and outcome['share'] == 1.0
+
+
+def test_prisoners_dilemma_both_dynamics():
+    for dynamics in ('replicator', 'best_response'):
+        result = simulate_dynamics(PRISONERS, populations=200, dynamics=dynamics, seed=2)
+        assert [o['state'] for o in result['outcomes']] == [[0.0, 1.0]]
+        assert result['outcomes'][0]['ess']
+
+
+def test_stag_hunt_basins():
+    result = simulate_dynamics(STAG_HUNT, populations=1000, seed=3)
+    states = {tuple(o['state']): o for o in result['outcomes']}
+    assert set(states) == {(1.0, 0.0), (0.0, 1.0)}
+    assert all(o['ess'] and o['is_nash'] for o in states.values())
+    # Hare is risk dominant: its basin (stag share below 2/3) holds about 2/3 of the simplex
+    assert abs(states[(0.0, 1.0)]['share'] - 2 / 3) < 0.05
+
+
+def test_cycling_is_not_converged():
+    """Rock-paper-scissors orbits its interior equilibrium; no vertex may be reported."""
+    result = simulate_dynamics(ROCK_PAPER_SCISSORS, populations=50, max_steps=2000, seed=4)
+    assert not any(result['converged'])
+    assert result['outcomes'] == []
+
+
+def test_two_population_game():
+    assert not is_symmetric_game(BATTLE_OF_SEXES)
+    result = simulate_dynamics(BATTLE_OF_SEXES, populations=400, seed=5)
+    assert not result['symmetric'] and all(result['converged'])
+    pairs = {(tuple(o['p1']), tuple(o['p2'])) for o in result['outcomes']}
+    assert pairs == {((1.0, 0.0), (1.0, 0.0)), ((0.0, 1.0), (0.0, 1.0))}
+    assert all(o['is_nash'] for o in result['outcomes'])
+
+
+def test_is_ess():
+    hawk_dove = np.array([[0, 4], [1, 2]])
+    assert is_ess(hawk_dove, [2 / 3, 1 / 3])
+    assert not is_ess(hawk_dove, [1, 0])
+    # Coordination game: both pure equilibria are ESS, the mixed one is not
+    coordination = np.array([[2, 0], [0, 1]])
+    assert is_ess(coordination, [1, 0]) and is_ess(coordination, [0, 1])
+    assert not is_ess(coordination, [1 / 3, 2 / 3])
+    # Rock-paper-scissors: the uniform equilibrium is only neutrally stable
+    assert not is_ess(np.array([[0, -1, 1], [1, 0, -1], [-1, 1, 0]]), [1 / 3] * 3)
+
+
+def test_batch_and_early_stopping():
+    start = time.perf_counter()
+    result = simulate_dynamics(STAG_HUNT, populations=5000, seed=6)
+    assert time.perf_counter() - start < 5.0
+    assert all(result['converged']) and max(result['steps']) < 5000
+    initial = np.array([[0.9, 0.1], [0.1, 0.9]])
+    result = simulate_dynamics(STAG_HUNT, initial=initial)
+    assert np.allclose(result['final'], [[1, 0], [0, 1]], atol=1e-6)
+
+
+def test_parser_keyword():
+    parsed = QuestionParser().parse(
+        "Care dintre echilibrele Nash este stabil evolutiv în jocul de mai jos?\n"
+        "Matricea: (0,0) (4,1)\n(1,4) (2,2)"
+    )
+    assert parsed.question_type == 'nash'
+    assert parsed.extracted_data.get('asks_evolutionary')
+
+
+if __name__ == "__main__":
+    test_hawk_dove_mixed_ess()
+    test_prisoners_dilemma_both_dynamics()
+    test_stag_hunt_basins()
+    test_cycling_is_not_converged()
+    test_two_population_game()
+    test_is_ess()
+    test_batch_and_early_stopping()
+    test_parser_keyword()
+    print("✓ All evolutionary dynamics tests passed")
@@ -0,0 +1,76 @@
+"""
+Test script for chance nodes: expectiminimax with Star1 pruning,
+tree serialization and parsing of generated questions.
+"""
+import sys
+import random
+from pathlib import Path
+
+# Add parent directory to Python path
+project_root = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(project_root))
+
+from core_logic.minmax_logic import (
+    CHANCE, dict_to_tree, tree_to_dict, expectiminimax, generate_random_chance_tree,
+    has_chance_nodes, solve_expectiminimax,
+)
+from engine.evaluators.minmax_evaluator import MinMaxEvaluator
+from engine.generators.minmax_generator import MinMaxGenerator
+from engine.question_parser import QuestionParser
+
+
+def _leaf(v):
+    return {"value": v, "children": []}
+
+
+def test_expectiminimax_value():
+    """MAX chooses between two lotteries: 0.5*4 + 0.5*8 = 6 vs 0.25*0 + 0.75*10 = 7.5."""
+    raw = {"value": None, "children": [
+        {"value": None, "kind": CHANCE, "probs": [0.5, 0.5], "children": [_leaf(4), _leaf(8)]},
+        {"value": None, "kind": CHANCE, "probs": [0.25, 0.75], "children": [_leaf(0), _leaf(10)]},
+    ]}
+    tree = dict_to_tree(raw)
+    assert has_chance_nodes(tree)
+    assert tree_to_dict(tree) == raw
+    root_value, visited = solve_expectiminimax(tree)
+    assert root_value == 7.5
+    assert visited == [4, 8, 0, 10]
+
+
+def test_star1_prunes_and_keeps_value():
+    """Star1 never changes the root value and never visits more leaves."""
+    random.seed(28)
+    pruned_any = False
+    for _ in range(200):
+        tree = generate_random_chance_tree(random.randint(1, 6), 20)
+        full_visited = []
+        full_value = expectiminimax(tree, True, full_visited)
+        root_value, visited = solve_expectiminimax(tree)
+        assert abs(round(full_value, 2) - root_value) < 1e-9
+        assert len(visited) <= len(full_visited)
+        pruned_any = pruned_any or len(visited) < len(full_visited)
+    assert pruned_any
+
+
+def test_generated_chance_question_round_trip():
+    """The parser rebuilds the exact tree from the generated question text."""
+    templates_path = project_root / "assets" / "json_output" / "templates.json"
+    generator = MinMaxGenerator(str(templates_path))
+    parser = QuestionParser()
+    evaluator = MinMaxEvaluator()
+    for _ in range(10):
+        result = generator.generate(chance=True)
+        parsed = parser.parse(result['question_text'])
+        assert parsed.question_type == 'minmax'
+        assert parsed.extracted_data['raw_data'] == result['raw_data']
+
+        root_value, visited = solve_expectiminimax(dict_to_tree(result['raw_data']))
+        answer = {"root_value": root_value, "visited_count": len(visited)}
+        assert evaluator.evaluate(answer, result['raw_data']) == 1.0
+
+
+if __name__ == "__main__":
+    test_expectiminimax_value()
+    test_star1_prunes_and_keeps_value()
+    test_generated_chance_question_round_trip()
+    print("✓ All expectiminimax tests passed")
@@ -0,0 +1,123 @@
+"""
+Test script for extensive-form games: backward induction (SPE), shared subgames
+and the conversion to normal form.
+"""
+import sys
+import time
+import random
+from pathlib import Path
+
+# Add parent directory to Python path
+project_root = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(project_root))
+
+from core_logic.extensive_logic import (
+    ExtensiveGame, game_to_dict, game_from_dict, backward_induction, normal_form, spe_profile,
+    generate_random_extensive
+)
+from core_logic.nash_logic import find_pure_nash
+from engine.generators.extensive_generator import ExtensiveGenerator
+from engine.question_parser import QuestionParser
+
+
+# Entry deterrence: the entrant stays out (1, 5) or enters; the incumbent fights (0, 0) or accommodates (2, 2)
+ENTRY = {
+    "format": "extensive", "num_players": 2,
+    "players": [1, 2, 0, 0, 0],
+    "children": [[1, 2], [3, 4], [], [], []],
+    "actions": [["Intra", "Stai"], ["Lupta", "Accepta"], [], [], []],
+    "payoffs": [None, None, [1, 5], [0, 0], [2, 2]],
+}
+
+
+def test_entry_game_spe():
+    spe = backward_induction(game_from_dict(ENTRY))
+    assert spe['payoffs'] == (2, 2)
+    assert spe['path'] == ["Intra", "Accepta"]
+    assert spe['strategy'] == {0: "Intra", 1: "Accepta"}
+
+
+def test_normal_form_has_non_credible_threat():
+    game = game_from_dict(ENTRY)
+    form = normal_form(game)
+    assert form['labels'] == [["Intra", "Stai"], ["Lupta", "Accepta"]]
+    assert form['payoffs'] == [[(0, 0), (2, 2)], [(1, 5), (1, 5)]]
+    equilibria = find_pure_nash(form['payoffs'])
+    assert sorted(equilibria) == [(0, 1), (1, 0)]
+    assert spe_profile(game, backward_induction(game), form) == (0, 1)
+
+
+def test_spe_is_nash_of_normal_form():
+    random.seed(41)
+    for _ in range(200):
+        game = generate_random_extensive(random.randint(1, 3), random.randint(2, 3), random.choice([2, 3]))
+        spe = backward_induction(game)
+        try:
+            form = normal_form(game)
+        except ValueError:
+            continue
+        assert spe_profile(game, spe, form) in [tuple(eq) for eq in find_pure_nash(form['payoffs'])]
+        assert backward_induction(game_from_dict(game_to_dict(game))) == spe
+
+
+def test_shared_subgames_solved_once():
+    """A 60-level game where both actions lead to the same subgame: 2^60 paths, 61 nodes."""
+    depth = 60
+    players = [1 + level % 2 for level in range(depth)] + [0]
+    children = [[level + 1, level + 1] for level in range(depth)] + [[]]
+    actions = [["L", "R"]] * depth + [[]]
+    game = ExtensiveGame(2, players, children, actions, [None] * depth + [(3, 4)])
+    spe = backward_induction(game)
+    assert spe['payoffs'] == (3, 4)
+    assert spe['nodes_solved'] == depth + 1
+    assert len(spe['path']) == depth
+
+
+def test_deep_game_is_iterative():
+    """Centipede-like chain of 100k decision nodes: no recursion limit, still fast."""
+    n = 100000
+    players = [1 + i % 2 for i in range(n)] + [0, 0]
+    children = [[i + 1, n + i % 2] if i < n - 1 else [n, n + 1] for i in range(n)] + [[], []]
+    game = ExtensiveGame(2, players, children, [["c", "s"]] * n + [[], []], [None] * n + [(1, 0), (0, 1)])
+    start = time.perf_counter()
+    spe = backward_induction(game)
+    assert spe['nodes_solved'] == n + 2
+    assert time.perf_counter() - start < 2.0
+
+
+def test_invalid_games_rejected():
+    cyclic = dict(ENTRY, children=[[1, 2], [0, 4], [], [], []])
+    short_payoff = dict(ENTRY, payoffs=[None, None, [1], [0, 0], [2, 2]])
+    for data in (cyclic, short_payoff):
+        try:
+            game_from_dict(data)
+        except ValueError:
+            continue
+        raise AssertionError(f"accepted {data}")
+    try:
+        normal_form(generate_random_extensive(5, 3))
+    except ValueError:
+        pass
+    else:
+        raise AssertionError("built a huge normal form")
+
+
+def test_generator_and_parser_round_trip():
+    random.seed(42)
+    for players in (2, 3):
+        result = ExtensiveGenerator().generate(depth=3, players=players)
+        parsed = QuestionParser().parse(result['question_text'])
+        assert parsed.question_type == 'nash'
+        assert parsed.extracted_data['extensive']
+        assert game_to_dict(game_from_dict(parsed.extracted_data['raw_data'])) == result['raw_data']
+
+
+if __name__ == "__main__":
+    test_entry_game_spe()
+    test_normal_form_has_non_credible_threat()
+    test_spe_is_nash_of_normal_form()
+    test_shared_subgames_solved_once()
+    test_deep_game_is_iterative()
+    test_invalid_games_rejected()
+    test_generator_and_parser_round_trip()
+    print("✓ All extensive-form game tests passed")
@@ -0,0 +1,95 @@
+"""
+Test script for the bitboard games and game-derived MinMax trees.
+"""
+import sys
+from pathlib import Path
+
+# Add parent directory to Python path
+project_root = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(project_root))
+
+from core_logic.game_logic import BitboardGame, TicTacToe, ConnectFour, build_game_tree
+from core_logic.minmax_logic import minmax, dict_to_tree, count_leaves
+from engine.generators.minmax_generator import MinMaxGenerator
+
+
+def _play(game, moves):
+    state = game.initial_state()
+    for m in moves:
+        state = game.play(state, m)
+    return state
+
+
+def test_tictactoe_terminal_detection():
+    """X completes the main diagonal and the position is terminal."""
+    game = TicTacToe()
+    state = _play(game, [0, 1, 4, 2, 8])
+    print(game.render(state))
+    assert game.last_mover_won(state)
+    assert game.is_terminal(state)
+    assert game.legal_moves(_play(game, [4])) == [0, 1, 2, 3, 5, 6, 7, 8]
+
+
+def test_tictactoe_full_game_is_draw():
+    """Perfect play from the empty board is a draw (midpoint score)."""
+    game = TicTacToe()
+    # Start after two moves so the test stays fast
+    state = _play(game, [4, 0])
+    tree = build_game_tree(game, state, 9, True, 10)
+    visited = []
+    assert minmax(tree, 0, float('-inf'), float('inf'), True, visited) == 5
+
+
+def test_connect_four_wins():
+    """Vertical, horizontal and diagonal lines are detected with shifts."""
+    game = ConnectFour(4, 4, 3)
+    vertical = _play(game, [0, 1, 0, 1, 0])
+    horizontal = _play(game, [0, 0, 1, 1, 2])
+    diagonal = _play(game, [0, 1, 1, 2, 3, 2, 2])
+    for state in (vertical, horizontal, diagonal):
+        print(game.render(state) + "\n")
+        assert game.last_mover_won(state)
+    assert not game.last_mover_won(_play(game, [0, 1, 0, 1]))
+
+
+def test_connect_four_full_column():
+    game = ConnectFour(4, 4, 3)
+    state = _play(game, [0, 0, 0, 0])
+    assert 0 not in game.legal_moves(state)
+
+
+def test_games_must_implement_the_rules():
+    class NoRules(BitboardGame):
+        def legal_moves(self, state):
+            return []
+
+    try:
+        NoRules(3, 3, 3)
+    except TypeError:
+        pass
+    else:
+        raise AssertionError("a game without play/cell_bit was instantiated")
+
+
+def test_generator_game_trees():
+    """Generated game trees are in tree_to_dict format and stay small."""
+    templates_path = project_root / "assets" / "json_output" / "templates.json"
+    generator = MinMaxGenerator(str(templates_path))
+    for game in ('tictactoe', 'connect4'):
+        for _ in range(5):
+            result = generator.generate(game=game)
+            tree = dict_to_tree(result['raw_data'])
+            assert count_leaves(tree) <= MinMaxGenerator.MAX_GAME_LEAVES
+            visited = []
+            minmax(tree, 0, float('-inf'), float('inf'), True, visited)
+            assert visited
+
+
+if __name__ == "__main__":
+    test_tictactoe_terminal_detection()
+    test_tictactoe_full_game_is_draw()
+    test_connect_four_wins()
+    test_connect_four_full_column()
+    test_games_must_implement_the_rules()
+    test_generator_game_trees()
+    print("✓ All game tree tests passed")
@@ -0,0 +1,79 @@
+"""
+Test script for iterated elimination of strictly dominated strategies (IESDS).
+"""
+import sys
+import random
+from pathlib import Path
+
+# Add parent directory to Python path
+project_root = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(project_root))
+
+import numpy as np
+
+from core_logic.nash_logic import iterated_elimination, find_dominated_strategies, find_pure_nash
+
+
+def _naive_iesds(m):
+    """Repeatedly run one-round dominance on the reduced matrix."""
+    rows, cols = list(range(len(m))), list(range(len(m[0])))
+    while True:
+        sub = [[m[r][c] for c in cols] for r in rows]
+        dominated = find_dominated_strategies(sub)
+        if not dominated['player1'] and not dominated['player2']:
+            return rows, cols
+        rows = [r for k, r in enumerate(rows) if k not in dominated['player1']]
+        cols = [c for k, c in enumerate(cols) if k not in dominated['player2']]
+
+
+def test_textbook_example():
+    """Column 2, then row 1, then column 0 are eliminated in turn."""
+    m = [[(1, 0), (1, 2), (0, 1)],
+         [(0, 3), (0, 1), (2, 0)]]
+    result = iterated_elimination(m)
+    print(result)
+    assert result['player1'] == [0] and result['player2'] == [1]
+    assert result['rounds'] == 3
+    order = [(e['player'], e['strategy'], e['dominated_by']) for e in result['eliminated']]
+    assert order == [(2, 2, 1), (1, 1, 0), (2, 0, 1)]
+
+
+def test_matches_naive_rounds():
+    random.seed(34)
+    for _ in range(200):
+        rows, cols = random.randint(1, 6), random.randint(1, 6)
+        m = [[(random.randint(0, 6), random.randint(0, 6)) for _ in range(cols)] for _ in range(rows)]
+        result = iterated_elimination(m)
+        assert (result['player1'], result['player2']) == _naive_iesds(m)
+        # Every recorded dominator survives the round its victim is removed in
+        for step in result['eliminated']:
+            assert step['strategy'] != step['dominated_by']
+
+
+def test_surviving_game_keeps_pure_equilibria():
+    """IESDS never removes a pure Nash equilibrium."""
+    rng = np.random.default_rng(34)
+    for _ in range(50):
+        m = rng.integers(0, 4, size=(5, 5, 2))
+        result = iterated_elimination(m)
+        for r, c in find_pure_nash(m):
+            assert r in result['player1'] and c in result['player2']
+
+
+def test_large_chain_reduces():
+    """A 300x300 game where each row dominates the next reduces to one row."""
+    n = 300
+    rng = np.random.default_rng(35)
+    m = np.zeros((n, n, 2), dtype=np.int64)
+    m[..., 0] = (n - np.arange(n))[:, None] * 1000 + rng.integers(0, 10, size=(1, n))
+    m[..., 1] = rng.integers(0, 1000, size=(n, n))
+    result = iterated_elimination(m)
+    assert result['player1'] == [0]
+
+
+if __name__ == "__main__":
+    test_textbook_example()
+    test_matches_naive_rounds()
+    test_surviving_game_keeps_pure_equilibria()
+    test_large_chain_reduces()
+    print("✓ All IESDS tests passed")
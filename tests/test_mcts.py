@@ -0,0 +1,82 @@
+"""
+Test script for the Monte Carlo Tree Search (UCT) solver.
+"""
+import random
+import sys
+from pathlib import Path
+
+# Add parent directory to Python path
+project_root = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(project_root))
+
+from core_logic.minmax_logic import dict_to_tree, minmax
+from core_logic.game_logic import TicTacToe
+from core_logic.mcts_logic import GameProblem, mcts_solve
+
+
+def _leaf(v):
+    return {"value": v, "children": []}
+
+
+TREE = {"value": None, "children": [
+    {"value": None, "children": [_leaf(2), _leaf(3)]},
+    {"value": None, "children": [_leaf(8), _leaf(9)]},
+    {"value": None, "children": [_leaf(1), _leaf(9)]},
+]}
+
+
+def test_mcts_finds_minimax_move():
+    result = mcts_solve(dict_to_tree(TREE), playouts=2000, seed=31)
+    print(result)
+    assert result['best_move'] == 1
+    assert abs(result['root_value'] - 8) < 1
+    assert result['confidence'] > 0.5
+    assert result['playouts'] == 2000
+
+
+def test_mcts_parallel_workers():
+    result = mcts_solve(dict_to_tree(TREE), playouts=2000, workers=2, seed=31)
+    assert result['best_move'] == 1
+    assert sum(result['visits']) == result['playouts']
+
+
+def test_mcts_on_implicit_game():
+    """X to move can win immediately by completing the top row."""
+    game = TicTacToe()
+    state = game.initial_state()
+    for move in [0, 3, 1, 4]:
+        state = game.play(state, move)
+    result = mcts_solve(GameProblem(game, state), playouts=1500, seed=31)
+    print(game.render(state), result)
+    moves = game.legal_moves(state)
+    assert moves[result['best_move']] == 2
+    assert result['root_value'] == 10
+
+
+def _wide_tree(depth, branching, rng):
+    if depth == 0:
+        return _leaf(rng.randint(0, 50))
+    return {"value": None, "children": [_wide_tree(depth - 1, branching, rng) for _ in range(branching)]}
+
+
+def test_solve_keeps_exact_search_for_large_trees():
+    """/solve answers explicit and procedural trees with thousands of leaves exactly, not with an MCTS estimate."""
+    import main
+
+    raw_data = _wide_tree(7, 4, random.Random(5))  # 16384 leaves
+    solution, _ = main._solve_minmax(raw_data)
+    assert 'method' not in solution
+    assert solution['root_value'] == minmax(dict_to_tree(raw_data), 0, float('-inf'), float('inf'), True, [])
+
+    procedural = {"format": "procedural", "seed": 3, "depth": 16, "branching": 2, "max_leaf_value": 10}
+    solution, _ = main._solve_minmax(procedural)
+    assert 'method' not in solution
+    assert solution['root_value'] == minmax(dict_to_tree(procedural), 0, float('-inf'), float('inf'), True, [])
+
+
+if __name__ == "__main__":
+    test_mcts_finds_minimax_move()
+    test_mcts_parallel_workers()
+    test_mcts_on_implicit_game()
+    test_solve_keeps_exact_search_for_large_trees()
+    print("✓ All MCTS tests passed")
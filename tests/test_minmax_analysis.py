@@ -0,0 +1,69 @@
+"""
+Test script for best-case / worst-case alpha-beta visited-count analysis.
+Compares the value-sorted orderings against all child permutations.
+"""
+import sys
+import random
+import itertools
+from pathlib import Path
+
+# Add parent directory to Python path
+project_root = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(project_root))
+
+from core_logic.minmax_logic import Node, generate_random_tree, minmax
+from core_logic.minmax_analysis import pruning_analysis
+
+
+def _all_orderings(node):
+    if not node.children:
+        yield Node(value=node.value)
+        return
+    for order in itertools.permutations(node.children):
+        for combo in itertools.product(*[list(_all_orderings(c)) for c in order]):
+            yield Node(children=list(combo))
+
+
+def _visited(tree):
+    visited = []
+    minmax(tree, 0, float('-inf'), float('inf'), True, visited)
+    return len(visited)
+
+
+def _distinct_leaves(tree):
+    values = iter(random.sample(range(100), 2 ** 3))
+    stack = [tree]
+    while stack:
+        n = stack.pop()
+        if n.children:
+            stack.extend(n.children)
+        else:
+            n.value = next(values)
+    return tree
+
+
+def test_best_and_worst_match_brute_force():
+    random.seed(29)
+    for _ in range(30):
+        tree = _distinct_leaves(generate_random_tree(3, 9))
+        analysis = pruning_analysis(tree)
+        counts = [_visited(t) for t in _all_orderings(tree)]
+        assert analysis['best_case_visited'] == min(counts)
+        assert analysis['worst_case_visited'] == max(counts)
+        assert analysis['visited'] == _visited(tree)
+
+
+def test_stored_order_between_best_and_worst():
+    """The stored order visits between the best- and worst-case counts; the ratio stays in [0, 1)."""
+    random.seed(30)
+    for _ in range(20):
+        tree = generate_random_tree(4, 1000)
+        analysis = pruning_analysis(tree)
+        assert analysis['best_case_visited'] <= analysis['visited'] <= analysis['worst_case_visited'] <= 16
+        assert 0.0 <= analysis['pruning_ratio'] < 1.0
+
+
+if __name__ == "__main__":
+    test_best_and_worst_match_brute_force()
+    test_stored_order_between_best_and_worst()
+    print("✓ All pruning analysis tests passed")
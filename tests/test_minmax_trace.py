@@ -0,0 +1,52 @@
+"""
+Test script for the instrumented alpha-beta trace.
+"""
+import sys
+import random
+from pathlib import Path
+
+# Add parent directory to Python path
+project_root = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(project_root))
+
+from core_logic.minmax_logic import dict_to_tree, generate_random_tree, minmax, alphabeta_trace
+
+
+def _count_nodes(node):
+    return 1 + sum(_count_nodes(c) for c in node.children)
+
+
+def test_trace_matches_minmax():
+    """Root value and visited leaves agree with `minmax`; every node gets a row."""
+    random.seed(27)
+    for _ in range(100):
+        tree = generate_random_tree(random.randint(1, 5), 20)
+        visited = []
+        expected = minmax(tree, 0, float('-inf'), float('inf'), True, visited)
+        root_value, trace_visited, trace = alphabeta_trace(tree)
+        assert root_value == expected
+        assert trace_visited == visited
+        assert len(trace) == _count_nodes(tree)
+
+
+def test_trace_annotations():
+    """Classic example: the right MIN node is cut after its first leaf."""
+    raw = {"value": None, "children": [
+        {"value": None, "children": [{"value": 3, "children": []}, {"value": 5, "children": []}]},
+        {"value": None, "children": [{"value": 2, "children": []}, {"value": 9, "children": []}]},
+    ]}
+    root_value, visited, trace = alphabeta_trace(dict_to_tree(raw))
+    print(trace)
+
+    assert root_value == 3
+    assert visited == [3, 5, 2]
+    # Preorder: root, MIN-left, 3, 5, MIN-right, 2, 9
+    assert trace[3] == [5, None, 3, False]   # beta already lowered to 3
+    assert trace[4] == [2, 3, None, False]   # alpha raised to 3 at the root
+    assert trace[6] == [None, None, None, True]
+
+
+if __name__ == "__main__":
+    test_trace_matches_minmax()
+    test_trace_annotations()
+    print("✓ All alpha-beta trace tests passed")
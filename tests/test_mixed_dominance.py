@@ -0,0 +1,63 @@
+"""
+Test script for the dense simplex solver and dominance by mixed strategies.
+"""
+import sys
+from pathlib import Path
+
+# Add parent directory to Python path
+project_root = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(project_root))
+
+import numpy as np
+
+from core_logic.lp_logic import simplex
+from core_logic.nash_logic import find_dominated_strategies, find_mixed_dominated_strategies
+
+
+def test_simplex_textbook_problem():
+    """max 3x + 5y, x <= 4, 2y <= 12, 3x + 2y <= 18 -> 36 at (2, 6)."""
+    result = simplex([3, 5], [[1, 0], [0, 2], [3, 2]], [4, 12, 18])
+    assert result['status'] == 'optimal'
+    assert np.allclose(result['x'], [2, 6]) and abs(result['value'] - 36) < 1e-9
+    # Shadow prices: the second and third constraints bind
+    assert np.allclose(result['duals'], [0, 1.5, 1])
+
+
+def test_simplex_phase_one_and_statuses():
+    result = simplex([1, 2], [[-1, 0]], [-0.3], [[1, 1]], [1])
+    assert result['status'] == 'optimal' and np.allclose(result['x'], [0.3, 0.7])
+    assert simplex([1, 1], [[1, 1]], [-1])['status'] == 'infeasible'
+    assert simplex([1, 1], [[1, -1]], [1])['status'] == 'unbounded'
+
+
+def test_row_dominated_only_by_mix():
+    m = [[(3, 1), (0, 0)],
+         [(0, 0), (3, 1)],
+         [(1, 2), (1, 0)]]
+    assert find_dominated_strategies(m)['player1'] == []
+    result = find_mixed_dominated_strategies(m)
+    assert result['player1'] == [2]
+    assert np.allclose(result['mixes']['player1'][2], [0.5, 0.5, 0])
+
+
+def test_mixed_dominance_on_random_games():
+    rng = np.random.default_rng(36)
+    for _ in range(200):
+        m = rng.integers(0, 6, size=(rng.integers(1, 6), rng.integers(1, 6), 2))
+        pure = find_dominated_strategies(m)
+        mixed = find_mixed_dominated_strategies(m)
+        assert set(pure['player1']) <= set(mixed['player1'])
+        assert set(pure['player2']) <= set(mixed['player2'])
+        # Every reported mix really dominates strictly
+        for i, mix in mixed['mixes']['player1'].items():
+            assert (np.array(mix) @ m[..., 0] > m[i, :, 0]).all()
+        for j, mix in mixed['mixes']['player2'].items():
+            assert (m[..., 1] @ np.array(mix) > m[:, j, 1]).all()
+
+
+if __name__ == "__main__":
+    test_simplex_textbook_problem()
+    test_simplex_phase_one_and_statuses()
+    test_row_dominated_only_by_mix()
+    test_mixed_dominance_on_random_games()
+    print("✓ All mixed dominance tests passed")
@@ -0,0 +1,97 @@
+"""
+Test script for mixed-strategy Nash equilibria (support enumeration and Lemke-Howson).
+"""
+import sys
+import random
+from fractions import Fraction
+from pathlib import Path
+
+# Add parent directory to Python path
+project_root = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(project_root))
+
+import numpy as np
+
+from core_logic.nash_logic import support_enumeration, lemke_howson, find_mixed_nash, is_mixed_nash
+from engine.evaluators.nash_evaluator import NashEvaluator
+
+MATCHING_PENNIES = [[(2, 0), (0, 2)], [(0, 2), (3, 0)]]
+BATTLE_OF_SEXES = [[(3, 2), (0, 0)], [(0, 0), (2, 3)]]
+
+
+def test_support_enumeration_is_exact():
+    equilibria = support_enumeration(MATCHING_PENNIES)
+    assert len(equilibria) == 1
+    assert equilibria[0]['p1'] == [Fraction(1, 2), Fraction(1, 2)]
+    assert equilibria[0]['p2'] == [Fraction(3, 5), Fraction(2, 5)]
+
+
+def test_battle_of_sexes_has_three_equilibria():
+    equilibria = support_enumeration(BATTLE_OF_SEXES)
+    profiles = [(e['p1'], e['p2']) for e in equilibria]
+    assert ([1, 0], [1, 0]) in profiles and ([0, 1], [0, 1]) in profiles
+    assert ([Fraction(3, 5), Fraction(2, 5)], [Fraction(2, 5), Fraction(3, 5)]) in profiles
+
+
+def test_lemke_howson_agrees_on_small_games():
+    result = lemke_howson(MATCHING_PENNIES)
+    assert np.allclose(result['p1'], [0.5, 0.5]) and np.allclose(result['p2'], [0.6, 0.4])
+    for label in range(4):
+        result = lemke_howson(BATTLE_OF_SEXES, label)
+        assert is_mixed_nash(BATTLE_OF_SEXES, result['p1'], result['p2'])
+
+
+def test_lemke_howson_on_large_and_degenerate_games():
+    rng = np.random.default_rng(35)
+    large = rng.integers(0, 100, size=(60, 60, 2))
+    (result,) = find_mixed_nash(large)
+    assert is_mixed_nash(large, result['p1'], result['p2'])
+    degenerate = rng.integers(0, 3, size=(8, 8, 2))
+    for label in range(16):
+        result = lemke_howson(degenerate, label)
+        assert is_mixed_nash(degenerate, result['p1'], result['p2'])
+
+
+def _cycling_game():
+    # 10x9 integer game whose exact-equality lexicographic test cycled from label 0
+    rng = random.Random(163)
+    rows, cols, top = rng.randint(2, 10), rng.randint(2, 10), rng.randint(0, 4)
+    return [[(rng.randint(0, top), rng.randint(0, top)) for _ in range(cols)] for _ in range(rows)]
+
+
+def test_lemke_howson_degenerate_ties_terminate():
+    game = _cycling_game()
+    assert len(game) * len(game[0]) > 36
+    for label in (0, 5, 12):
+        result = lemke_howson(game, label)
+        assert is_mixed_nash(game, result['p1'], result['p2'])
+    (result,) = find_mixed_nash(game)
+    assert is_mixed_nash(game, result['p1'], result['p2'])
+    # Hitting the pivot cap on every initial label is a ValueError, not an endless loop
+    try:
+        lemke_howson(game, max_pivots=1)
+    except ValueError:
+        pass
+    else:
+        raise AssertionError("accepted a 1-pivot cap")
+
+
+def test_evaluator_accepts_rounded_equilibrium():
+    evaluator = NashEvaluator()
+    score, details = evaluator.evaluate_mixed(MATCHING_PENNIES, [0.5, 0.5], [0.6, 0.4])
+    assert score == 1.0
+    score, _ = evaluator.evaluate_mixed(MATCHING_PENNIES, [0.9, 0.1], [0.5, 0.5])
+    assert score == 0.0
+    # Any equilibrium counts, not just the ones listed
+    score, _ = evaluator.evaluate_mixed(BATTLE_OF_SEXES, [0.6, 0.4], [0.4, 0.6])
+    assert score == 1.0
+
+
+if __name__ == "__main__":
+    test_support_enumeration_is_exact()
+    test_battle_of_sexes_has_three_equilibria()
+    test_lemke_howson_agrees_on_small_games()
+    test_lemke_howson_on_large_and_degenerate_games()
+    test_lemke_howson_degenerate_ties_terminate()
+    test_evaluator_accepts_rounded_equilibrium()
+    print("✓ All mixed Nash tests passed")
@@ -0,0 +1,80 @@
+"""
+Test script for the vectorized pure Nash and strict dominance computation.
+Compares against straightforward loops and checks large games stay fast.
+"""
+import sys
+import time
+import random
+from pathlib import Path
+
+# Add parent directory to Python path
+project_root = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(project_root))
+
+import numpy as np
+
+from core_logic.nash_logic import find_pure_nash, find_dominated_strategies
+
+
+def _random_game(rows, cols, high=5):
+    return [[(random.randint(0, high), random.randint(0, high)) for _ in range(cols)] for _ in range(rows)]
+
+
+def _reference_nash(m):
+    rows, cols = len(m), len(m[0])
+    return [(r, c) for r in range(rows) for c in range(cols)
+            if all(m[i][c][0] <= m[r][c][0] for i in range(rows))
+            and all(m[r][j][1] <= m[r][c][1] for j in range(cols))]
+
+
+def _reference_dominated(m):
+    rows, cols = len(m), len(m[0])
+    p1 = [i for i in range(rows)
+          if any(all(m[j][c][0] > m[i][c][0] for c in range(cols)) for j in range(rows))]
+    p2 = [i for i in range(cols)
+          if any(all(m[r][j][1] > m[r][i][1] for r in range(rows)) for j in range(cols))]
+    return {'player1': p1, 'player2': p2}
+
+
+def test_matches_reference_on_small_games():
+    random.seed(33)
+    for _ in range(200):
+        m = _random_game(random.randint(1, 5), random.randint(1, 5))
+        assert find_pure_nash(m) == _reference_nash(m)
+        assert find_dominated_strategies(m) == _reference_dominated(m)
+
+
+def test_prisoners_dilemma():
+    m = [[(-1, -1), (-3, 0)], [(0, -3), (-2, -2)]]
+    assert find_pure_nash(m) == [(1, 1)]
+    assert find_dominated_strategies(m) == {'player1': [0], 'player2': [0]}
+
+
+def test_filtering_path_on_large_game():
+    """Games above the broadcast limit use the candidate-filtering path."""
+    random.seed(34)
+    m = _random_game(170, 170, high=3)
+    m[5] = [(m[7][c][0] - 1, m[5][c][1]) for c in range(170)]
+    result = find_dominated_strategies(m)
+    assert 5 in result['player1']
+    assert result == _reference_dominated(m)
+
+
+def test_large_game_is_fast():
+    rng = np.random.default_rng(35)
+    # A ready-made (r x c x 2) array skips the list conversion entirely
+    m = rng.integers(0, 100, size=(1000, 1000, 2))
+    start = time.perf_counter()
+    equilibria = find_pure_nash(m)
+    dominated = find_dominated_strategies(m)
+    elapsed = time.perf_counter() - start
+    print(f"1000x1000: {len(equilibria)} equilibria, {elapsed * 1000:.0f} ms")
+    assert elapsed < 1.0
+
+
+if __name__ == "__main__":
+    test_matches_reference_on_small_games()
+    test_prisoners_dilemma()
+    test_filtering_path_on_large_game()
+    test_large_game_is_fast()
+    print("✓ All vectorized Nash tests passed")
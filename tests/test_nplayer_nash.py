@@ -0,0 +1,88 @@
+"""
+Test script for N-player normal-form games (one payoff tensor per player).
+"""
+import sys
+import time
+import itertools
+from pathlib import Path
+
+# Add parent directory to Python path
+project_root = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(project_root))
+
+import numpy as np
+
+from core_logic.nash_logic import (
+    tensor_payoffs, find_pure_nash, find_pure_nash_tensor, find_dominated_strategies
+)
+from engine.generators.nash_generator import NashGenerator
+from engine.question_parser import QuestionParser
+
+
+def _brute_force_nash(game):
+    shape = game.shape[:-1]
+    equilibria = []
+    for profile in itertools.product(*[range(s) for s in shape]):
+        stable = True
+        for k in range(len(shape)):
+            for alt in range(shape[k]):
+                deviation = list(profile)
+                deviation[k] = alt
+                if game[tuple(deviation)][k] > game[profile][k]:
+                    stable = False
+        if stable:
+            equilibria.append(profile)
+    return equilibria
+
+
+def test_matches_brute_force():
+    rng = np.random.default_rng(38)
+    for _ in range(100):
+        shape = tuple(rng.integers(1, 4, size=3))
+        game = rng.integers(0, 4, size=shape + (3,))
+        assert find_pure_nash(game.tolist()) == _brute_force_nash(game)
+
+
+def test_two_player_is_special_case():
+    m = [[(3, 3), (0, 5)], [(5, 0), (1, 1)]]
+    assert find_pure_nash(m) == [(1, 1)]
+    assert find_dominated_strategies(m) == {'player1': [0], 'player2': [0]}
+
+
+def test_three_player_dominance():
+    """Player 3's second matrix pays strictly less everywhere."""
+    game = np.zeros((2, 2, 2, 3), dtype=int)
+    game[..., 0, 2] = 5
+    game[..., 1, 2] = 1
+    assert find_dominated_strategies(game)['player3'] == [1]
+
+
+def test_million_profiles_fast():
+    rng = np.random.default_rng(39)
+    payoffs = [rng.integers(0, 100, size=(100, 100, 100)) for _ in range(3)]
+    start = time.perf_counter()
+    equilibria = find_pure_nash_tensor(payoffs)
+    elapsed = time.perf_counter() - start
+    print(f"10^6 profiles: {len(equilibria)} equilibria in {elapsed * 1000:.0f} ms")
+    assert elapsed < 1.0
+    assert equilibria == find_pure_nash(np.stack(payoffs, axis=-1))
+
+
+def test_generator_and_parser_round_trip():
+    templates = {'t': {'template': 'Găsiți echilibrele Nash pure.', 'tags': ['nash', 'requires_calculation']}}
+    result = NashGenerator(templates).generate(players=3)
+    assert result['players'] == 3
+    parsed = QuestionParser().parse(result['question_text'])
+    assert parsed.extracted_data['players'] == 3
+    assert parsed.extracted_data['raw_data'] == [[[list(c) for c in cell] for cell in row]
+                                                for row in result['raw_data']]
+    assert len(tensor_payoffs(parsed.extracted_data['raw_data'])) == 3
+
+
+if __name__ == "__main__":
+    test_matches_brute_force()
+    test_two_player_is_special_case()
+    test_three_player_dominance()
+    test_million_profiles_fast()
+    test_generator_and_parser_round_trip()
+    print("✓ All N-player Nash tests passed")
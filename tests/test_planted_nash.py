@@ -0,0 +1,75 @@
+"""
+Test script for the constructive Nash generator (planted equilibrium count and dominance pattern).
+"""
+import sys
+import random
+from pathlib import Path
+
+# Add parent directory to Python path
+project_root = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(project_root))
+
+from core_logic.nash_logic import find_pure_nash, find_dominated_strategies
+from engine.generators.nash_generator import NashGenerator
+from engine.question_parser import QuestionParser
+
+
+TEMPLATES = {'t': {'template': 'Găsiți echilibrele Nash pure.', 'tags': ['nash', 'requires_calculation']}}
+
+
+def test_planted_counts_and_patterns():
+    random.seed(40)
+    generator = NashGenerator(TEMPLATES)
+    for _ in range(2000):
+        rows, cols = random.randint(2, 6), random.randint(2, 6)
+        dominated = random.choice(NashGenerator.DOMINANCE_PATTERNS)
+        p1_dominated = dominated in ('player1', 'both')
+        p2_dominated = dominated in ('player2', 'both')
+        # 2xN games with a dominated row need an equilibrium: the other row answers every column
+        low = 1 if (rows == 2 and p1_dominated) or (cols == 2 and p2_dominated) else 0
+        equilibria = random.randint(low, min(rows - p1_dominated, cols - p2_dominated))
+        if (rows, cols, equilibria, dominated) == (2, 2, 1, 'none'):
+            continue
+        matrix = generator._plant_nash_data(rows, cols, equilibria, dominated)
+        assert len(matrix) == rows and len(matrix[0]) == cols
+        assert len(find_pure_nash(matrix)) == equilibria
+        if dominated is not None:
+            found = find_dominated_strategies(matrix)
+            assert bool(found['player1']) == p1_dominated
+            assert bool(found['player2']) == p2_dominated
+
+
+def test_large_planted_game():
+    random.seed(41)
+    matrix = NashGenerator(TEMPLATES)._plant_nash_data(10, 10, 4, 'none')
+    assert len(find_pure_nash(matrix)) == 4
+    assert find_dominated_strategies(matrix) == {'player1': [], 'player2': []}
+
+
+def test_impossible_requests_rejected():
+    generator = NashGenerator(TEMPLATES)
+    for args in ((2, 2, 3, None), (2, 2, 0, 'player1'), (2, 2, 1, 'none'), (1, 3, 0, None), (3, 3, 1, 'row')):
+        try:
+            generator._plant_nash_data(*args)
+        except ValueError:
+            continue
+        raise AssertionError(f"accepted {args}")
+
+
+def test_generate_round_trip():
+    random.seed(42)
+    result = NashGenerator(TEMPLATES).generate(rows=4, cols=5, equilibria=2, dominated='player2')
+    parsed = QuestionParser().parse(result['question_text'])
+    assert parsed.extracted_data['raw_data'] == [[list(cell) for cell in row] for row in result['raw_data']]
+    assert len(find_pure_nash(result['raw_data'])) == 2
+    # Without a count the generator picks one that fits the pattern
+    result = NashGenerator(TEMPLATES).generate(rows=2, cols=3, dominated='player1')
+    assert find_dominated_strategies(result['raw_data'])['player1']
+
+
+if __name__ == "__main__":
+    test_planted_counts_and_patterns()
+    test_large_planted_game()
+    test_impossible_requests_rejected()
+    test_generate_round_trip()
+    print("✓ All planted Nash generator tests passed")
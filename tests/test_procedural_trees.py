@@ -0,0 +1,103 @@
+"""
+Test script for seeded, lazily expanded MinMax trees.
+"""
+import sys
+from pathlib import Path
+
+# Add parent directory to Python path
+project_root = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(project_root))
+
+from core_logic.minmax_logic import ProceduralNode, dict_to_tree, tree_to_dict, minmax
+from engine.evaluators.minmax_evaluator import MinMaxEvaluator
+from engine.generators.minmax_generator import MinMaxGenerator
+
+
+def _solve(tree):
+    visited = []
+    root = minmax(tree, 0, float('-inf'), float('inf'), True, visited)
+    return root, visited
+
+
+def _materialized(node):
+    """Count nodes whose children were actually created."""
+    if node._children is None:
+        return 1
+    return 1 + sum(_materialized(c) for c in node._children)
+
+
+def test_same_seed_same_tree():
+    a = ProceduralNode(7, 5, 3, 20)
+    b = dict_to_tree(a.descriptor())
+    assert tree_to_dict(a) == tree_to_dict(b)
+    assert tree_to_dict(ProceduralNode(8, 5, 3, 20)) != tree_to_dict(a)
+
+
+def test_matches_materialized_tree():
+    """Alpha-beta on the lazy tree equals alpha-beta on its full dict form."""
+    lazy = ProceduralNode(123, 6, 3, 50)
+    full = dict_to_tree(tree_to_dict(ProceduralNode(123, 6, 3, 50)))
+    assert _solve(lazy) == _solve(full)
+
+
+def test_deep_tree_expands_only_visited_nodes():
+    tree = ProceduralNode(2024, 16, 2, 100)
+    root, visited = _solve(tree)
+    print(f"root={root}, visited leaves={len(visited)} of {2 ** 16}")
+    assert len(visited) < 2 ** 16
+    assert _materialized(tree) < 2 ** 17 - 1
+
+
+def test_generator_descriptor_payload():
+    templates_path = project_root / "assets" / "json_output" / "templates.json"
+    generator = MinMaxGenerator(str(templates_path))
+    result = generator.generate(depth=14, procedural=True)
+    raw_data = result['raw_data']
+    assert raw_data['format'] == 'procedural'
+    assert set(raw_data) == {'format', 'seed', 'depth', 'branching', 'max_leaf_value'}
+
+    root, visited = _solve(dict_to_tree(raw_data))
+    score = MinMaxEvaluator().evaluate({"root_value": root, "visited_count": len(visited)}, raw_data)
+    assert score == 1.0
+
+
+def test_size_limits():
+    generator = MinMaxGenerator()
+    for options in ({'depth': 30}, {'depth': -1}, {'depth': 2.5}, {'depth': 17, 'procedural': True},
+                    {'depth': 8, 'branching': 8, 'procedural': True}, {'depth': 3, 'branching': 1, 'procedural': True},
+                    # branching only shapes procedural trees
+                    {'depth': 3, 'branching': 3}, {'game': 'tictactoe', 'procedural': True, 'branching': 3}):
+        try:
+            generator.generate(**options)
+        except ValueError:
+            continue
+        raise AssertionError(f"accepted {options}")
+    for descriptor in ({'depth': 40}, {'depth': 12, 'branching': 6}, {'depth': 4, 'max_leaf_value': -1}):
+        try:
+            dict_to_tree(dict({'format': 'procedural', 'seed': 1}, **descriptor))
+        except ValueError:
+            continue
+        raise AssertionError(f"accepted {descriptor}")
+
+
+def test_api_rejects_oversized_trees():
+    from fastapi.testclient import TestClient
+    import main
+
+    client = TestClient(main.app)
+    assert client.get("/generate/minmax", params={"depth": 30}).status_code == 400
+    response = client.post("/evaluate/minmax", json={
+        "root_value": 0, "visited_count": 0,
+        "raw_data": {"format": "procedural", "seed": 1, "depth": 64, "branching": 8},
+    })
+    assert response.status_code == 400
+
+
+if __name__ == "__main__":
+    test_same_seed_same_tree()
+    test_matches_materialized_tree()
+    test_deep_tree_expands_only_visited_nodes()
+    test_generator_descriptor_payload()
+    test_size_limits()
+    test_api_rejects_oversized_trees()
+    print("✓ All procedural tree tests passed")
@@ -0,0 +1,96 @@
+"""
+Test script for MinMax trees built to a pruning target (exact alpha-beta
+visited-leaf count or pruned-leaf fraction).
+"""
+import sys
+import random
+from pathlib import Path
+
+# Add parent directory to Python path
+project_root = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(project_root))
+
+from core_logic.minmax_logic import Node, dict_to_tree, count_leaves
+from core_logic.minmax_analysis import achievable_visits, generate_pruning_tree, pruning_analysis, _visited_count
+from engine.generators.minmax_generator import MinMaxGenerator
+
+
+def _leaf_values(node: Node):
+    if not node.children:
+        return [node.value]
+    return [v for c in node.children for v in _leaf_values(c)]
+
+
+def test_achievable_range():
+    # From the minimal tree (2^ceil(d/2) + 2^floor(d/2) - 1 leaves) up to no pruning
+    for depth in range(1, 7):
+        counts = achievable_visits(depth)
+        assert counts == list(range(2 ** ((depth + 1) // 2) + 2 ** (depth // 2) - 1, 2 ** depth + 1))
+
+
+def test_every_count_is_hit():
+    rng = random.Random(49)
+    for depth in range(1, 6):
+        for visited in achievable_visits(depth):
+            for _ in range(10):
+                tree = generate_pruning_tree(depth, visited, max_leaf_value=2 ** depth, rng=rng)
+                assert _visited_count(tree) == visited
+                values = _leaf_values(tree)
+                assert len(values) == 2 ** depth
+                assert all(isinstance(v, int) and 0 <= v <= 2 ** depth for v in values)
+
+
+def test_small_value_range():
+    rng = random.Random(50)
+    tree = generate_pruning_tree(4, 7, max_leaf_value=3, rng=rng)
+    assert _visited_count(tree) == 7 and max(_leaf_values(tree)) <= 3
+    for args in ((3, 4), (3, 9), (6, 64, 5)):
+        try:
+            generate_pruning_tree(*args, rng=rng)
+        except ValueError:
+            continue
+        raise AssertionError(f"accepted {args}")
+
+
+def test_generator_targets():
+    generator = MinMaxGenerator()
+    rng = random.Random(51)
+    for _ in range(20):
+        result = generator.generate(visited=11, rng=rng)
+        tree = dict_to_tree(result['raw_data'])
+        assert _visited_count(tree) == 11 == result['pruning']['visited']
+        assert count_leaves(tree) == result['pruning']['total_leaves']
+    for ratio in (0.0, 0.25, 0.5):
+        result = generator.generate(depth=4, pruning_ratio=ratio, rng=rng)
+        analysis = pruning_analysis(dict_to_tree(result['raw_data']))
+        assert analysis['pruning_ratio'] == result['pruning']['pruning_ratio'] == ratio
+    # 0.75 is past the minimal tree (7 of 16 leaves): closest achievable
+    assert generator.generate(depth=4, pruning_ratio=0.75, rng=rng)['pruning']['visited'] == 7
+    for args in ({'visited': 5, 'pruning_ratio': 0.5}, {'visited': 5, 'chance': True}, {'pruning_ratio': 1.0},
+                 {'visited': 2, 'depth': 4}, {'visited': 100}):
+        try:
+            generator.generate(rng=rng, **args)
+        except ValueError:
+            continue
+        raise AssertionError(f"accepted {args}")
+
+
+def test_api_pruning_target():
+    from fastapi.testclient import TestClient
+    import main
+
+    client = TestClient(main.app)
+    body = client.get("/generate/minmax", params={"visited": 9, "depth": 4, "seed": 3}).json()
+    assert body['pruning'] == {'visited': 9, 'total_leaves': 16, 'pruning_ratio': 0.438}
+    assert _visited_count(dict_to_tree(body['raw_data'])) == 9
+    assert client.get("/generate/minmax", params={"visited": 9, "depth": 4, "seed": 3}).json() == body
+    assert client.get("/generate/minmax", params={"visited": 1, "depth": 4}).status_code == 400
+
+
+if __name__ == "__main__":
+    test_achievable_range()
+    test_every_count_is_hit()
+    test_small_value_range()
+    test_generator_targets()
+    test_api_pruning_target()
+    print("✓ All pruning target tests passed")
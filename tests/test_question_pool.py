@@ -0,0 +1,115 @@
+"""
+Test script for the pre-generated question pool: refill to the watermark,
+precomputed ground truth (reused when the answer is evaluated), background refill and the pool metrics endpoint.
+"""
+import sys
+import time
+from pathlib import Path
+
+# Add parent directory to Python path
+project_root = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(project_root))
+
+from engine.question_pool import QuestionPool
+from engine.question_service import QuestionService
+from engine.evaluation_service import EvaluationService
+from core_logic.nash_logic import find_pure_nash
+
+TEMPLATES_PATH = str(project_root / "assets" / "json_output" / "templates.json")
+
+
+def test_fill_and_pop():
+    service = QuestionService(TEMPLATES_PATH)
+    pool = QuestionPool(service, {'nash': 5, 'minmax': 3}, ground_truth=EvaluationService().ground_truth)
+    pool.fill()
+    metrics = pool.metrics()['types']
+    assert metrics['nash']['depth'] == 5 and metrics['minmax']['depth'] == 3
+    assert metrics['nash']['generated'] == 5
+
+    item = pool.pop('nash')
+    assert item['ground_truth'] == find_pure_nash(item['raw_data'])
+    assert pool.pop('minmax')['ground_truth']['root_value'] is not None
+    assert pool.pop('csp') is None  # not pooled
+
+    for _ in range(10):
+        pool.pop('minmax')
+    metrics = pool.metrics()['types']['minmax']
+    assert metrics['depth'] == 0 and metrics['hits'] == 3 and metrics['misses'] == 8
+
+
+def test_evaluation_reuses_pooled_ground_truth():
+    from schemas import NashSubmission, MinMaxSubmission
+    import engine.evaluation_service as evaluation_service
+    import engine.evaluators.nash_evaluator as nash_evaluator
+    import engine.evaluators.minmax_evaluator as minmax_evaluator
+
+    evaluator = EvaluationService()
+    pool = QuestionPool(QuestionService(TEMPLATES_PATH), {'nash': 1, 'minmax': 1}, ground_truth=evaluator.ground_truth)
+    pool.fill()
+    nash, tree = pool.pop('nash'), pool.pop('minmax')
+    coords = ", ".join(str(tuple(c)) for c in nash['ground_truth'])
+    expected = nash_evaluator.NashEvaluator().evaluate(coords, nash['raw_data'])
+
+    def unexpected_solve(*args, **kwargs):
+        raise AssertionError("pooled question solved again")
+
+    solvers = [(evaluation_service, name) for name in
+               ('find_pure_nash', 'alphabeta_trace', 'minmax', 'solve_expectiminimax')]
+    solvers += [(nash_evaluator, 'find_pure_nash'), (minmax_evaluator, 'minmax'),
+                (minmax_evaluator, 'solve_expectiminimax')]
+    saved = [getattr(module, name) for module, name in solvers]
+    for module, name in solvers:
+        setattr(module, name, unexpected_solve)
+    try:
+        score, _ = evaluator.evaluate('nash', NashSubmission(user_answer=coords, raw_data=nash['raw_data']))
+        assert score == expected
+        correct = tree['ground_truth']
+        score, _ = evaluator.evaluate('minmax', MinMaxSubmission(
+            root_value=correct['root_value'], visited_count=correct['visited_count'], raw_data=tree['raw_data']))
+        assert score == 1.0
+    finally:
+        for (module, name), solver in zip(solvers, saved):
+            setattr(module, name, solver)
+
+
+def test_background_refill():
+    pool = QuestionPool(QuestionService(TEMPLATES_PATH), {'csp': 4}, idle_interval=0.05)
+    pool.start()
+    try:
+        deadline = time.time() + 10
+        while pool.metrics()['types']['csp']['depth'] < 4 and time.time() < deadline:
+            time.sleep(0.01)
+        assert pool.metrics()['running']
+        assert pool.pop('csp') is not None
+        deadline = time.time() + 10
+        while pool.metrics()['types']['csp']['generated'] < 5 and time.time() < deadline:
+            time.sleep(0.01)
+        metrics = pool.metrics()['types']['csp']
+        assert metrics['depth'] == 4 and metrics['refill_rate'] > 0
+    finally:
+        pool.stop()
+    assert not pool.metrics()['running']
+
+
+def test_endpoint_serves_from_pool():
+    from fastapi.testclient import TestClient
+    import main
+
+    main.question_pool.fill()
+    client = TestClient(main.app)
+    before = main.question_pool.metrics()['types']['csp']
+    assert client.get("/generate/csp").status_code == 200
+    # Explicit options bypass the pool
+    assert client.get("/generate/minmax", params={"depth": 2}).status_code == 200
+    metrics = client.get("/pool/metrics").json()['types']
+    assert metrics['csp']['hits'] == before['hits'] + 1
+    assert metrics['csp']['depth'] == before['depth'] - 1
+    assert metrics['minmax']['hits'] == 0
+
+
+if __name__ == "__main__":
+    test_fill_and_pop()
+    test_evaluation_reuses_pooled_ground_truth()
+    test_background_refill()
+    test_endpoint_serves_from_pool()
+    print("✓ All question pool tests passed")
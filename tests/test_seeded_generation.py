@@ -0,0 +1,85 @@
+"""
+Test script for seeded question generation: identical seeds give identical
+questions, per-request generators leave the global `random` state alone and
+stay deterministic across threads.
+"""
+import sys
+import random
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+# Add parent directory to Python path
+project_root = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(project_root))
+
+from engine.question_service import QuestionService
+
+TEMPLATES_PATH = str(project_root / "assets" / "json_output" / "templates.json")
+
+CASES = [
+    ('nash', {}),
+    ('nash', {'rows': 4, 'cols': 4, 'equilibria': 2, 'dominated': 'none'}),
+    ('nash', {'players': 3}),
+    ('csp', {}),
+    ('minmax', {}),
+    ('minmax', {'chance': True}),
+    ('minmax', {'procedural': True, 'depth': 6}),
+    ('minmax', {'game': 'tictactoe'}),
+    ('extensive', {'players': 3}),
+    ('strategy', {}),
+]
+
+
+def test_same_seed_same_question():
+    service = QuestionService(TEMPLATES_PATH)
+    for q_type, options in CASES:
+        first = service.generate_question_by_type(q_type, seed=1234, **options)
+        assert 'error' not in first, (q_type, first)
+        assert first['seed'] == 1234
+        assert service.generate_question_by_type(q_type, seed=1234, **options) == first, (q_type, options)
+        texts = {service.generate_question_by_type(q_type, seed=seed, **options)['question_text']
+                 for seed in range(20)}
+        assert len(texts) > 1, (q_type, options)
+
+
+def test_unseeded_result_is_reproducible():
+    service = QuestionService(TEMPLATES_PATH)
+    result = service.generate_question_by_type('minmax')
+    assert service.generate_question_by_type('minmax', seed=result['seed']) == result
+
+
+def test_global_random_untouched():
+    service = QuestionService(TEMPLATES_PATH)
+    state = random.getstate()
+    for q_type, options in CASES:
+        service.generate_question_by_type(q_type, seed=7, **options)
+    assert random.getstate() == state
+
+
+def test_thread_safe_determinism():
+    service = QuestionService(TEMPLATES_PATH)
+    seeds = list(range(200))
+    expected = [service.generate_question_by_type('nash', seed=s) for s in seeds]
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        results = list(pool.map(lambda s: service.generate_question_by_type('nash', seed=s), seeds))
+    assert results == expected
+
+
+def test_api_seed_parameter():
+    from fastapi.testclient import TestClient
+    import main
+
+    client = TestClient(main.app)
+    for path in ("/generate/nash", "/generate/csp", "/generate/minmax", "/generate/extensive", "/generate/strategy"):
+        first = client.get(path, params={"seed": 99}).json()
+        assert first['seed'] == 99
+        assert client.get(path, params={"seed": 99}).json() == first, path
+
+
+if __name__ == "__main__":
+    test_same_seed_same_question()
+    test_unseeded_result_is_reproducible()
+    test_global_random_untouched()
+    test_thread_safe_determinism()
+    test_api_seed_parameter()
+    print("✓ All seeded generation tests passed")
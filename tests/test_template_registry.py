@@ -0,0 +1,87 @@
+"""
+Test script for the shared template registry: one parse of templates.json,
+hot reload when the file changes, generators reused between requests.
+"""
+import sys
+import os
+import json
+import tempfile
+from pathlib import Path
+
+# Add parent directory to Python path
+project_root = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(project_root))
+
+from engine.template_registry import TemplateRegistry
+from engine.question_service import QuestionService
+
+
+TEMPLATES = [
+    {'id': 'csp-1', 'template': 'Rezolvați CSP-ul:', 'tags': ['csp', 'requires_calculation']},
+    {'id': 'mm-1', 'template': 'Aplicați MinMax:', 'tags': ['minmax', 'requires_calculation']},
+    {'id': 'strat-1', 'template': 'Ce strategie?', 'tags': ['strategy', 'csp']},
+]
+
+
+def _write(path: Path, templates, mtime_ns: int):
+    path.write_text(json.dumps(templates), encoding='utf-8')
+    os.utime(path, ns=(mtime_ns, mtime_ns))
+
+
+def test_indexes_and_reload():
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "templates.json"
+        _write(path, TEMPLATES, 10**18)
+        registry = TemplateRegistry(str(path))
+        assert [t['id'] for t in registry.with_tag('csp')] == ['csp-1', 'strat-1']
+        assert registry.get('mm-1')['tags'][0] == 'minmax'
+        assert registry.with_tag('missing') == []
+
+        version = registry.version
+        for _ in range(100):
+            assert registry.refresh() == version
+        assert registry.loads == 1
+
+        # Same content, new mtime: re-hashed but not re-parsed
+        _write(path, TEMPLATES, 10**18 + 1)
+        assert registry.refresh() == version and registry.loads == 1
+
+        _write(path, TEMPLATES + [{'id': 'mm-2', 'template': 'Alt MinMax:', 'tags': ['minmax']}], 10**18 + 2)
+        assert registry.refresh() == version + 1
+        assert [t['id'] for t in registry.with_tag('minmax')] == ['mm-1', 'mm-2']
+
+        # A broken file keeps the last good templates
+        path.write_text("[{", encoding='utf-8')
+        os.utime(path, ns=(10**18 + 3, 10**18 + 3))
+        registry.refresh()
+        assert registry.get('mm-2') is not None
+
+
+def test_missing_file_is_empty():
+    registry = TemplateRegistry("/nonexistent/templates.json")
+    assert registry.all() == [] and registry.by_id() == {}
+
+
+def test_service_reuses_generators():
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "templates.json"
+        _write(path, TEMPLATES, 10**18)
+        service = QuestionService(str(path))
+        first = service._generator('csp')
+        for _ in range(20):
+            assert service.generate_question_by_type('csp')['template_id'] == 'csp-1'
+        assert service._generator('csp') is first
+        assert service.registry.loads == 1
+
+        edited = [dict(TEMPLATES[0], id='csp-2')] + TEMPLATES[1:]
+        _write(path, edited, 10**18 + 5)
+        assert service.generate_question_by_type('csp')['template_id'] == 'csp-2'
+        assert service._generator('csp') is not first
+        assert 'csp-2' in service.templates
+
+
+if __name__ == "__main__":
+    test_indexes_and_reload()
+    test_missing_file_is_empty()
+    test_service_reuses_generators()
+    print("✓ All template registry tests passed")
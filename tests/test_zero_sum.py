@@ -0,0 +1,68 @@
+"""
+Test script for zero-sum matrix games: saddle points and LP game value.
+"""
+import sys
+from pathlib import Path
+
+# Add parent directory to Python path
+project_root = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(project_root))
+
+import numpy as np
+
+from core_logic.nash_logic import is_zero_sum, find_saddle_points, solve_zero_sum, find_pure_nash
+from engine.question_parser import QuestionParser
+
+
+def _zero_sum(a):
+    a = np.asarray(a)
+    return np.stack([a, -a], axis=-1)
+
+
+def test_detection():
+    assert is_zero_sum([[(1, -1), (-2, 2)]])
+    assert not is_zero_sum([[(1, 1), (-2, 2)]])
+
+
+def test_saddle_point_game():
+    game = _zero_sum([[3, 1, 4], [2, 0, 1]])
+    assert find_saddle_points(game) == [(0, 1)]
+    result = solve_zero_sum(game)
+    assert result['value'] == 1 and result['maximin'] == result['minimax'] == 1
+    assert result['p1'] == [1.0, 0.0] and result['p2'] == [0.0, 1.0, 0.0]
+    # In zero-sum games pure Nash equilibria are exactly the saddle points
+    assert find_pure_nash(game) == find_saddle_points(game)
+
+
+def test_mixed_value_by_lp():
+    result = solve_zero_sum(_zero_sum([[2, -1], [-3, 4]]))
+    assert result['value'] == 0.5
+    assert result['p1'] == [0.7, 0.3] and result['p2'] == [0.5, 0.5]
+    rps = solve_zero_sum(_zero_sum([[0, -1, 1], [1, 0, -1], [-1, 1, 0]]))
+    assert rps['value'] == 0 and np.allclose(rps['p1'], [1 / 3] * 3, atol=1e-3)
+
+
+def test_optimal_strategies_guarantee_value():
+    rng = np.random.default_rng(37)
+    for _ in range(200):
+        a = rng.integers(-5, 6, size=(rng.integers(1, 6), rng.integers(1, 6)))
+        result = solve_zero_sum(_zero_sum(a))
+        x, y = np.array(result['p1']), np.array(result['p2'])
+        assert result['maximin'] <= result['value'] <= result['minimax']
+        assert (x @ a).min() >= result['value'] - 1e-3
+        assert (a @ y).max() <= result['value'] + 1e-3
+
+
+def test_parser_reads_negative_payoffs():
+    text = "Pentru jocul de mai jos, există echilibru Nash pur?\nA1 (2,-2) (-1,1)\nA2 (-3,3) (4,-4)"
+    parsed = QuestionParser().parse(text)
+    assert parsed.extracted_data['raw_data'] == [[[2, -2], [-1, 1]], [[-3, 3], [4, -4]]]
+
+
+if __name__ == "__main__":
+    test_detection()
+    test_saddle_point_game()
+    test_mixed_value_by_lp()
+    test_optimal_strategies_guarantee_value()
+    test_parser_reads_negative_payoffs()
+    print("✓ All zero-sum tests passed")